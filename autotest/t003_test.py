@@ -1,5 +1,7 @@
 import flopy
 import os
+import time
+import numpy as np
 from nose.tools import raises
 
 
@@ -111,6 +113,74 @@ def test_loadoc_nstpfail():
     return
 
 
+def test_load_threaded():
+    # packages that read arrays from the same external unit
+    model_ws = os.path.join('temp', 't003')
+    ml = flopy.modflow.Modflow('threaded', model_ws=model_ws)
+    flopy.modflow.ModflowDis(ml, nlay=2, nrow=5, ncol=6, nper=2)
+    flopy.modflow.ModflowBas(ml)
+    flopy.modflow.ModflowLpf(ml, hk=-1., ipakcb=53)
+    flopy.modflow.ModflowRch(ml, rech=-1.)
+    spd = {0: [[0, 1, 1, -1.], [1, 2, 3, -2.]]}
+    flopy.modflow.ModflowWel(ml, stress_period_data=spd)
+    flopy.modflow.ModflowOc(ml)
+    flopy.modflow.ModflowPcg(ml)
+    ml.add_external('threaded.dat', 50)
+    ml.write_input()
+
+    # the arrays are read from the external file in this order
+    values = [('hk layer 1', 3.), ('hk layer 2', 4.), ('rech_1', 0.5)]
+    with open(os.path.join(model_ws, 'threaded.dat'), 'w') as f:
+        for name, value in values:
+            f.write('{}\n'.format(' '.join(30 * [str(value)])))
+    for ext in ['lpf', 'rch']:
+        fpth = os.path.join(model_ws, 'threaded.' + ext)
+        lines = open(fpth).readlines()
+        with open(fpth, 'w') as f:
+            for line in lines:
+                for name, value in values:
+                    if line.strip().endswith('#' + name):
+                        line = 'EXTERNAL 50 1.0 (FREE) -1\n'
+                f.write(line)
+
+    m1 = flopy.modflow.Modflow.load('threaded.nam', model_ws=model_ws,
+                                    check=False)
+    m2 = flopy.modflow.Modflow.load('threaded.nam', model_ws=model_ws,
+                                    check=False, max_workers=4)
+    assert m2.load_fail is False
+    assert m2.get_package_list() == m1.get_package_list()
+    for attr in ['external_units', 'external_fnames', 'output_units',
+                 'output_fnames', 'package_units']:
+        assert getattr(m2, attr) == getattr(m1, attr), attr
+    assert np.allclose(m2.lpf.hk.array[0], 3.)
+    assert np.allclose(m2.lpf.hk.array[1], 4.)
+    assert np.allclose(m2.rch.rech.array[0], 0.5)
+    assert np.array_equal(m2.lpf.vka.array, m1.lpf.vka.array)
+    assert np.array_equal(m2.wel.stress_period_data[0],
+                          m1.wel.stress_period_data[0])
+
+    return
+
+
+def test_load_threaded_queries():
+    # a package that is loaded concurrently sees the packages before it
+    # in the name file, as in a serial load, even if they take longer
+    ml = flopy.modflow.Modflow('queries')
+    flopy.modflow.ModflowDis(ml)
+
+    def load(delay, ftype):
+        time.sleep(delay)
+        if ftype == 'RCH':
+            flopy.modflow.ModflowRch(ml)
+        return ml.has_package('RCH'), ml.get_package('RCH') is not None, \
+            ml.get_package_list()
+
+    results = ml._load_ordered(load, [(0.5, 'RCH'), (0., 'UZF')],
+                               max_workers=2, names=['RCH', 'UZF'])
+    assert results[1] == (True, True, ['DIS', 'RCH'])
+    return
+
+
 @raises(IOError)
 def test_load_nam_mf_nonexistant_file():
     ml = flopy.modflow.Modflow.load('nonexistant.nam')
@@ -131,3 +201,5 @@ if __name__ == '__main__':
     test_loadoahu()
     test_loadtwrip()
     test_loadtwrip_upw()
+    test_load_threaded()
+    test_load_threaded_queries()
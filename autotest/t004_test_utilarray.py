@@ -73,6 +73,36 @@ def test_load_txt_fixed():
     assert fa.dtype == a.dtype
 
 
+def test_load_txt_cached():
+    a = np.arange(20, dtype=np.float32).reshape((4, 5)) / 4.
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    fname = os.path.join(out_dir, 'load_txt_cached.txt')
+    np.savetxt(fname, a, fmt='%10.4f', delimiter='')
+    fname2 = os.path.join(out_dir, 'load_txt_cached2.txt')
+    shutil.copyfile(fname, fname2)
+    Util2d.clear_load_txt_cache()
+    fa = Util2d.load_txt_cached(a.shape, fname, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa, a)
+    assert fa.dtype == a.dtype
+
+    # a file with the same contents is not parsed again, and the cached
+    # array can not be changed through the returned arrays
+    fa[0, 0] = 100.
+    fa2 = Util2d.load_txt_cached(a.shape, fname2, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa2, a)
+
+    # the cache is keyed by contents, format and shape
+    fa3 = Util2d.load_txt_cached(a.shape, fname, a.dtype, '(5F10.4)')
+    np.testing.assert_equal(fa3, a)
+    fa4 = Util2d.load_txt_cached((20,), fname, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa4, a.ravel())
+    np.savetxt(fname2, a + 1., fmt='%10.4f', delimiter='')
+    fa5 = Util2d.load_txt_cached(a.shape, fname2, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa5, a + 1.)
+    Util2d.clear_load_txt_cache()
+
+
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
     fp = StringIO(dedent(u'''\
@@ -784,6 +814,7 @@ def test_util3d_reset():
 if __name__ == '__main__':
     # test_util3d_reset()
     test_mflist()
+    # test_load_txt_cached()
     # test_new_get_file_entry()
     # test_arrayformat()
     # test_util2d_external_free_nomodelws()
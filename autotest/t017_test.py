@@ -99,6 +99,132 @@ def test_binaryfile_read_context():
     assert str(e.exception) == 'seek of closed file', str(e.exception)
 
 
+def test_binaryfile_get_ts():
+    hds_path = os.path.join('..', 'examples', 'data', 'mfusg_test',
+                            '03B_conduit_unconfined', 'output', 'ex3B.hds')
+    for mmap in (False, True):
+        h = flopy.utils.HeadFile(hds_path, mmap=mmap)
+        alldata = h.get_alldata(nodata=np.nan)
+        cells = [(k, 0, j) for k in range(h.nlay)
+                 for j in range(0, h.ncol, 7)] + [(1, 0, 3), (0, 0, 3)]
+        ts = h.get_ts(cells)
+        assert ts.shape == (len(h.get_times()), len(cells) + 1)
+        assert np.allclose(ts[:, 0], h.get_times())
+        for istat, (k, i, j) in enumerate(cells):
+            assert np.array_equal(ts[:, istat + 1], alldata[:, k, i, j]), \
+                'time series for cell {} is not correct'.format((k, i, j))
+        ts1 = h.get_ts(cells[3])
+        assert np.array_equal(ts1, ts[:, [0, 4]])
+        h.close()
+
+
+def test_binaryfile_read_mmap():
+    hds_path = os.path.join(
+            '..', 'examples', 'data', 'freyberg', 'freyberg.githds')
+    h = flopy.utils.HeadFile(hds_path)
+    hm = flopy.utils.HeadFile(hds_path, mmap=True)
+    assert hm._mmap_records is not None, 'regular layout was not detected'
+
+    assert h.get_times() == hm.get_times()
+    assert h.get_kstpkper() == hm.get_kstpkper()
+    assert np.array_equal(h.recordarray, hm.recordarray)
+    assert np.array_equal(h.iposarray, hm.iposarray)
+    for totim in h.get_times():
+        d0 = h.get_data(totim=totim)
+        d1 = hm.get_data(totim=totim)
+        assert np.array_equal(d0, d1), \
+            'memory mapped head read != head read for totim {}'.format(totim)
+        assert not d1.flags.writeable, 'memory mapped head is not a view'
+    assert np.array_equal(h.get_alldata(), hm.get_alldata())
+    assert np.array_equal(h.get_ts((0, 7, 5)), hm.get_ts((0, 7, 5)))
+    h.close()
+    hm.close()
+    assert hm._mmap_buffer is None
+
+
+def test_binaryfile_cache_index():
+    # copy the files so that the index files are written to the temp folder
+    pth = os.path.join(cpth, 'cache_index')
+    if not os.path.isdir(pth):
+        os.makedirs(pth)
+    hds_path = os.path.join(pth, 'freyberg.githds')
+    shutil.copyfile(os.path.join('..', 'examples', 'data', 'freyberg',
+                                 'freyberg.githds'), hds_path)
+    cbc_path = os.path.join(pth, 'mnw1.gitcbc')
+    shutil.copyfile(os.path.join('..', 'examples', 'data', 'mf2005_test',
+                                 'mnw1.gitcbc'), cbc_path)
+
+    h0 = flopy.utils.HeadFile(hds_path)
+    h1 = flopy.utils.HeadFile(hds_path, cache_index=True)
+    assert os.path.isfile(hds_path + '.idx'), 'head index file not written'
+    h2 = flopy.utils.HeadFile(hds_path, cache_index=True)
+    for h in (h1, h2):
+        assert np.array_equal(h0.recordarray, h.recordarray)
+        assert np.array_equal(h0.iposarray, h.iposarray)
+        assert h0.get_times() == h.get_times()
+        assert h0.get_kstpkper() == h.get_kstpkper()
+        assert np.array_equal(h0.get_data(), h.get_data())
+        h.close()
+    h0.close()
+
+    v0 = flopy.utils.CellBudgetFile(cbc_path)
+    v1 = flopy.utils.CellBudgetFile(cbc_path, cache_index=True)
+    assert os.path.isfile(cbc_path + '.idx'), 'budget index file not written'
+    v2 = flopy.utils.CellBudgetFile(cbc_path, cache_index=True)
+    for v in (v1, v2):
+        assert np.array_equal(v0.recordarray, v.recordarray)
+        assert np.array_equal(v0.iposheader, v.iposheader)
+        assert np.array_equal(v0.iposarray, v.iposarray)
+        assert v0.get_times() == v.get_times()
+        assert v0.get_kstpkper() == v.get_kstpkper()
+        assert v0.get_unique_record_names() == v.get_unique_record_names()
+        assert v0.imethlist == v.imethlist
+        assert v0.recorddict == v.recorddict
+        d0 = v0.get_data(text='DRAINS')[0]
+        d1 = v.get_data(text='DRAINS')[0]
+        assert np.array_equal(d0, d1)
+        v.close()
+    v0.close()
+
+    # an index file for a different file is not used
+    shutil.copyfile(hds_path + '.idx', cbc_path + '.idx')
+    v = flopy.utils.CellBudgetFile(cbc_path, cache_index=True)
+    assert np.array_equal(v0.recordarray, v.recordarray)
+    v.close()
+
+
+def test_read_ensemble():
+    hds_path = os.path.join('..', 'examples', 'data', 'freyberg',
+                            'freyberg.githds')
+    cbc_path = os.path.join('..', 'examples', 'data', 'mf2005_test',
+                            'mnw1.gitcbc')
+    h = flopy.utils.HeadFile(hds_path)
+    d = h.get_data(kstpkper=(0, 0))
+    ts = h.get_ts([(0, 10, 10), (0, 20, 5)])
+    h.close()
+
+    fnames = [hds_path] * 3
+    data = flopy.utils.read_ensemble(fnames, kstpkper=(0, 0), max_workers=2)
+    assert data.shape == (3,) + d.shape
+    for n in range(3):
+        assert np.array_equal(data[n], d)
+    data = flopy.utils.read_ensemble(fnames, idx=[(0, 10, 10), (0, 20, 5)])
+    assert np.array_equal(data[1], ts)
+
+    v = flopy.utils.CellBudgetFile(cbc_path)
+    d = v.get_data(kstpkper=(14, 0), text='DRAINS', full3D=True)[0]
+    v.close()
+    data = flopy.utils.read_ensemble([cbc_path] * 2, filetype='cbc',
+                                     kstpkper=(14, 0), text='DRAINS',
+                                     use_processes=True)
+    assert data.shape == (2,) + d.shape
+    assert np.ma.allequal(data[0], d)
+
+    with assert_raises(ValueError):
+        flopy.utils.read_ensemble([cbc_path], filetype='cbc')
+    return
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
             '..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc')
@@ -136,6 +262,52 @@ def test_cellbudgetfile_read():
     return
 
 
+def test_cellbudgetfile_select_records():
+    v = flopy.utils.CellBudgetFile(
+        os.path.join('..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc'))
+    ra = v.recordarray
+    for kstp, kper in v.get_kstpkper():
+        for text in v.textlist:
+            expected = np.where((ra['kstp'] == kstp + 1) &
+                                (ra['kper'] == kper + 1) &
+                                (ra['text'] == text))[0]
+            found = v._select_records(kstpkper=(kstp + 1, kper + 1),
+                                      text16=text)
+            assert np.array_equal(expected, found)
+    for totim in v.get_times():
+        expected = np.where(ra['totim'] == totim)[0]
+        assert np.array_equal(expected, v._select_records(totim=totim))
+    for paknam in v.paknamlist:
+        expected = np.where(ra['paknam'] == paknam)[0]
+        found = v._select_records(kstpkper=(1, 1), paknam16=paknam)
+        expected = [i for i in expected
+                    if ra['kstp'][i] == 1 and ra['kper'][i] == 1]
+        assert np.array_equal(expected, found)
+    ts = v.get_ts((0, 0, 0), text='DRAINS')
+    assert ts.shape == (len(v.get_kstpkper()), 2)
+    v.close()
+    return
+
+
+def test_cellbudgetfile_get_ts():
+    v = flopy.utils.CellBudgetFile(
+        os.path.join('..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc'))
+    nlay, nrow, ncol = v.nlay, v.nrow, v.ncol
+    kijlist = [(k, i, j) for k in range(nlay) for i in range(nrow)
+               for j in range(0, ncol, 3)]
+    for text in v.get_unique_record_names():
+        ts = v.get_ts(kijlist, text=text)
+        for itim, kk in enumerate(v.get_kstpkper()):
+            d = v.get_data(kstpkper=kk, text=text, full3D=True)
+            if len(d) == 0:
+                continue
+            d = np.ma.filled(d[0], 0.)
+            expected = [d[k, i, j] for k, i, j in kijlist]
+            assert np.allclose(ts[itim, 1:], expected), text
+    v.close()
+    return
+
+
 def test_cellbudgetfile_position():
 
     fpth = os.path.join('..', 'examples', 'data', 'zonbud_examples',
@@ -364,6 +536,12 @@ if __name__ == '__main__':
     test_binaryfile_writeread()
     test_formattedfile_read()
     test_binaryfile_read()
+    test_binaryfile_get_ts()
+    test_binaryfile_read_mmap()
+    test_binaryfile_cache_index()
+    test_read_ensemble()
     test_cellbudgetfile_read()
+    test_cellbudgetfile_select_records()
+    test_cellbudgetfile_get_ts()
     test_cellbudgetfile_readrecord()
     test_cellbudgetfile_readrecord_waux()
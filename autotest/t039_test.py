@@ -232,6 +232,122 @@ def test_get_model_shape():
     return
 
 
+def test_zonbud_accumulate():
+    """
+    t039 Test the zone-to-zone and source/sink accumulation
+    """
+    from flopy.utils.zonbud import sum_flux_tuples
+    fz = np.array([2, 1, 2, 3, 1], dtype=np.int32)
+    tz = np.array([3, 4, 3, 1, 4], dtype=np.int32)
+    f = np.array([1., 2., 3., 4., 5.], dtype=np.float32)
+    fzi, tzi, fi = sum_flux_tuples(fz, tz, f)
+    assert fzi.tolist() == [1, 2, 3]
+    assert tzi.tolist() == [4, 3, 1]
+    assert fi.tolist() == [7., 4., 4.]
+    assert fi.dtype == np.float32
+
+    # list (RIVER LEAKAGE) and layer 1 array (RECHARGE) records summed
+    # by zone
+    fpth = os.path.join('..', 'examples', 'data', 'mp6', 'EXAMPLE.BUD')
+    cbc = CellBudgetFile(fpth, precision='single')
+    zon = np.ones((5, 25, 25), dtype=np.int32)
+    zon[:, :, 12:] = 2
+    zb = ZoneBudget(cbc, zon, kstpkper=(0, 0))
+    bud = zb.get_budget()
+    riv = cbc.get_data(text='RIVER LEAKAGE', kstpkper=(0, 0), full3D=True)[0]
+    riv = np.ma.filled(riv, 0.)
+    rch = cbc.get_data(text='RECHARGE', kstpkper=(0, 0))[0]
+    for z, name in [(1, 'ZONE_1'), (2, 'ZONE_2')]:
+        q = riv[zon == z]
+        assert np.allclose(bud[bud['name'] == 'TO_RIVER_LEAKAGE'][name],
+                           -q[q < 0].sum())
+        assert np.allclose(bud[bud['name'] == 'FROM_RIVER_LEAKAGE'][name],
+                           q[q > 0].sum())
+        q = rch[zon[0] == z]
+        assert np.allclose(bud[bud['name'] == 'FROM_RECHARGE'][name],
+                           q[q > 0].sum())
+        # no wells are active in the first stress period
+        assert bud[bud['name'] == 'TO_WELLS'][name] == 0.
+    return
+
+
+def test_zonbud_batch():
+    """
+    t039 Test the budgets computed with one pass over the budget file
+    """
+    fpth = os.path.join('..', 'examples', 'data', 'mp6', 'EXAMPLE.BUD')
+    cbc = CellBudgetFile(fpth, precision='single')
+    zon = np.ones((5, 25, 25), dtype=np.int32)
+    zon[:, :, 12:] = 2
+    zon[2:, 10:15, :] = 3
+    bud = ZoneBudget(cbc, zon).get_budget()
+    for kwargs in [{'batch': True}, {'max_workers': 2}]:
+        bud2 = ZoneBudget(cbc, zon, **kwargs).get_budget()
+        for name in bud.dtype.names:
+            assert np.array_equal(bud2[name], bud[name]), name
+
+    times = cbc.get_times()[::-3]
+    bud = ZoneBudget(cbc, zon, totim=times).get_budget()
+    bud2 = ZoneBudget(cbc, zon, totim=times, max_workers=2).get_budget()
+    for name in bud.dtype.names:
+        assert np.array_equal(bud2[name], bud[name]), name
+
+    # in batch mode the records are not read again by name, including the
+    # constant head records that are also used as full 3D arrays
+    names = []
+    get_data = cbc.get_data
+
+    def get_data_by_name(*args, **kwargs):
+        if kwargs.get('text') is not None:
+            names.append(kwargs['text'])
+        return get_data(*args, **kwargs)
+
+    cbc.get_data = get_data_by_name
+    try:
+        ZoneBudget(cbc, zon, batch=True)
+    finally:
+        del cbc.get_data
+    assert len(names) == 0, names
+    return
+
+
+def test_zonbud_flowja():
+    """
+    t039 Test zonbud for a MODFLOW 6 DISV model with FLOW-JA-FACE records
+    """
+    from flopy.utils import MfGrdFile
+    pth = os.path.join('..', 'examples', 'data', 'mf6', 'test003_gwftri_disv')
+    grb = MfGrdFile(os.path.join(pth, 'tri_model.disv.grb'))
+    ia, ja = grb.get_connectivity()
+    ncells = len(ia) - 1
+    zon = np.ones(ncells, dtype=np.int32)
+    zon[:ncells // 3] = 2
+    zon[ncells // 2:] = 3
+    fpth = os.path.join(pth, 'tri_model.cbc')
+    zb = ZoneBudget(fpth, zon, grb_file=grb)
+    bud = zb.get_budget()
+
+    # flow between zones
+    cbc = CellBudgetFile(fpth, precision='double')
+    flowja = cbc.get_data(text='FLOW-JA-FACE')[0].ravel()
+    n = np.repeat(np.arange(ncells), np.diff(ia))
+    for zf in [1, 2, 3]:
+        for zt in [1, 2, 3]:
+            if zf == zt:
+                continue
+            idx = (zon[n] == zt) & (zon[ja] == zf) & (flowja > 0)
+            f = bud[bud['name'] == 'FROM_ZONE_{}'.format(zf)]
+            assert np.allclose(f['ZONE_{}'.format(zt)], flowja[idx].sum())
+            f = bud[bud['name'] == 'TO_ZONE_{}'.format(zt)]
+            assert np.allclose(f['ZONE_{}'.format(zf)], flowja[idx].sum())
+
+    # both CHD packages are included in the budget
+    for name in ['ZONE_1', 'ZONE_2', 'ZONE_3']:
+        pd = bud[bud['name'] == 'PERCENT_DISCREPANCY'][name]
+        assert np.abs(pd) < 0.01, name
+    return
+
+
 if __name__ == '__main__':
     # test_compare2mflist_mlt()
     test_compare2zonebudget()
@@ -244,3 +360,6 @@ if __name__ == '__main__':
     test_dataframes()
     test_get_budget()
     test_get_model_shape()
+    test_zonbud_accumulate()
+    test_zonbud_batch()
+    test_zonbud_flowja()
@@ -37,6 +37,16 @@ def test_headu_file():
         t1 = np.array([d.min(), d.max()])
         assert np.allclose(t1, minmaxtrue[i])
 
+    # memory mapped access returns the same heads
+    headobj_mmap = flopy.utils.HeadUFile(fname, mmap=True)
+    assert np.array_equal(headobj.recordarray, headobj_mmap.recordarray)
+    for totim in headobj.get_times():
+        data = headobj.get_data(totim=totim)
+        data_mmap = headobj_mmap.get_data(totim=totim)
+        for d0, d1 in zip(data, data_mmap):
+            assert np.array_equal(d0, d1)
+    headobj_mmap.close()
+
     return
 
 
@@ -142,5 +142,49 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_intersection_arrays():
+    ml_dis = dis_model()
+    ml_disv = disv_model()
+
+    # random points in real-world coordinates, some outside of the grid
+    np.random.seed(0)
+    x = np.random.uniform(0., 15000., 500)
+    y = np.random.uniform(0., 15000., 500)
+    row, col = ml_dis.modelgrid.intersect(x, y, forgive=True)
+    cell2d_disv = ml_disv.modelgrid.intersect(x, y, forgive=True)
+    outside = np.isnan(row)
+    assert np.any(outside) and not np.all(outside)
+    assert np.array_equal(outside, np.isnan(cell2d_disv))
+    cell2d_dis = row * ml_dis.modelgrid.ncol + col
+    assert np.array_equal(cell2d_dis[~outside], cell2d_disv[~outside])
+
+    # the arrays are located in the same cells as each single point
+    for i in range(0, 500, 25):
+        r, c = ml_dis.modelgrid.intersect(x[i], y[i], forgive=True)
+        icell2d = ml_disv.modelgrid.intersect(x[i], y[i], forgive=True)
+        if outside[i]:
+            assert np.isnan(r) and np.isnan(c) and np.isnan(icell2d)
+        else:
+            assert (r, c) == (row[i], col[i])
+            assert icell2d == cell2d_disv[i]
+
+    # points on cell edges in local coordinates return the lowest cell
+    x = np.array([750., 1000., 1000.])
+    y = np.array([5000., 5000., 5250.])
+    row, col = ml_dis.modelgrid.intersect(x, y, local=True)
+    cell2d_disv = ml_disv.modelgrid.intersect(x, y, local=True)
+    assert np.array_equal(row, [10, 10, 10])
+    assert np.array_equal(col, [1, 1, 1])
+    assert np.array_equal(cell2d_disv, row * ncol + col)
+
+    # points outside of the grid raise an exception unless forgive is True
+    try:
+        ml_disv.modelgrid.intersect(x - 5000., y, local=True)
+        raise AssertionError('points outside of the grid did not raise')
+    except Exception as e:
+        assert 'outside of the model area' in e.args[0]
+
+
 if __name__ == '__main__':
-    test_intersection()
\ No newline at end of file
+    test_intersection()
+    test_intersection_arrays()
\ No newline at end of file
@@ -2,11 +2,74 @@
 Tests to prevent performance regressions
 """
 import os
+import sys
 import shutil
+import subprocess
 import time
 import numpy as np
 import flopy.modflow as fm
 
+# script that imports flopy in a new interpreter and reports the import
+# time and the subpackages and dependencies that were imported
+import_script = """
+import sys, time
+t0 = time.time()
+{}
+t1 = time.time() - t0
+modules = ['flopy.modflow', 'flopy.mf6', 'flopy.plot', 'flopy.export',
+           'matplotlib', 'asyncio']
+print(t1)
+print(' '.join(m for m in modules if m in sys.modules))
+"""
+
+
+def _time_import(statement, nrep=3):
+    """Return the minimum time of nrep imports in a new interpreter and
+    the modules that were imported."""
+    cmd = [sys.executable, '-c', import_script.format(statement)]
+    times = []
+    for i in range(nrep):
+        out = subprocess.check_output(cmd, cwd=os.path.dirname(
+            os.path.dirname(os.path.abspath(fm.__file__))))
+        lines = out.decode().splitlines()
+        times.append(float(lines[-2]))
+        modules = lines[-1].split()
+    return min(times), modules
+
+
+def _check_import_modules(statement, modules):
+    """check the subpackages and dependencies imported by statement"""
+    if sys.version_info[0:2] < (3, 7):
+        # without module level __getattr__ all of the subpackages are
+        # imported with flopy
+        eager = ['flopy.modflow', 'flopy.mf6', 'flopy.plot', 'flopy.export']
+        missing = [m for m in eager if m not in modules]
+        assert len(missing) == 0, \
+            "{} did not import {}".format(statement, missing)
+    else:
+        assert len(modules) == 0, \
+            "{} imported {}".format(statement, modules)
+
+
+def test_import_time():
+    """test that importing flopy does not import all of the subpackages"""
+    # the import time depends on the machine, so it is only reported
+    statement = 'import flopy'
+    t, modules = _time_import(statement)
+    _check_import_modules(statement, modules)
+    print('importing flopy took {:.3f}s'.format(t))
+
+    # reading output files only requires flopy.utils
+    statement = 'import flopy; flopy.utils.HeadFile'
+    t, modules = _time_import(statement)
+    _check_import_modules(statement, modules)
+    print('importing flopy.utils.HeadFile took {:.3f}s'.format(t))
+
+    # the names of flopy.utils can still be imported with *
+    statement = 'from flopy.utils import *; HeadFile'
+    t, modules = _time_import(statement)
+    _check_import_modules(statement, modules)
+
 
 class TestModflowPerformance():
     """Test flopy.modflow performance with realistic model/package sizes,
@@ -940,6 +940,38 @@ def test_tri_grid_polygon_with_hole():
     return result
 
 
+# %% test intersecting many shapes at once
+
+
+def test_rect_grid_intersect_shapes():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_rect_grid()
+    shapes = [Point(5., 5.), Point(10., 10.), Point(25., 25.),
+              LineString([(5., 5.), (15., 5.)]),
+              Polygon([(5., 5.), (15., 5.), (15., 15.), (5., 15.)])]
+    for method in ["strtree", "structured"]:
+        ix = GridIntersect(gr, method=method)
+        result = ix.intersect_shapes(shapes)
+        assert len(result) == 8
+        assert np.all(np.sort(result.shapeids) == [0, 1, 3, 3, 4, 4, 4, 4])
+        assert result.cellids[result.shapeids == 0][0] == (1, 0)
+        assert result.cellids[result.shapeids == 1][0] == (0, 0)
+        ls = result[result.shapeids == 3]
+        assert {tuple(c) for c in ls.cellids} == {(1, 0), (1, 1)}
+        assert np.allclose(ls.lengths, 5.)
+        poly = result[result.shapeids == 4]
+        assert len({tuple(c) for c in poly.cellids}) == 4
+        assert np.allclose(poly.areas, 25.)
+    # the cell shapes and the STR-tree are cached on the grid
+    ix2 = GridIntersect(gr)
+    assert ix2.strtree is GridIntersect(gr).strtree
+    return result
+
+
 # %% test rotated offset grids
 
 
@@ -0,0 +1,66 @@
+"""
+Test running models concurrently with asyncio
+"""
+import os
+import sys
+import time
+import flopy
+
+tpth = os.path.join('temp', 't070')
+if not os.path.isdir(tpth):
+    os.makedirs(tpth)
+
+
+def _write_script(name, msg, delay=0.):
+    if not os.path.isdir(tpth):
+        os.makedirs(tpth)
+    fpth = os.path.join(tpth, name)
+    f = open(fpth, 'w')
+    f.write('import time\n')
+    f.write('print("starting")\n')
+    f.write('time.sleep({})\n'.format(delay))
+    f.write('print("{}")\n'.format(msg))
+    f.close()
+    return name
+
+
+def test_run_model_async():
+    import asyncio
+    script = _write_script('normal.py', 'Normal termination')
+    loop = asyncio.new_event_loop()
+    # the child watcher of python < 3.8 requires the current event loop
+    asyncio.set_event_loop(loop)
+    try:
+        result = loop.run_until_complete(
+            flopy.mbase.run_model_async(sys.executable, None, tpth,
+                                        cargs=script))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    success, buff, elapsed = result
+    assert success
+    assert buff == ['starting', 'Normal termination']
+    assert elapsed > 0.
+    return
+
+
+def test_run_models():
+    ok = _write_script('ok.py', 'normal termination', delay=0.5)
+    bad = _write_script('bad.py', 'error termination')
+    runs = [(sys.executable, ok, tpth), (sys.executable, bad, tpth)] * 2
+    t0 = time.time()
+    results = flopy.mbase.run_models(runs, max_workers=4)
+    elapsed = time.time() - t0
+    assert [r.success for r in results] == [True, False, True, False]
+    assert results[1].buff[-1] == 'error termination'
+    # the two slow runs are run at the same time
+    assert elapsed < 0.5 * 2 + results[0].elapsed, elapsed
+
+    results = flopy.mbase.run_models(runs[:1], max_workers=1)
+    assert results[0].success
+    return
+
+
+if __name__ == '__main__':
+    test_run_model_async()
+    test_run_models()
@@ -0,0 +1,117 @@
+"""
+Test running a parameter sweep
+"""
+import os
+import sys
+import numpy as np
+import flopy
+
+tpth = os.path.join('temp', 't071')
+if not os.path.isdir(tpth):
+    os.makedirs(tpth)
+
+exe_name = 'mf2005'
+v = flopy.which(exe_name)
+
+run = True
+if v is None:
+    run = False
+
+
+def test_parameter_sweep():
+    model_ws = os.path.join(tpth, 'model')
+    m = flopy.modflow.Modflow('sweep', model_ws=model_ws, exe_name=exe_name)
+    flopy.modflow.ModflowDis(m, nlay=1, nrow=10, ncol=10, nper=1)
+    ibound = np.ones((1, 10, 10), dtype=int)
+    ibound[0, :, 0] = -1
+    flopy.modflow.ModflowBas(m, ibound=ibound, strt=1.)
+    flopy.modflow.ModflowLpf(m, hk=1.)
+    flopy.modflow.ModflowRch(m, rech=0.001)
+    flopy.modflow.ModflowOc(m)
+    flopy.modflow.ModflowPcg(m)
+    if not run:
+        # use the python interpreter so that the members can be started
+        m.exe_name = sys.executable
+
+    def apply_parameters(model, hk):
+        model.lpf.hk = hk
+        return [model.lpf]
+
+    def get_output(member_ws):
+        fpth = os.path.join(member_ws, 'sweep.hds')
+        if not os.path.isfile(fpth):
+            return None
+        with flopy.utils.HeadFile(fpth) as hds:
+            return hds.get_data()
+
+    sweep_ws = os.path.join(tpth, 'sweep')
+    hks = [1., 10., 100.]
+    results = flopy.utils.run_parameter_sweep(m, hks, apply_parameters,
+                                              sweep_ws, max_workers=2,
+                                              get_output=get_output)
+    # the sweep is written from copies of the model
+    assert m.model_ws == model_ws
+    assert np.allclose(m.lpf.hk.array, 1.)
+    assert len(results) == len(hks)
+
+    base_dis = open(os.path.join(sweep_ws, 'base', 'sweep.dis')).read()
+    for hk, result in zip(hks, results):
+        assert os.path.isdir(result.model_ws)
+        dis = open(os.path.join(result.model_ws, 'sweep.dis')).read()
+        assert dis == base_dis
+        lpf = flopy.modflow.ModflowLpf.load(
+            os.path.join(result.model_ws, 'sweep.lpf'), m)
+        assert np.allclose(lpf.hk.array, hk)
+        if run:
+            assert result.success
+            assert result.output is not None
+    if run:
+        assert results[0].output.max() > results[-1].output.max()
+    return
+
+
+def test_parameter_sweep_mf6():
+    sim_ws = os.path.join(tpth, 'mf6')
+    sim = flopy.mf6.MFSimulation(sim_name='sweep', sim_ws=sim_ws,
+                                 exe_name=sys.executable)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname='sweep')
+    flopy.mf6.ModflowGwfdis(gwf, nlay=1, nrow=10, ncol=10)
+    flopy.mf6.ModflowGwfnpf(gwf, k=1.)
+    flopy.mf6.ModflowGwfic(gwf, strt=1.)
+    flopy.mf6.ModflowGwfchd(gwf, stress_period_data=[[(0, 0, 0), 1.]])
+
+    def apply_parameters(sim, k):
+        model = sim.get_model('sweep')
+        model.npf.k = k
+        return [model.npf]
+
+    sweep_ws = os.path.join(tpth, 'sweep_mf6')
+    ks = [1., 10., 100.]
+    results = flopy.utils.run_parameter_sweep(sim, ks, apply_parameters,
+                                              sweep_ws, max_workers=2)
+    # the sweep is written from copies of the simulation
+    assert sim.simulation_data.mfpath.get_sim_path() == \
+        os.path.abspath(sim_ws)
+    assert np.allclose(gwf.npf.k.array, 1.)
+    assert len(results) == len(ks)
+
+    base_ws = os.path.join(sweep_ws, 'base')
+    base_dis = open(os.path.join(base_ws, 'sweep.dis')).read()
+    for k, result in zip(ks, results):
+        assert os.path.isdir(result.model_ws)
+        assert sorted(os.listdir(result.model_ws)) == \
+            sorted(os.listdir(base_ws))
+        dis = open(os.path.join(result.model_ws, 'sweep.dis')).read()
+        assert dis == base_dis
+        member = flopy.mf6.MFSimulation.load(sim_ws=result.model_ws,
+                                             verbosity_level=0)
+        npf = member.get_model('sweep').npf
+        assert np.allclose(npf.k.array, k)
+    return
+
+
+if __name__ == '__main__':
+    test_parameter_sweep()
+    test_parameter_sweep_mf6()
@@ -1,5 +1,6 @@
 # Test instantiation of mf6 classes
 import os
+import sys
 import shutil
 import flopy
 
@@ -115,5 +116,63 @@ def test_mf6():
 
     return
 
+
+def _structure_signature(structure):
+    items = []
+    gwf = structure.sim_struct.model_struct_objs['gwf6']
+    for package_name, package in sorted(gwf.package_struct_objs.items()):
+        for block_name, block in package.blocks.items():
+            for name, data in block.data_structures.items():
+                items.append((package_name, block_name, name, data.type,
+                              [item.name for item in
+                               data.data_item_structures]))
+    return items, sorted(structure.dimension_dict.keys())
+
+
+def test_structure_cache():
+    from flopy.mf6.data.mfstructure import MFStructure, \
+        get_structure_cache_dir
+
+    cache_dir = os.path.join('temp', 't501_cache')
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+    old_cache_dir = os.environ.get('FLOPY_CACHE_DIR')
+    old_instance = MFStructure._instance
+    os.environ['FLOPY_CACHE_DIR'] = cache_dir
+    try:
+        assert get_structure_cache_dir() == cache_dir
+
+        # the structure is cached when it is built
+        MFStructure._instance = None
+        signature = _structure_signature(MFStructure())
+        cache_files = os.listdir(cache_dir)
+        assert len(cache_files) == 1
+        assert cache_files[0].startswith('mf6structure_{}_py{}{}_'.format(
+            flopy.__version__, sys.version_info[0], sys.version_info[1]))
+
+        # and loaded from the cache by the next instance
+        MFStructure._instance = None
+        assert _structure_signature(MFStructure()) == signature
+
+        # a damaged cache is ignored
+        f = open(os.path.join(cache_dir, cache_files[0]), 'wb')
+        f.write(b'not a structure')
+        f.close()
+        MFStructure._instance = None
+        assert _structure_signature(MFStructure()) == signature
+
+        # caching is disabled with an empty FLOPY_CACHE_DIR
+        os.environ['FLOPY_CACHE_DIR'] = ''
+        assert get_structure_cache_dir() is None
+    finally:
+        MFStructure._instance = old_instance
+        if old_cache_dir is None:
+            del os.environ['FLOPY_CACHE_DIR']
+        else:
+            os.environ['FLOPY_CACHE_DIR'] = old_cache_dir
+    return
+
+
 if __name__ == '__main__':
     test_mf6()
+    test_structure_cache()
@@ -1,4 +1,4 @@
-import os, copy
+import os, copy, shutil, filecmp
 
 import numpy as np
 
@@ -930,6 +930,173 @@ def test027_timeseriestest():
         assert pymake.compare_heads(None, None, files1=head_file, files2=head_new)
 
 
+def test_lazy_load():
+    # init paths
+    test_ex_name = 'test005_advgw_tidal'
+    model_name = 'gwf_1'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'lazy_load')
+    if os.path.isdir(run_folder):
+        shutil.rmtree(run_folder)
+    os.makedirs(run_folder)
+
+    # load simulation and defer loading of the model packages
+    sim = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                            verbosity_level=0, lazy_load=True)
+    model = sim.get_model(model_name)
+    assert not model.get_package('dis').lazy_load_pending
+    wel = model.get_package('wel')
+    npf = model.get_package('npf')
+    assert wel.lazy_load_pending
+    assert npf.lazy_load_pending
+    assert type(npf) is flopy.mf6.ModflowGwfnpf
+
+    # pending packages can be copied and are loaded by the copy
+    sim_copy = copy.deepcopy(sim)
+    npf_copy = sim_copy.get_model(model_name).get_package('npf')
+    assert npf_copy.lazy_load_pending
+    assert len(npf_copy.blocks['griddata'].datasets) > 0
+    assert not npf_copy.lazy_load_pending
+    assert npf.lazy_load_pending
+
+    # accessing data loads the package
+    sim_eager = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                                  verbosity_level=0)
+    wel_eager = sim_eager.get_model(model_name).get_package('wel')
+    spd = wel.stress_period_data.get_data()
+    assert not wel.lazy_load_pending
+    spd_eager = wel_eager.stress_period_data.get_data()
+    assert sorted(spd.keys()) == sorted(spd_eager.keys())
+    for key in spd:
+        assert len(spd[key]) == len(spd_eager[key])
+
+    # packages that were not loaded are copied unchanged
+    sim.simulation_data.mfpath.set_sim_path(run_folder)
+    sim.write_simulation()
+    assert npf.lazy_load_pending
+    for fname in (npf.filename, 'AdvGW_tidal_1.rch', 'recharge_rates_1.ts'):
+        assert filecmp.cmp(os.path.join(pth, fname),
+                           os.path.join(run_folder, fname), shallow=False)
+
+    # data is loaded from the path the package was registered from
+    icelltype = npf.icelltype.get_data()
+    assert not npf.lazy_load_pending
+    npf_eager = sim_eager.get_model(model_name).get_package('npf')
+    assert np.array_equal(icelltype, npf_eager.icelltype.get_data())
+
+    # the written simulation can be loaded
+    sim2 = MFSimulation.load(model_name, 'mf6', exe_name, run_folder,
+                             verbosity_level=0)
+    package_types = [p.package_type for p in
+                     sim2.get_model(model_name).packagelist]
+    package_types_eager = [p.package_type for p in
+                           sim_eager.get_model(model_name).packagelist]
+    assert package_types == package_types_eager
+    return
+
+
+def test_incremental_write():
+    # init paths
+    test_ex_name = 'test005_advgw_tidal'
+    model_name = 'gwf_1'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'incremental_write')
+    if os.path.isdir(run_folder):
+        shutil.rmtree(run_folder)
+    os.makedirs(run_folder)
+
+    sim = MFSimulation.load(model_name, 'mf6', exe_name, pth,
+                            verbosity_level=0)
+    model = sim.get_model(model_name)
+    npf = model.get_package('npf')
+    wel = model.get_package('wel')
+    assert not npf.modified
+
+    # the first write to a new path writes all packages
+    sim.simulation_data.mfpath.set_sim_path(run_folder)
+    sim.write_simulation(incremental=True)
+    assert not npf.modified
+
+    def written_files():
+        return sorted(fname for fname in os.listdir(run_folder)
+                      if os.path.getmtime(os.path.join(run_folder,
+                                                       fname)) > 0)
+
+    # unchanged packages are not rewritten
+    for fname in os.listdir(run_folder):
+        os.utime(os.path.join(run_folder, fname), (0, 0))
+    sim.write_simulation(incremental=True)
+    assert written_files() == []
+
+    # only the changed packages are rewritten
+    npf.k.set_data(10.0, layer=0)
+    wel.stress_period_data.append_list_as_record(((0, 0, 0), -1.0, 0.0,
+                                                  0.0, 0.0, None), 0)
+    assert npf.modified and wel.modified
+    sim.write_simulation(incremental=True)
+    assert written_files() == sorted([npf.filename, wel.filename])
+    assert not npf.modified and not wel.modified
+
+    # a full write rewrites all packages
+    for fname in os.listdir(run_folder):
+        os.utime(os.path.join(run_folder, fname), (0, 0))
+    sim.write_simulation()
+    assert npf.filename in written_files()
+    assert 'mfsim.nam' in written_files()
+
+    sim2 = MFSimulation.load(model_name, 'mf6', exe_name, run_folder,
+                             verbosity_level=0)
+    npf2 = sim2.get_model(model_name).get_package('npf')
+    assert np.allclose(npf2.k.array[0], 10.0)
+    return
+
+
+def test_threaded_load():
+    # init paths
+    test_ex_name = 'test006_2models_mvr'
+    sim_name = 'test006_2models_mvr'
+
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'threaded_load')
+    if os.path.isdir(run_folder):
+        shutil.rmtree(run_folder)
+    os.makedirs(run_folder)
+
+    sim = MFSimulation.load(sim_name, 'mf6', exe_name, pth,
+                            verbosity_level=0)
+    sim_threaded = MFSimulation.load(sim_name, 'mf6', exe_name, pth,
+                                     verbosity_level=0, max_workers=4)
+    assert sorted(sim_threaded.model_names) == sorted(sim.model_names)
+    for model_name in sim.model_names:
+        model = sim.get_model(model_name)
+        model_threaded = sim_threaded.get_model(model_name)
+        package_names = [package.package_name for package in
+                         model.packagelist]
+        assert [package.package_name for package in
+                model_threaded.packagelist] == package_names
+        for package in model_threaded.packagelist:
+            assert not package.lazy_load_pending
+        assert np.array_equal(model_threaded.npf.k.array, model.npf.k.array)
+
+    # both simulations write the same files
+    serial_folder = os.path.join(run_folder, 'serial')
+    threaded_folder = os.path.join(run_folder, 'threaded')
+    sim.simulation_data.mfpath.set_sim_path(serial_folder)
+    sim.write_simulation()
+    sim_threaded.simulation_data.mfpath.set_sim_path(threaded_folder)
+    sim_threaded.write_simulation()
+    assert sorted(os.listdir(threaded_folder)) == \
+        sorted(os.listdir(serial_folder))
+    for fname in os.listdir(serial_folder):
+        with open(os.path.join(serial_folder, fname)) as f:
+            serial_text = f.read()
+        with open(os.path.join(threaded_folder, fname)) as f:
+            assert f.read() == serial_text, fname
+    return
+
+
 if __name__ == '__main__':
     test001a_tharmonic()
     test001e_uzf_3lay()
@@ -941,3 +1108,6 @@ if __name__ == '__main__':
     test036_twrihfb()
     test045_lake1ss_table()
     test045_lake2tr()
+    test_lazy_load()
+    test_incremental_write()
+    test_threaded_load()
@@ -547,6 +547,263 @@ def test021_twri():
     return
 
 
+def test_load_list_block():
+    # write a list with many lines and load it back
+    test_ex_name = 'test_load_list_block'
+    run_folder = os.path.join(cpth, test_ex_name)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+    sim = MFSimulation(sim_name=test_ex_name, exe_name=exe_name,
+                       sim_ws=run_folder)
+    ModflowTdis(sim, nper=1, perioddata=[(1.0, 1, 1.0)])
+    model = ModflowGwf(sim, modelname='lst')
+    ims_package = ModflowIms(sim)
+    sim.register_ims_package(ims_package, [model.name])
+    ModflowGwfdis(model, nlay=2, nrow=50, ncol=50)
+    ModflowGwfic(model)
+    ModflowGwfnpf(model)
+    stress_period_data = []
+    for layer in range(2):
+        for row in range(50):
+            for col in range(50):
+                stress_period_data.append(((layer, row, col),
+                                           -0.001 * (row + col)))
+    ModflowGwfwel(model, maxbound=len(stress_period_data),
+                  stress_period_data=stress_period_data)
+    sim.write_simulation()
+
+    # add a comment and a value in fortran double precision format
+    fpth = os.path.join(run_folder, 'lst.wel')
+    lines = open(fpth).readlines()
+    for idx, line in enumerate(lines):
+        if line.strip().upper().startswith('BEGIN PERIOD'):
+            break
+    lines[idx + 3] = '# comment line\n'
+    lines[idx + 6] = '  1  1  6  -5.0d-3\n'
+    f = open(fpth, 'w')
+    f.writelines(lines)
+    f.close()
+    del stress_period_data[2]
+
+    sim2 = MFSimulation.load(sim_ws=run_folder)
+    wel_spd = sim2.get_model('lst').get_package('wel').stress_period_data
+    data = wel_spd.get_data()[0]
+    assert len(data) == len(stress_period_data)
+    for rec, expected in zip(data, stress_period_data):
+        assert rec[0] == expected[0]
+        assert np.isclose(rec[1], expected[1])
+    return
+
+
+def test_array_data_string():
+    # numpy arrays are formatted with numpy, compare with the strings of
+    # the same data stored in lists
+    from flopy.mf6.data.mffileaccess import MFFileAccessArray
+    from flopy.mf6.data.mfstructure import DatumType
+
+    sim = MFSimulation(sim_name='test_array_data_string', exe_name=exe_name,
+                       sim_ws=os.path.join(cpth, 'test_array_data_string'))
+    ModflowTdis(sim)
+    model = ModflowGwf(sim, modelname='arr')
+    ModflowGwfdis(model, nlay=2, nrow=3, ncol=25)
+    npf = ModflowGwfnpf(model)
+    k = np.linspace(-2.e6, 2.e6, 150).reshape((2, 3, 25))
+    k[0, 0, :4] = [0., np.nan, 1.e-5, 0.001]
+    icelltype = np.arange(150).reshape((2, 3, 25))
+
+    sim_data = sim.simulation_data
+    for wrap, max_columns in ((True, 20), (True, 7), (False, 20)):
+        sim_data.wrap_multidim_arrays = wrap
+        sim_data.max_columns_of_data = max_columns
+        for arr, array_data, data_type in \
+                ((npf.k, k, DatumType.double_precision),
+                 (npf.icelltype, icelltype, DatumType.integer)):
+            file_access = MFFileAccessArray(arr.structure,
+                                            arr._data_dimensions, sim_data,
+                                            arr._path, arr._current_key)
+            for data in (array_data, array_data[0], array_data[0, 0]):
+                data_string = file_access.get_data_string(data, data_type,
+                                                          '    ')
+                list_string = file_access.get_data_string(data.tolist(),
+                                                          data_type, '    ')
+                assert data_string == list_string
+    return
+
+
+def test_binary_external():
+    # large arrays and stress period lists are written to binary files
+    test_ex_name = 'test_binary_external'
+    run_folder = os.path.join(cpth, test_ex_name)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    sim = MFSimulation(sim_name=test_ex_name, exe_name=exe_name,
+                       sim_ws=run_folder)
+    ModflowTdis(sim, nper=2, perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    ModflowIms(sim)
+    model = ModflowGwf(sim, modelname='bin')
+    ModflowGwfdis(model, nlay=2, nrow=10, ncol=10, top=10.,
+                  botm=[0., -10.])
+    k = np.linspace(1., 20., 200).reshape((2, 10, 10))
+    ModflowGwfnpf(model, k=k)
+    ModflowGwfic(model, strt=5.)
+    recharge = {0: np.linspace(0.001, 0.002, 100).reshape((10, 10)),
+                1: np.linspace(0.002, 0.003, 100).reshape((10, 10))}
+    rcha = ModflowGwfrcha(model, recharge=recharge)
+    wel_spd = {0: [((0, i // 10, i % 10), -float(i)) for i in range(60)],
+               1: [((1, i // 10, i % 10), -2. * i) for i in range(60)]}
+    ModflowGwfwel(model, stress_period_data=wel_spd)
+    chd_spd = {0: [((0, 9, i), 1.) for i in range(10)] * 6}
+    chd = ModflowGwfchd(model, stress_period_data=chd_spd)
+    chd.binary_external = False
+
+    sim.simulation_data.binary_external = True
+    sim.simulation_data.binary_external_min_size = 50
+    sim.write_simulation()
+
+    for fname in ('bin.npf_k_layer1.bin', 'bin.npf_k_layer2.bin',
+                  'bin.rcha_recharge_1.bin', 'bin.rcha_recharge_2.bin',
+                  'bin.wel_stress_period_data_1.bin',
+                  'bin.wel_stress_period_data_2.bin'):
+        assert os.path.isfile(os.path.join(run_folder, fname))
+    # constants, small arrays and the chd package are written internally
+    assert not os.path.isfile(os.path.join(run_folder, 'bin.dis_top.bin'))
+    assert not os.path.isfile(os.path.join(run_folder, 'bin.ic_strt.bin'))
+    assert not os.path.isfile(os.path.join(run_folder, 'bin.dis_delr.bin'))
+    assert not os.path.isfile(os.path.join(run_folder,
+                                           'bin.chd_stress_period_data_1.bin'))
+    with open(os.path.join(run_folder, 'bin.npf')) as fd:
+        npf_text = fd.read().lower()
+    assert 'open/close' in npf_text and '(binary)' in npf_text
+
+    sim2 = MFSimulation.load(sim_ws=run_folder)
+    model2 = sim2.get_model('bin')
+    assert np.allclose(model2.npf.k.array, k)
+    assert np.allclose(model2.ic.strt.array, 5.)
+    assert np.allclose(model2.dis.botm.array[1], -10.)
+    for kper in range(2):
+        assert np.allclose(model2.rcha.recharge.get_data(kper),
+                           recharge[kper])
+        wel_data = model2.wel.stress_period_data.get_data(kper)
+        assert len(wel_data) == 60
+        assert [tuple(c) for c in wel_data['cellid']] == \
+            [c for c, q in wel_spd[kper]]
+        assert np.allclose(wel_data['q'], [q for c, q in wel_spd[kper]])
+    assert len(model2.chd.stress_period_data.get_data(0)) == 60
+
+    # rewriting the loaded simulation keeps the binary files
+    sim2.write_simulation()
+    assert os.path.isfile(os.path.join(run_folder, 'bin.npf_k_layer1.bin'))
+    return
+
+
+def test_data_views():
+    # read-only data is reused until the data changes
+    sim = MFSimulation(sim_name='test_data_views', exe_name=exe_name,
+                       sim_ws=os.path.join(cpth, 'test_data_views'))
+    ModflowTdis(sim, nper=2, perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    model = ModflowGwf(sim, modelname='views')
+    ModflowGwfdis(model, nlay=2, nrow=5, ncol=4, top=10., botm=[0., -10.])
+    k = np.linspace(1., 40., 40).reshape((2, 5, 4))
+    npf = ModflowGwfnpf(model, k=k)
+    rcha = ModflowGwfrcha(model, recharge={0: 0.001, 1: np.full((5, 4),
+                                                                0.002)})
+    wel = ModflowGwfwel(model, stress_period_data={0: [((0, 0, 0), -1.)],
+                                                   1: [((1, 1, 1), -2.)]})
+
+    k_view = npf.k.get_data_view()
+    assert not k_view.flags.writeable
+    assert np.array_equal(k_view, npf.k.array)
+    assert npf.k.get_data_view() is k_view
+    npf.k.set_data(5., layer=1)
+    k_view2 = npf.k.get_data_view()
+    assert k_view2 is not k_view
+    assert np.allclose(k_view2[1], 5.) and np.allclose(k_view2[0], k[0])
+
+    rch_view = rcha.recharge.get_data_view(key=1)
+    assert not rch_view.flags.writeable
+    assert np.allclose(rch_view, 0.002)
+    assert rcha.recharge.get_data_view(key=1) is rch_view
+    assert np.allclose(rcha.recharge.get_data_view(key=0), 0.001)
+
+    wel_view = wel.stress_period_data.get_data_view(1)
+    assert not wel_view.flags.writeable
+    assert wel_view['cellid'][0] == (1, 1, 1)
+    assert wel.stress_period_data.get_data_view(1) is wel_view
+    wel.stress_period_data.append_list_as_record([(1, 2, 2), -3.], 1)
+    assert len(wel.stress_period_data.get_data_view(1)) == 2
+    assert wel.stress_period_data.get_data_view(5) is None
+
+    modelgrid = model.modelgrid
+    modelgrid.cache_views = True
+    xc = modelgrid.xcellcenters
+    assert not xc.flags.writeable
+    assert np.shares_memory(xc, modelgrid.xcellcenters)
+    modelgrid.cache_views = False
+    assert modelgrid.xcellcenters.flags.writeable
+    assert not np.shares_memory(xc, modelgrid.xcellcenters)
+    return
+
+
+def test_read_text_array():
+    # external text arrays with comments, commas and uneven lines
+    sim_ws = os.path.join(cpth, 'test_read_text_array')
+    if not os.path.isdir(sim_ws):
+        os.makedirs(sim_ws)
+    sim = MFSimulation(sim_name='test_read_text_array', exe_name=exe_name,
+                       sim_ws=sim_ws)
+    ModflowTdis(sim)
+    model = ModflowGwf(sim, modelname='text')
+    ims_package = ModflowIms(sim)
+    sim.register_ims_package(ims_package, [model.name])
+    ModflowGwfdis(model, nlay=2, nrow=40, ncol=30, top=10., botm=[0., -10.])
+    k = np.arange(1, 2401, dtype=float).reshape((2, 40, 30)) / 7.
+    with open(os.path.join(sim_ws, 'k.txt'), 'w') as f:
+        f.write('# hydraulic conductivity\n')
+        values = k.ravel()
+        for i in range(0, values.size, 13):
+            line = ','.join([repr(v) for v in values[i:i + 13]])
+            f.write('{}  # row {}\n'.format(line, i))
+    icelltype = np.ones((2, 40, 30), dtype=int)
+    icelltype[1] = 0
+    with open(os.path.join(sim_ws, 'icelltype.txt'), 'w') as f:
+        for v in icelltype.ravel():
+            f.write(' {}'.format(v))
+    npf = ModflowGwfnpf(model, k={'filename': 'k.txt', 'factor': 2.},
+                        icelltype={'filename': 'icelltype.txt'})
+    assert np.allclose(npf.k.array, 2. * k)
+    assert np.array_equal(npf.icelltype.array, icelltype)
+
+    # read into a temporary memory mapped file
+    sim.simulation_data.memmap_min_size = 1000
+    k_array = npf.k.array
+    assert isinstance(k_array, np.memmap)
+    assert np.allclose(k_array, 2. * k)
+    assert np.array_equal(npf.icelltype.array, icelltype)
+
+    # a short file raises an error
+    with open(os.path.join(sim_ws, 'k.txt'), 'w') as f:
+        f.write('1.0 2.0 3.0\n')
+    try:
+        npf.k.array
+        raise AssertionError('short external file was not detected')
+    except MFDataException:
+        pass
+
+    # internal arrays loaded from a package file are stored as memory
+    # mapped arrays
+    npf.k.set_data(k)
+    sim.write_simulation()
+    sim2 = MFSimulation.load(sim_name='test_read_text_array',
+                             exe_name=exe_name, sim_ws=sim_ws, lazy_load=True)
+    sim2.simulation_data.memmap_min_size = 1000
+    npf2 = sim2.get_model('text').get_package('npf')
+    k_storage = npf2.k._get_storage_obj()
+    assert isinstance(k_storage.layer_storage[0].internal_data, np.memmap)
+    assert np.allclose(npf2.k.array, k)
+    return
+
+
 def test005_advgw_tidal():
     # init paths
     test_ex_name = 'test005_advgw_tidal'
@@ -1718,6 +1975,11 @@ if __name__ == '__main__':
     test006_2models_gnc()
     test006_gwf3_disv()
     test021_twri()
+    test_load_list_block()
+    test_array_data_string()
+    test_binary_external()
+    test_data_views()
+    test_read_text_array()
     test028_sfr()
     test035_fhb()
     test050_circle_island()
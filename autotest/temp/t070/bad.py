@@ -0,0 +1,4 @@
+import time
+print("starting")
+time.sleep(0.0)
+print("error termination")
@@ -0,0 +1,4 @@
+import time
+print("starting")
+time.sleep(0.5)
+print("normal termination")
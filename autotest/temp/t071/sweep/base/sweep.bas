@@ -0,0 +1,15 @@
+# BAS6 package for  MODFLOW-2005, generated by Flopy.
+FREE
+INTERNAL               1    (10I10) -1 #ibound layer 1                
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+        -1         1         1         1         1         1         1         1         1         1
+   -999.99
+CONSTANT    1.000000E+00                           #strt layer 1                  
@@ -0,0 +1,13 @@
+BEGIN ATTRIBUTES
+  NAMES  rch_1
+  METHODS  stepwise
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+  0.0  0.0015
+  1.0  0.001
+  11.0  0.0015
+  21.0  0.0025
+  31.0  0.0015
+END TIMESERIES
+
@@ -0,0 +1,13 @@
+BEGIN ATTRIBUTES
+  NAMES  rch_2
+  METHODS  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+  0.0  0.0016
+  1.0  0.0018
+  11.0  0.0019
+  21.0  0.0016
+  31.0  0.0018
+END TIMESERIES
+
@@ -0,0 +1,13 @@
+BEGIN ATTRIBUTES
+  NAMES  rch_3
+  METHODS  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+  0.0  0.0017
+  1.0  0.002
+  11.0  0.0017
+  21.0  0.0018
+  31.0  0.002
+END TIMESERIES
+
@@ -0,0 +1,17 @@
+BEGIN ATTRIBUTES
+  NAMES  river_stage_1  river_stage_2
+  METHODS  linear  stepwise
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+  0.0  40.0  41.0
+  1.0  41.0  41.5
+  2.0  43.0  42.0
+  3.0  45.0  42.8
+  4.0  44.0  43.0
+  6.0  43.0  43.1
+  9.0  42.0  42.4
+  11.0  41.0  41.5
+  31.0  40.0  41.0
+END TIMESERIES
+
@@ -0,0 +1,373 @@
+BEGIN ATTRIBUTES
+  NAMES  tides
+  METHOD  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+  0.0  -2.5
+  0.05  -2.1
+  0.206  2.1
+  0.256  2.5
+  0.306  2.0
+  0.462  -2.4
+  0.512  -2.8
+  0.562  -2.4
+  0.718  2.4
+  0.768  2.8
+  0.818  2.4
+  0.974  -2.1
+  1.024  -2.5
+  1.074  -2.1
+  1.23  2.1
+  1.28  2.5
+  1.33  2.0
+  1.486  -2.4
+  1.536  -2.8
+  1.586  -2.4
+  1.742  2.4
+  1.792  2.8
+  1.842  2.4
+  1.998  -2.1
+  2.048  -2.5
+  2.098  -2.1
+  2.254  2.1
+  2.304  2.5
+  2.354  2.0
+  2.51  -2.4
+  2.56  -2.8
+  2.61  -2.4
+  2.766  2.4
+  2.816  2.8
+  2.866  2.4
+  3.022  -2.1
+  3.072  -2.5
+  3.122  -2.1
+  3.278  2.1
+  3.328  2.5
+  3.378  2.0
+  3.534  -2.4
+  3.584  -2.8
+  3.634  -2.4
+  3.79  2.4
+  3.84  2.8
+  3.89  2.4
+  4.046  -2.1
+  4.096  -2.5
+  4.146  -2.1
+  4.302  2.1
+  4.352  2.5
+  4.402  2.0
+  4.558  -2.4
+  4.608  -2.8
+  4.658  -2.4
+  4.814  2.4
+  4.864  2.8
+  4.914  2.4
+  5.07  -2.1
+  5.12  -2.5
+  5.17  -2.1
+  5.326  2.1
+  5.376  2.5
+  5.426  2.0
+  5.582  -2.4
+  5.632  -2.8
+  5.682  -2.4
+  5.838  2.4
+  5.888  2.8
+  5.938  2.4
+  6.094  -2.1
+  6.144  -2.5
+  6.194  -2.1
+  6.35  2.1
+  6.4  2.5
+  6.45  2.0
+  6.606  -2.4
+  6.656  -2.8
+  6.706  -2.4
+  6.862  2.4
+  6.912  2.8
+  6.962  2.4
+  7.118  -2.1
+  7.168  -2.5
+  7.218  -2.1
+  7.374  2.1
+  7.424  2.5
+  7.474  2.0
+  7.63  -2.4
+  7.68  -2.8
+  7.73  -2.4
+  7.886  2.4
+  7.936  2.8
+  7.986  2.4
+  8.142  -2.1
+  8.192  -2.5
+  8.242  -2.1
+  8.398  2.1
+  8.448  2.5
+  8.498  2.0
+  8.654  -2.4
+  8.704  -2.8
+  8.754  -2.4
+  8.91  2.4
+  8.96  2.8
+  9.01  2.4
+  9.166  -2.1
+  9.216  -2.5
+  9.266  -2.1
+  9.422  2.1
+  9.472  2.5
+  9.522  2.0
+  9.678  -2.4
+  9.728  -2.8
+  9.778  -2.4
+  9.934  2.4
+  9.984  2.8
+  10.034  2.4
+  10.19  -2.1
+  10.24  -2.5
+  10.29  -2.1
+  10.446  2.1
+  10.496  2.5
+  10.546  2.0
+  10.702  -2.4
+  10.752  -2.8
+  10.802  -2.4
+  10.958  2.4
+  11.008  2.8
+  11.058  2.4
+  11.214  -2.1
+  11.264  -2.5
+  11.314  -2.1
+  11.47  2.1
+  11.52  2.5
+  11.57  2.0
+  11.726  -2.4
+  11.776  -2.8
+  11.826  -2.4
+  11.982  2.4
+  12.032  2.8
+  12.082  2.4
+  12.238  -2.1
+  12.288  -2.5
+  12.338  -2.1
+  12.494  2.1
+  12.544  2.5
+  12.594  2.0
+  12.75  -2.4
+  12.8  2.8
+  12.85  -2.4
+  13.006  2.4
+  13.056  2.8
+  13.106  2.4
+  13.262  -2.1
+  13.312  -2.5
+  13.362  -2.1
+  13.518  2.1
+  13.568  2.5
+  13.618  2.0
+  13.774  -2.4
+  13.824  -2.8
+  13.874  -2.4
+  14.03  2.4
+  14.08  2.8
+  14.13  2.4
+  14.286  -2.1
+  14.336  -2.5
+  14.386  -2.1
+  14.542  2.1
+  14.592  2.5
+  14.642  2.0
+  14.798  -2.4
+  14.848  -2.8
+  14.898  -2.4
+  15.054  2.4
+  15.104  2.8
+  15.154  2.4
+  15.31  -2.1
+  15.36  -2.5
+  15.41  -2.1
+  15.566  2.1
+  15.616  2.5
+  15.666  2.0
+  15.822  -2.4
+  15.872  -2.8
+  15.922  -2.4
+  16.078  2.4
+  16.128  2.8
+  16.178  2.4
+  16.334  -2.1
+  16.384  -2.5
+  16.434  -2.1
+  16.59  2.1
+  16.64  2.5
+  16.69  2.0
+  16.846  -2.4
+  16.896  -2.8
+  16.946  -2.4
+  17.102  2.4
+  17.152  2.8
+  17.202  2.4
+  17.358  -2.1
+  17.408  -2.5
+  17.458  -2.1
+  17.614  2.1
+  17.664  2.5
+  17.714  2.0
+  17.87  -2.4
+  17.92  -2.8
+  17.97  -2.4
+  18.126  2.4
+  18.176  2.8
+  18.226  2.4
+  18.382  -2.1
+  18.432  -2.5
+  18.482  -2.1
+  18.638  2.1
+  18.688  2.5
+  18.738  2.0
+  18.894  -2.4
+  18.944  -2.8
+  18.994  -2.4
+  19.15  2.4
+  19.2  2.8
+  19.25  2.4
+  19.406  -2.1
+  19.456  -2.5
+  19.506  -2.1
+  19.662  2.1
+  19.712  2.5
+  19.762  2.0
+  19.918  -2.4
+  19.968  -2.8
+  20.018  -2.4
+  20.174  2.4
+  20.224  2.8
+  20.274  2.4
+  20.43  -2.1
+  20.48  -2.5
+  20.53  -2.1
+  20.686  2.1
+  20.736  2.5
+  20.786  2.0
+  20.942  -2.4
+  20.992  -2.8
+  21.042  -2.4
+  21.198  2.4
+  21.248  2.8
+  21.298  2.4
+  21.454  -2.1
+  21.504  -2.5
+  21.554  -2.1
+  21.71  2.1
+  21.76  2.5
+  21.81  2.0
+  21.966  -2.4
+  22.016  -2.8
+  22.066  -2.4
+  22.222  2.4
+  22.272  2.8
+  22.322  2.4
+  22.478  -2.1
+  22.528  -2.5
+  22.578  -2.1
+  22.734  2.1
+  22.784  2.5
+  22.834  2.0
+  22.99  -2.4
+  23.04  -2.8
+  23.09  -2.4
+  23.246  2.4
+  23.296  2.8
+  23.346  2.4
+  23.502  -2.1
+  23.552  -2.5
+  23.602  -2.1
+  23.758  2.1
+  23.808  2.5
+  23.858  2.0
+  24.014  -2.4
+  24.064  -2.8
+  24.114  -2.4
+  24.27  2.4
+  24.32  2.8
+  24.37  2.4
+  24.526  -2.1
+  24.576  -2.5
+  24.626  -2.1
+  24.782  2.1
+  24.832  2.5
+  24.882  2.0
+  25.038  -2.4
+  25.088  -2.8
+  25.138  -2.4
+  25.294  2.4
+  25.344  2.8
+  25.394  2.4
+  25.55  -2.1
+  25.6  2.5
+  25.65  -2.1
+  25.806  2.1
+  25.856  2.5
+  25.906  2.0
+  26.062  -2.4
+  26.112  -2.8
+  26.162  -2.4
+  26.318  2.4
+  26.368  2.8
+  26.418  2.4
+  26.574  -2.1
+  26.624  -2.5
+  26.674  -2.1
+  26.83  2.1
+  26.88  2.5
+  26.93  2.0
+  27.086  -2.4
+  27.136  -2.8
+  27.186  -2.4
+  27.342  2.4
+  27.392  2.8
+  27.442  2.4
+  27.598  -2.1
+  27.648  -2.5
+  27.698  -2.1
+  27.854  2.1
+  27.904  2.5
+  27.954  2.0
+  28.11  -2.4
+  28.16  -2.8
+  28.21  -2.4
+  28.366  2.4
+  28.416  2.8
+  28.466  2.4
+  28.622  -2.1
+  28.672  -2.5
+  28.722  -2.1
+  28.878  2.1
+  28.928  2.5
+  28.978  2.0
+  29.134  -2.4
+  29.184  -2.8
+  29.234  -2.4
+  29.39  2.4
+  29.44  2.8
+  29.49  2.4
+  29.646  -2.1
+  29.696  -2.5
+  29.746  -2.1
+  29.902  2.1
+  29.952  2.5
+  30.002  2.0
+  30.158  -2.4
+  30.208  -2.8
+  30.258  -2.4
+  30.414  2.4
+  30.464  2.8
+  30.514  2.4
+  30.67  -2.1
+  30.72  -2.5
+  30.77  -2.1
+  30.926  2.1
+  30.976  2.5
+  31.026  2.0
+END TIMESERIES
+
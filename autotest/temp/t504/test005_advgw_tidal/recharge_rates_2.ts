@@ -0,0 +1,13 @@
+BEGIN ATTRIBUTES
+  NAMES  rch_2
+  METHODS  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+       0.00000000       0.00160000
+       1.00000000       0.00180000
+      11.00000000       0.00190000
+      21.00000000       0.00160000
+      31.00000000       0.00180000
+END TIMESERIES
+
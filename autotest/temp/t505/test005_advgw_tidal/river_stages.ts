@@ -0,0 +1,17 @@
+BEGIN attributes
+  NAMES  river_stage_1  river_stage_2
+  METHODS  linear  stepwise
+END attributes
+
+BEGIN timeseries
+       0.00000000      40.00000000      41.00000000
+       1.00000000      41.00000000      41.50000000
+       2.00000000      43.00000000      42.00000000
+       3.00000000      45.00000000      42.80000000
+       4.00000000      44.00000000      43.00000000
+       6.00000000      43.00000000      43.10000000
+       9.00000000      42.00000000      42.40000000
+      11.00000000      41.00000000      41.50000000
+      31.00000000      40.00000000      41.00000000
+END timeseries
+
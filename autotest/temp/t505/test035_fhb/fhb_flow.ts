@@ -0,0 +1,12 @@
+BEGIN attributes
+  NAMES  flow
+  METHODS  linear
+END attributes
+
+BEGIN timeseries
+       0.00000000    2000.00000000
+     307.00000000    6000.00000000
+     791.00000000    5000.00000000
+    1000.00000000    9000.00000000
+END timeseries
+
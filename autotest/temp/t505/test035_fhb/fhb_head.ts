@@ -0,0 +1,12 @@
+BEGIN attributes
+  NAMES  head
+  METHODS  linearend
+END attributes
+
+BEGIN timeseries
+       0.00000000       0.00000000
+     307.00000000       1.00000000
+     791.00000000       5.00000000
+    1000.00000000       2.00000000
+END timeseries
+
@@ -27,19 +27,44 @@ __author__ = 'Mark Bakker, Vincent Post, Christian D. Langevin, ' + \
              'Eric D. Morway, Jason C. Bellino, Jeffrey Starn, ' + \
              'and Michael N. Fienen'
 
+import sys
+import importlib
+
 from .version import __version__
 
-# imports
-from . import modflow
-from . import mt3d
-from . import seawat
-from . import modpath
-from . import modflowlgr
-from . import utils
-from . import plot
-from . import export
-from . import pest
-from . import mf6
-from . import discretization
-
-from .mbase import run_model, which
+# subpackages and functions that are imported the first time they are
+# accessed, so that "import flopy" does not import all of the model
+# packages, matplotlib and the MODFLOW 6 package classes
+_subpackages = ('modflow', 'mt3d', 'seawat', 'modpath', 'modflowlgr',
+                'utils', 'plot', 'export', 'pest', 'mf6', 'discretization')
+_attributes = {'run_model': 'mbase', 'run_models': 'mbase',
+               'which': 'mbase'}
+
+__all__ = list(_subpackages) + list(_attributes.keys())
+
+
+def __getattr__(name):
+    if name in _attributes:
+        module = importlib.import_module('.' + _attributes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    # modules of flopy that have not been imported yet
+    try:
+        return importlib.import_module('.' + name, __name__)
+    except ImportError as e:
+        if e.name != '{}.{}'.format(__name__, name):
+            raise
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_subpackages) +
+                  list(_attributes.keys()))
+
+
+# module level __getattr__ requires python 3.7
+if sys.version_info[0:2] < (3, 7):
+    for _name in _subpackages + tuple(_attributes.keys()):
+        __getattr__(_name)
@@ -17,11 +17,172 @@ class CachedData(object):
     def data(self):
         return copy.deepcopy(self._data)
 
+    @property
+    def data_view(self):
+        # read-only views of the cached arrays, without copying the data
+        if isinstance(self._data, list):
+            return [_readonly_view(item) for item in self._data]
+        return _readonly_view(self._data)
+
     def update_data(self, data):
         self._data = data
         self.out_of_date = False
 
 
+def _readonly_view(data):
+    if isinstance(data, np.ndarray):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    return data
+
+
+class _CellIndex(object):
+    """
+    Uniform bucket index of the bounding boxes of a set of polygonal cells,
+    used to locate many points in the cells of a grid at once.
+
+    Parameters
+    ----------
+    xvertices, yvertices : list of lists or numpy.ndarray
+        x and y vertices of each cell, or two-dimensional arrays of the
+        vertices if all cells have the same number of vertices
+
+    """
+    def __init__(self, xvertices, yvertices):
+        ncells = len(xvertices)
+        if isinstance(xvertices, np.ndarray) and xvertices.ndim == 2:
+            # cells with the same number of vertices
+            xv = np.column_stack((xvertices, xvertices[:, :1]))
+            yv = np.column_stack((yvertices, yvertices[:, :1]))
+        else:
+            nverts = np.array([len(v) for v in xvertices], dtype=int)
+            maxnv = nverts.max() if ncells > 0 else 0
+
+            # pad the vertices of each cell with its first vertex, so that
+            # every cell is a closed ring of maxnv + 1 vertices
+            xv = np.empty((ncells, maxnv + 1))
+            yv = np.empty((ncells, maxnv + 1))
+            for icell in range(ncells):
+                nv = nverts[icell]
+                xv[icell, :nv] = xvertices[icell]
+                yv[icell, :nv] = yvertices[icell]
+                xv[icell, nv:] = xvertices[icell][0]
+                yv[icell, nv:] = yvertices[icell][0]
+        self.xv = xv
+        self.yv = yv
+        self.xmin = xv.min(axis=1)
+        self.xmax = xv.max(axis=1)
+        self.ymin = yv.min(axis=1)
+        self.ymax = yv.max(axis=1)
+
+        # size the buckets so that there is about one cell per bucket
+        self.x0, self.x1 = self.xmin.min(), self.xmax.max()
+        self.y0, self.y1 = self.ymin.min(), self.ymax.max()
+        n = max(int(np.sqrt(ncells)), 1)
+        self.nbx = self.nby = n
+        self.dx = max((self.x1 - self.x0) / n, np.finfo(float).tiny)
+        self.dy = max((self.y1 - self.y0) / n, np.finfo(float).tiny)
+
+        # add each cell to every bucket that its bounding box overlaps, and
+        # store the cells of the buckets in compressed rows
+        bx0, by0 = self._bucket(self.xmin, self.ymin)
+        bx1, by1 = self._bucket(self.xmax, self.ymax)
+        nbx = bx1 - bx0 + 1
+        counts = nbx * (by1 - by0 + 1)
+        cells = np.repeat(np.arange(ncells), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) -
+                                                     counts, counts)
+        buckets = (np.repeat(by0, counts) + offset // np.repeat(nbx, counts)) \
+                  * self.nbx + np.repeat(bx0, counts) + \
+                  offset % np.repeat(nbx, counts)
+        order = np.lexsort((cells, buckets))
+        self.cells = cells[order]
+        self.ptr = np.zeros(self.nbx * self.nby + 1, dtype=int)
+        np.cumsum(np.bincount(buckets, minlength=self.nbx * self.nby),
+                  out=self.ptr[1:])
+
+    def _bucket(self, x, y):
+        bx = np.clip(((x - self.x0) // self.dx).astype(int), 0, self.nbx - 1)
+        by = np.clip(((y - self.y0) // self.dy).astype(int), 0, self.nby - 1)
+        return bx, by
+
+    def locate(self, x, y, radius=1e-9, chunksize=1000000):
+        """
+        Get the lowest cell number that contains each point.
+
+        Parameters
+        ----------
+        x, y : numpy.ndarray
+            coordinates of the points
+        radius : float
+            points that are within radius of the edge of a cell are
+            considered to be inside the cell
+        chunksize : int
+            maximum number of point and cell pairs that are tested at once
+
+        Returns
+        -------
+        cells : numpy.ndarray
+            cell number of each point, or -1 if the point is not in a cell
+
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        result = np.full(x.shape, -1, dtype=int)
+        inside = (x >= self.x0 - radius) & (x <= self.x1 + radius) & \
+                 (y >= self.y0 - radius) & (y <= self.y1 + radius)
+        ipts = np.nonzero(inside)[0]
+        if len(ipts) == 0 or len(self.cells) == 0:
+            return result
+
+        # candidate point and cell pairs from the bucket of each point
+        bx, by = self._bucket(x[ipts], y[ipts])
+        bucket = by * self.nbx + bx
+        start = self.ptr[bucket]
+        counts = self.ptr[bucket + 1] - start
+        pts = np.repeat(ipts, counts)
+        cand = self.cells[np.repeat(start - np.cumsum(counts) + counts,
+                                    counts) + np.arange(counts.sum())]
+
+        for i0 in range(0, len(pts), chunksize):
+            p = pts[i0:i0 + chunksize]
+            c = cand[i0:i0 + chunksize]
+            px, py = x[p], y[p]
+            keep = (px >= self.xmin[c] - radius) & \
+                   (px <= self.xmax[c] + radius) & \
+                   (py >= self.ymin[c] - radius) & \
+                   (py <= self.ymax[c] + radius)
+            p, c, px, py = p[keep], c[keep], px[keep], py[keep]
+            hit = self._contains(c, px[:, None], py[:, None], radius)
+            p, c = p[hit], c[hit]
+            # candidates are sorted by cell number for each point, so the
+            # first hit is the lowest cell number
+            p, first = np.unique(p, return_index=True)
+            c = c[first]
+            found = result[p]
+            result[p] = np.where(found < 0, c, np.minimum(found, c))
+        return result
+
+    def _contains(self, cells, x, y, radius):
+        xa, ya = self.xv[cells, :-1], self.yv[cells, :-1]
+        xb, yb = self.xv[cells, 1:], self.yv[cells, 1:]
+        # crossing number of a ray in the positive x direction
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = ((ya > y) != (yb > y)) & \
+                      (x < xa + (y - ya) * (xb - xa) / (yb - ya))
+        inside = np.count_nonzero(crosses, axis=1) % 2 == 1
+        # points within radius of an edge
+        ex, ey = xb - xa, yb - ya
+        length2 = ex * ex + ey * ey
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.clip(((x - xa) * ex + (y - ya) * ey) / length2, 0., 1.)
+        t[length2 == 0.] = 0.
+        dx, dy = xa + t * ex - x, ya + t * ey - y
+        onedge = np.any(dx * dx + dy * dy <= radius * radius, axis=1)
+        return inside | onedge
+
+
 class Grid(object):
     """
     Base class for a structured or unstructured model grid
@@ -76,6 +237,11 @@ class Grid(object):
         system
     rotation : float
         rotation angle of model grid, as it is rotated around the origin point
+    cache_views : bool
+        return read-only views of cached grid data, such as xyzcellcenters
+        and xyzvertices, instead of copies.  Nested lists, like the vertices
+        of a vertex grid, are not copied and must not be modified.
+        (default is False)
     xgrid : ndarray
         returns numpy meshgrid of x edges in reference frame defined by
         point_type
@@ -157,6 +323,7 @@ class Grid(object):
         self._angrot = angrot
         self._cache_dict = {}
         self._copy_cache = True
+        self.cache_views = False
 
     ###################################
     # access to basic grid properties
@@ -369,6 +536,41 @@ class Grid(object):
         else:
             return x, y
 
+    def _get_cell_index(self):
+        """
+        Get the cached spatial index of the cell outlines of the grid in
+        real-world coordinates.
+        """
+        cache_index = 'cell_index'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            self._copy_cache = False
+            cell_index = _CellIndex(self.xvertices, self.yvertices)
+            self._copy_cache = True
+            self._cache_dict[cache_index] = CachedData(cell_index)
+        return self._cache_dict[cache_index].data_nocopy
+
+    def _intersect_cells(self, x, y, local=False, forgive=False):
+        """
+        Get the lowest cell number of the cell outlines of the grid that
+        contains a point, or each point of arrays x and y.
+        """
+        if local:
+            # transform x and y to real-world coordinates
+            x, y = self.get_coords(x, y)
+        scalar = np.isscalar(x)
+        cells = self._get_cell_index().locate(x, y)
+        missing = cells < 0
+        if np.any(missing):
+            if not forgive:
+                raise Exception(
+                    'x, y point given is outside of the model area')
+            cells = cells.astype(float)
+            cells[missing] = np.nan
+        if scalar:
+            return cells[0]
+        return cells.reshape(np.shape(x))
+
     def set_coord_info(self, xoff=0.0, yoff=0.0, angrot=0.0, epsg=None,
                        proj4=None, merge_coord_info=True):
         if merge_coord_info:
@@ -532,6 +734,14 @@ class Grid(object):
         for cache_data in self._cache_dict.values():
             cache_data.out_of_date = True
 
+    def _get_cache_data(self, cache_index):
+        cache_data = self._cache_dict[cache_index]
+        if not self._copy_cache:
+            return cache_data.data_nocopy
+        elif self.cache_views:
+            return cache_data.data_view
+        return cache_data.data
+
     @property
     def _has_ref_coordinates(self):
         return self._xoff != 0.0 or self._yoff != 0.0 or self._angrot != 0.0
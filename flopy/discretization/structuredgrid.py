@@ -131,10 +131,7 @@ class StructuredGrid(Grid):
                 self._cache_dict[cache_index] = \
                     CachedData([xgrid, ygrid])
 
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyedges(self):
@@ -147,10 +144,7 @@ class StructuredGrid(Grid):
                                     np.add.accumulate(self.delc)))
             self._cache_dict[cache_index] = \
                 CachedData([xedge, yedge])
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzcellcenters(self):
@@ -184,10 +178,7 @@ class StructuredGrid(Grid):
                 x_mesh, y_mesh = self.get_coords(x_mesh, y_mesh)
             # store in cache
             self._cache_dict[cache_index] = CachedData([x_mesh, y_mesh, z])
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def grid_lines(self):
@@ -235,17 +226,18 @@ class StructuredGrid(Grid):
     ###############
     def intersect(self, x, y, local=False, forgive=False):
         """
-        Get the row and column of a point with coordinates x and y
+        Get the row and column of a point with coordinates x and y, or of
+        each point of arrays of coordinates x and y
 
         When the point is on the edge of two cells, the cell with the lowest
         row or column is returned.
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -254,39 +246,37 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or numpy.ndarray
+            The row number(s)
+        col : int or numpy.ndarray
+            The column number(s). If forgive is True and a point is outside
+            of the model grid, float arrays with NaNs are returned.
 
         """
         # transform x and y to local coordinates
         x, y = super(StructuredGrid, self).intersect(x, y, local, forgive)
+        scalar = np.isscalar(x)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
 
         # get the cell edges in local coordinates
         xe, ye = self.xyedges
 
-        xcomp = x > xe
-        if np.all(xcomp) or not np.any(xcomp):
-            if forgive:
-                col = np.nan
-            else:
-                raise Exception(
-                    'x, y point given is outside of the model area')
-        else:
-            col = np.where(xcomp)[0][-1]
-
-        ycomp = y < ye
-        if np.all(ycomp) or not np.any(ycomp):
-            if forgive:
-                row = np.nan
-            else:
+        # the column is the last edge that is smaller than x, and the row is
+        # the last edge that is larger than y (ye is decreasing)
+        col = np.searchsorted(xe, x, side='left') - 1
+        row = len(ye) - np.searchsorted(ye[::-1], y, side='right') - 1
+        missing = (col < 0) | (col >= self.ncol) | \
+                  (row < 0) | (row >= self.nrow)
+        if np.any(missing):
+            if not forgive:
                 raise Exception(
                     'x, y point given is outside of the model area')
-        else:
-            row = np.where(ycomp)[0][-1]
-        if np.any(np.isnan([row, col])):
-            row = col = np.nan
+            row = row.astype(float)
+            col = col.astype(float)
+            row[missing] = col[missing] = np.nan
+        if scalar:
+            return row[0], col[0]
         return row, col
 
     def _cell_vert_list(self, i, j):
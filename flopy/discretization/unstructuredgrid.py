@@ -147,10 +147,7 @@ class UnstructuredGrid(Grid):
         if cache_index not in self._cache_dict or \
                 self._cache_dict[cache_index].out_of_date:
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzvertices(self):
@@ -164,14 +161,37 @@ class UnstructuredGrid(Grid):
         if cache_index not in self._cache_dict or \
                 self._cache_dict[cache_index].out_of_date:
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     def intersect(self, x, y, local=False, forgive=False):
-        x, y = super(UnstructuredGrid, self).intersect(x, y, local, forgive)
-        raise Exception('Not implemented yet')
+        """
+        Get the cell number of a point with coordinates x and y, or of
+        each point of arrays of coordinates x and y
+
+        When the point is on the edge of two cells, the cell with the lowest
+        cell number is returned. The points are located with a spatial
+        index of the cells that is built on the first call and cached.
+
+        Parameters
+        ----------
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+
+        Returns
+        -------
+        icell : int or numpy.ndarray
+            The cell number(s). If forgive is True and a point is outside
+            of the model grid, a float array with NaNs is returned.
+
+        """
+        return self._intersect_cells(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -1,11 +1,5 @@
 import numpy as np
-try:
-    from matplotlib.path import Path
-except ImportError:
-    Path = None
-
 from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
 
 
 class VertexGrid(Grid):
@@ -122,10 +116,7 @@ class VertexGrid(Grid):
         if cache_index not in self._cache_dict or \
                 self._cache_dict[cache_index].out_of_date:
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzvertices(self):
@@ -139,63 +130,37 @@ class VertexGrid(Grid):
         if cache_index not in self._cache_dict or \
                 self._cache_dict[cache_index].out_of_date:
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     def intersect(self, x, y, local=False, forgive=False):
         """
-        Get the CELL2D number of a point with coordinates x and y
-        
+        Get the CELL2D number of a point with coordinates x and y, or of
+        each point of arrays of coordinates x and y
+
         When the point is on the edge of two cells, the cell with the lowest
-        CELL2D number is returned.
-        
+        CELL2D number is returned. The points are located with a spatial
+        index of the cells that is built on the first call and cached.
+
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
             Forgive x,y arguments that fall outside the model grid and
             return NaNs instead (defaults to False - will throw exception)
-    
+
         Returns
         -------
-        icell2d : int
-            The CELL2D number
-        
+        icell2d : int or numpy.ndarray
+            The CELL2D number(s). If forgive is True and a point is outside
+            of the model grid, a float array with NaNs is returned.
+
         """
-        if Path is None:
-            s = 'Could not import matplotlib.  Must install matplotlib ' + \
-                ' in order to use VertexGrid.intersect() method'
-            raise ImportError(s)
-
-        if local:
-            # transform x and y to real-world coordinates
-            x, y = super(VertexGrid, self).get_coords(x,y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if np.any(x <= xa) and np.any(x >= xa) and \
-                    np.any(y <= ya) and np.any(y >= ya):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception('x, y point given is outside of the model area')
+        return self._intersect_cells(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -11,13 +11,17 @@ import sys
 import os
 import shutil
 import threading
+import time
 import warnings
 import queue as Queue
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from shutil import which
-from subprocess import Popen, PIPE, STDOUT
+from subprocess import Popen, PIPE, STDOUT, DEVNULL
 import copy
+import functools
 import numpy as np
 from flopy import utils, discretization
 from .version import __version__
@@ -159,6 +163,58 @@ class ModelInterface(object):
             'class to use this base class')
 
 
+class _OrderedLoad(object):
+    """
+    Turnstile used to load packages concurrently while the model is read
+    and changed in the order in which the packages were submitted.  A
+    package load waits for its turn with wait() and the turn passes to the
+    next package load when it returns.  names are the package names that
+    the concurrent loads add to the model.
+
+    """
+
+    def __init__(self, names=()):
+        self._condition = threading.Condition()
+        self._next = 0
+        self._local = threading.local()
+        self.names = set(name.upper() for name in names)
+
+    def run(self, index, func, *args):
+        self._local.index = index
+        try:
+            return func(*args)
+        finally:
+            self.wait()
+            self._local.index = None
+            with self._condition:
+                self._next += 1
+                self._condition.notify_all()
+
+    def wait(self):
+        index = getattr(self._local, 'index', None)
+        if index is None:
+            return
+        with self._condition:
+            while self._next < index:
+                self._condition.wait()
+
+
+def _in_load_order(method):
+    """
+    Decorator for the BaseModel methods that read or change the packages
+    and files of a model.  When packages are loaded concurrently the
+    method waits until the packages before the package of the current
+    thread have been loaded, so that the model is used as in a serial
+    load.
+
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._wait_for_load_turn()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class BaseModel(ModelInterface):
     """
     MODFLOW based models base class
@@ -420,6 +476,7 @@ class BaseModel(ModelInterface):
         from .export import utils
         return utils.model_export(f, self, **kwargs)
 
+    @_in_load_order
     def add_package(self, p):
         """
         Add a package.
@@ -453,6 +510,7 @@ class BaseModel(ModelInterface):
             print('adding Package: ', p.name[0])
         self.packagelist.append(p)
 
+    @_in_load_order
     def remove_package(self, pname):
         """
         Remove a package from this model
@@ -562,6 +620,7 @@ class BaseModel(ModelInterface):
               '{} the output list.'.format(txt2)
         print(msg)
 
+    @_in_load_order
     def add_output_file(self, unit, fname=None, extension='cbc',
                         binflag=True, package=None):
         """
@@ -629,6 +688,7 @@ class BaseModel(ModelInterface):
             self.add_output(fname, unit, binflag=binflag, package=package)
         return
 
+    @_in_load_order
     def add_output(self, fname, unit, binflag=False, package=None):
         """
         Assign an external array so that it will be listed as a DATA or
@@ -669,6 +729,7 @@ class BaseModel(ModelInterface):
 
         return
 
+    @_in_load_order
     def remove_output(self, fname=None, unit=None):
         """
         Remove an output file from the model by specifying either the
@@ -705,6 +766,7 @@ class BaseModel(ModelInterface):
                 ' either fname or unit must be passed to remove_output()')
         return
 
+    @_in_load_order
     def get_output(self, fname=None, unit=None):
         """
         Get an output file from the model by specifying either the
@@ -733,6 +795,7 @@ class BaseModel(ModelInterface):
                 ' either fname or unit must be passed to get_output()')
         return
 
+    @_in_load_order
     def set_output_attribute(self, fname=None, unit=None, attr=None):
         """
         Set a variable in an output file from the model by specifying either
@@ -774,6 +837,7 @@ class BaseModel(ModelInterface):
                         self.output_units[idx] = value
         return
 
+    @_in_load_order
     def get_output_attribute(self, fname=None, unit=None, attr=None):
         """
         Get a attribute for an output file from the model by specifying either
@@ -814,6 +878,7 @@ class BaseModel(ModelInterface):
                     v = self.output_units[idx]
         return v
 
+    @_in_load_order
     def add_external(self, fname, unit, binflag=False, output=False):
         """
         Assign an external array so that it will be listed as a DATA or
@@ -853,6 +918,7 @@ class BaseModel(ModelInterface):
         self.external_output.append(output)
         return
 
+    @_in_load_order
     def remove_external(self, fname=None, unit=None):
         """
         Remove an external file from the model by specifying either the
@@ -973,6 +1039,7 @@ class BaseModel(ModelInterface):
         """
         if not name:
             raise ValueError('invalid package name')
+        self._wait_for_load_turn(name)
         name = name.upper()
         for p in self.packagelist:
             for pn in p.name:
@@ -997,12 +1064,14 @@ class BaseModel(ModelInterface):
         """
         if not name:
             raise ValueError('invalid package name')
+        self._wait_for_load_turn(name)
         name = name.upper()
         for pp in (self.packagelist):
             if pp.name[0].upper() == name:
                 return pp
         return None
 
+    @_in_load_order
     def get_package_list(self, ftype=None):
         """
         Get a list of all the package names.
@@ -1315,6 +1384,7 @@ class BaseModel(ModelInterface):
         """
         return copy.deepcopy(self.__name)
 
+    @_in_load_order
     def add_pop_key_list(self, key):
         """
         Add a external file unit number to a list that will be used to remove
@@ -1335,6 +1405,56 @@ class BaseModel(ModelInterface):
         if key not in self.pop_key_list:
             self.pop_key_list.append(key)
 
+    def _wait_for_load_turn(self, name=None):
+        """
+        Wait until the package that is loaded by the current thread can
+        read or change the model.  Returns immediately if the packages are
+        not loaded concurrently, or if name is given and none of the
+        packages that are loaded concurrently is called name.
+
+        """
+        ordered_load = self.__dict__.get('_ordered_load')
+        if ordered_load is not None:
+            if name is None or name.upper() in ordered_load.names:
+                ordered_load.wait()
+
+    def _load_ordered(self, func, args_list, max_workers=None, names=()):
+        """
+        Call func(*args) for each entry of args_list concurrently in a
+        thread pool.  The calls read and change the model through the
+        model methods and the package constructors in the order of
+        args_list, so the result is the same as for a serial load.
+
+        Parameters
+        ----------
+        func : callable
+            function that loads a package
+        args_list : list of tuples
+            arguments of each call of func
+        max_workers : int
+            Maximum number of threads.  (default is None, which uses the
+            concurrent.futures default)
+        names : list of str
+            names of the packages that the calls can add to the model.
+            get_package and has_package only wait for the turn of the
+            current thread for these names.
+
+        Returns
+        -------
+        results : list
+            values returned by func in the order of args_list
+
+        """
+        ordered_load = _OrderedLoad(names)
+        self._ordered_load = ordered_load
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(ordered_load.run, idx, func, *args)
+                           for idx, args in enumerate(args_list)]
+                return [future.result() for future in futures]
+        finally:
+            del self._ordered_load
+
     def check(self, f=None, verbose=True, level=1):
         """
         Check model data for common errors.
@@ -1500,6 +1620,50 @@ class BaseModel(ModelInterface):
         return
 
 
+def _get_run_argv(exe_name, namefile, model_ws, silent, cargs):
+    """
+    Check that the executable and namefile exist and build the list of
+    command line arguments used to run the model.
+
+    """
+    # check to make sure that program and namefile exist
+    exe = which(exe_name)
+    if exe is None:
+        import platform
+        if platform.system() in 'Windows':
+            if not exe_name.lower().endswith('.exe'):
+                exe = which(exe_name + '.exe')
+    if exe is None:
+        s = 'The program {} does not exist or is not executable.'.format(
+            exe_name)
+        raise Exception(s)
+    else:
+        if not silent:
+            s = 'FloPy is using the following ' + \
+                ' executable to run the model: {}'.format(exe)
+            print(s)
+
+    if namefile is not None:
+        if not os.path.isfile(os.path.join(model_ws, namefile)):
+            s = 'The namefile for this model ' + \
+                'does not exists: {}'.format(namefile)
+            raise Exception(s)
+
+    # create a list of arguments to pass to Popen
+    argv = [exe_name]
+    if namefile is not None:
+        argv.append(namefile)
+
+    # add additional arguments to Popen arguments
+    if cargs is not None:
+        if isinstance(cargs, str):
+            cargs = [cargs]
+        for t in cargs:
+            argv.append(t)
+
+    return argv
+
+
 def run_model(exe_name, namefile, model_ws='./',
               silent=False, pause=False, report=False,
               normal_msg='normal termination', use_async=False,
@@ -1555,28 +1719,7 @@ def run_model(exe_name, namefile, model_ws='./',
     for idx, s in enumerate(normal_msg):
         normal_msg[idx] = s.lower()
 
-    # Check to make sure that program and namefile exist
-    exe = which(exe_name)
-    if exe is None:
-        import platform
-        if platform.system() in 'Windows':
-            if not exe_name.lower().endswith('.exe'):
-                exe = which(exe_name + '.exe')
-    if exe is None:
-        s = 'The program {} does not exist or is not executable.'.format(
-            exe_name)
-        raise Exception(s)
-    else:
-        if not silent:
-            s = 'FloPy is using the following ' + \
-                ' executable to run the model: {}'.format(exe)
-            print(s)
-
-    if namefile is not None:
-        if not os.path.isfile(os.path.join(model_ws, namefile)):
-            s = 'The namefile for this model ' + \
-                'does not exists: {}'.format(namefile)
-            raise Exception(s)
+    argv = _get_run_argv(exe_name, namefile, model_ws, silent, cargs)
 
     # simple little function for the thread to target
     def q_output(output, q):
@@ -1585,18 +1728,6 @@ def run_model(exe_name, namefile, model_ws='./',
             # time.sleep(1)
             # output.close()
 
-    # create a list of arguments to pass to Popen
-    argv = [exe_name]
-    if namefile is not None:
-        argv.append(namefile)
-
-    # add additional arguments to Popen arguments
-    if cargs is not None:
-        if isinstance(cargs, str):
-            cargs = [cargs]
-        for t in cargs:
-            argv.append(t)
-
     # run the model with Popen
     proc = Popen(argv, stdout=PIPE, stderr=STDOUT, cwd=model_ws)
 
@@ -1630,7 +1761,7 @@ def run_model(exe_name, namefile, model_ws='./',
     lastsec = 0.
     while True:
         try:
-            line = q.get_nowait()
+            line = q.get(timeout=0.1)
         except Queue.Empty:
             pass
         else:
@@ -1667,3 +1798,192 @@ def run_model(exe_name, namefile, model_ws='./',
     if pause:
         input('Press Enter to continue...')
     return success, buff
+
+
+class ModelRunResult(namedtuple('ModelRunResult',
+                                ['success', 'buff', 'elapsed'])):
+    """
+    Result of a model run started with run_model_async or run_models.
+
+    Attributes
+    ----------
+    success : boolean
+        True if a normal termination message was found in the model stdout
+    buff : list of str
+        lines of stdout
+    elapsed : float
+        run time in seconds
+
+    """
+    __slots__ = ()
+
+
+async def run_model_async(exe_name, namefile, model_ws='./', silent=True,
+                          normal_msg='normal termination', cargs=None):
+    """
+    Coroutine that runs the model using asyncio.create_subprocess_exec.
+    The model stdout is read line by line as it becomes available, so
+    waiting for the model does not use any CPU time.
+
+    Parameters
+    ----------
+    exe_name : str
+        Executable name (with path, if necessary) to run.
+    namefile : str
+        Namefile of model to run. The namefile must be the
+        filename of the namefile without the path. Namefile can be None
+        to allow programs that do not require a control file (name file)
+        to be passed as a command line argument.
+    model_ws : str
+        Path to the location of the namefile. (default is the
+        current working directory - './')
+    silent : boolean
+        Echo run information to screen (default is True).
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executable.
+        Default is None
+
+    Returns
+    -------
+    result : ModelRunResult
+        named tuple (success, buff, elapsed) with the run status, the lines
+        of stdout and the run time in seconds
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import flopy
+    >>> loop = asyncio.get_event_loop()
+    >>> result = loop.run_until_complete(
+    ...     flopy.mbase.run_model_async('mf2005', 'model.nam', 'model_ws'))
+
+    """
+    # convert normal_msg to a list of lower case str for comparison
+    if isinstance(normal_msg, str):
+        normal_msg = [normal_msg]
+    normal_msg = [s.lower() for s in normal_msg]
+
+    argv = _get_run_argv(exe_name, namefile, model_ws, silent, cargs)
+
+    import asyncio
+
+    success = False
+    buff = []
+    start = time.time()
+    # models do not read from stdin, so that a model that prompts for
+    # input terminates instead of waiting
+    proc = await asyncio.create_subprocess_exec(*argv, stdin=DEVNULL,
+                                                stdout=PIPE, stderr=STDOUT,
+                                                cwd=model_ws)
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+        line = line.decode('utf-8', 'replace').rstrip('\r\n')
+        for msg in normal_msg:
+            if msg in line.lower():
+                success = True
+                break
+        if not silent:
+            print(line)
+        buff.append(line)
+    await proc.wait()
+    return ModelRunResult(success, buff, time.time() - start)
+
+
+def _get_model_run_args(model):
+    """
+    Get the executable name, namefile and model workspace used to run
+    a model, simulation or (exe_name, namefile, model_ws) tuple.
+
+    """
+    if isinstance(model, (tuple, list)):
+        return tuple(model)
+    elif hasattr(model, 'simulation_data'):
+        # MODFLOW 6 simulations are run without a namefile argument
+        return (model.exe_name, None,
+                model.simulation_data.mfpath.get_sim_path())
+    return model.exe_name, model.namefile, model.model_ws
+
+
+async def _run_models_async(runs, max_workers, silent, normal_msg, cargs):
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(exe_name, namefile, model_ws):
+        async with semaphore:
+            return await run_model_async(exe_name, namefile, model_ws,
+                                         silent=silent,
+                                         normal_msg=normal_msg, cargs=cargs)
+
+    return await asyncio.gather(*[run(*args) for args in runs])
+
+
+def run_models(models, max_workers=None, silent=True,
+               normal_msg='normal termination', cargs=None):
+    """
+    Run several models concurrently from a single thread with asyncio.
+    No more than max_workers models are run at the same time.
+
+    Parameters
+    ----------
+    models : list
+        Models to run.  Each item can be a flopy model (for example a
+        Modflow or Mt3dms instance), a MODFLOW 6 MFSimulation, or an
+        (exe_name, namefile, model_ws) tuple.
+    max_workers : int
+        Maximum number of models that are run at the same time.  (default
+        is None, which uses the number of processors)
+    silent : boolean
+        Echo run information to screen (default is True).
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executables.
+        Default is None
+
+    Returns
+    -------
+    results : list of ModelRunResult
+        named tuples (success, buff, elapsed) in the same order as models
+
+    Examples
+    --------
+    >>> import flopy
+    >>> results = flopy.mbase.run_models(models, max_workers=8)
+    >>> failed = [m for m, r in zip(models, results) if not r.success]
+
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    import asyncio
+
+    runs = [_get_model_run_args(model) for model in models]
+    if sys.platform == 'win32':
+        # subprocesses are only supported by the proactor event loop
+        loop = asyncio.ProactorEventLoop()
+    else:
+        loop = asyncio.new_event_loop()
+
+    # the child watcher of python < 3.8 only works with the current event
+    # loop, so set the new loop as the current loop while the models run
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            previous_loop = asyncio.get_event_loop_policy().get_event_loop()
+        except RuntimeError:
+            previous_loop = None
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(
+            _run_models_async(runs, max_workers, silent, normal_msg, cargs))
+    finally:
+        asyncio.set_event_loop(previous_loop)
+        loop.close()
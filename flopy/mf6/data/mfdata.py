@@ -185,6 +185,8 @@ class MFData(DataInterface):
     ----------
     _current_key : str
         current key defining specific transient dataset to be accessed
+    modified : bool
+        whether the data has changed since it was loaded or last written
 
     Methods
     -------
@@ -209,6 +211,7 @@ class MFData(DataInterface):
         # initialize
         self._current_key = None
         self._valid = True
+        self._modified = False
         self._simulation_data = sim_data
         self._model_or_sim = model_or_sim
         self.structure = structure
@@ -276,7 +279,30 @@ class MFData(DataInterface):
             'must define plotable in child '
             'class to use this base class')
 
+    @property
+    def modified(self):
+        if self._modified:
+            return True
+        for storage in self._get_all_storage_objs():
+            if storage.modified:
+                return True
+        return False
+
+    def _clear_modified(self):
+        self._modified = False
+        for storage in self._get_all_storage_objs():
+            storage.modified = False
+
+    def _get_all_storage_objs(self):
+        if isinstance(self._data_storage, dict):
+            return [storage for storage in self._data_storage.values()
+                    if storage is not None]
+        elif self._data_storage is not None:
+            return [self._data_storage]
+        return []
+
     def _resync(self):
+        self._modified = True
         model = self.model
         if model is not None:
             model._mg_resync = True
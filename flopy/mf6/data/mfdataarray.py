@@ -55,6 +55,10 @@ class MFArray(MFMultiDimVar):
     get_data : (layer_num : int) : ndarray
         Returns the data associated with layer "layer_num".  If "layer_num" is
         None, returns all data.
+    get_data_view : (layer_num : int, apply_mult : bool) : ndarray
+        Returns a read-only array with the data associated with layer
+        "layer_num".  The array is reused until the data is changed, so
+        repeated calls do not copy or reread the data.
     set_data : (data : ndarray/list, multiplier : float, layer_num : int)
         Sets the contents of the data at layer "layer_num" to "data" with
         multiplier "multiplier". For unlayered
@@ -161,6 +165,8 @@ class MFArray(MFMultiDimVar):
             self._get_storage_obj().layer_storage.first_item().binary = value
         else:
             super(MFArray, self).__setattr__(name, value)
+            return
+        self._get_storage_obj()._set_modified()
 
     def __getitem__(self, k):
         if isinstance(k, int):
@@ -409,6 +415,34 @@ class MFArray(MFMultiDimVar):
             self._get_storage_obj().layer_storage[ds_index[0]].multiplier = \
                     multiplier[0]
 
+    def _store_binary_external(self, file_path, min_size):
+        # moves internal array data with at least min_size values to binary
+        # external files named file_path.bin, or file_path_layer#.bin for
+        # layered data
+        if self.structure.data_item_structures[0].reader != 'readarray':
+            return
+        storage = self._get_storage_obj()
+        if storage is None:
+            return
+        if storage.layered:
+            layers = list(storage.layer_storage.indexes())
+        else:
+            layers = [None]
+        for layer in layers:
+            if layer is None:
+                layer_item = storage.layer_storage.first_item()
+                fname = '{}.bin'.format(file_path)
+            else:
+                layer_item = storage.layer_storage[layer]
+                fname = '{}_layer{}.bin'.format(file_path, layer[0] + 1)
+            if layer_item.data_storage_type != \
+                    DataStorageType.internal_array or \
+                    layer_item.internal_data is None or \
+                    np.size(layer_item.internal_data) < min_size:
+                continue
+            self.store_as_external_file(fname, [layer_item.factor], layer,
+                                        binary=True)
+
     def has_data(self, layer=None):
         storage = self._get_storage_obj()
         if storage is None:
@@ -453,6 +487,25 @@ class MFArray(MFMultiDimVar):
                                       self._simulation_data.debug, ex)
         return None
 
+    def get_data_view(self, layer=None, apply_mult=True):
+        if isinstance(layer, int):
+            layer = (layer,)
+        storage = self._get_storage_obj()
+        if storage is None:
+            return None
+        try:
+            return storage.get_data_view(layer, apply_mult)
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(self.structure.get_model(),
+                                  self.structure.get_package(),
+                                  self._path,
+                                  'getting data',
+                                  self.structure.name,
+                                  inspect.stack()[0][3], type_,
+                                  value_, traceback_, None,
+                                  self._simulation_data.debug, ex)
+
     def set_data(self, data, multiplier=None, layer=None):
         if multiplier is None:
             multiplier = [1.0]
@@ -886,6 +939,10 @@ class MFTransientArray(MFArray, MFTransient):
     get_data : (layer_num : int, key : int) : ndarray
         Returns the data associated with layer "layer_num" during time "key".
         If "layer_num" is None, returns all data for time "key".
+    get_data_view : (layer_num : int, apply_mult : bool, key : int) : ndarray
+        Returns a read-only array with the data associated with layer
+        "layer_num" during time "key".  The array is reused until the data
+        is changed.
     set_data : (data : ndarray/list, multiplier : float, layer_num : int,
         key : int)
         Sets the contents of the data at layer "layer_num" and time "key" to
@@ -991,6 +1048,12 @@ class MFTransientArray(MFArray, MFTransient):
         else:
             return None
 
+    def get_data_view(self, layer=None, apply_mult=True, key=0):
+        if self._data_storage is None or key not in self._data_storage:
+            return None
+        self.get_data_prep(key)
+        return super(MFTransientArray, self).get_data_view(layer, apply_mult)
+
     def set_data(self, data, multiplier=None, layer=None, key=None):
         if multiplier is None:
             multiplier = [1.0]
@@ -1019,6 +1082,13 @@ class MFTransientArray(MFArray, MFTransient):
         return super(MFTransientArray, self).get_file_entry(ext_file_action=
                                                             ext_file_action)
 
+    def _store_binary_external(self, file_path, min_size):
+        # one set of binary files for each stress period
+        for key in list(self._data_storage.keys()):
+            self._current_key = key
+            super(MFTransientArray, self)._store_binary_external(
+                '{}_{}'.format(file_path, key + 1), min_size)
+
     def load(self, first_line, file_handle, block_header,
              pre_data_comments=None):
         self._load_prep(block_header)
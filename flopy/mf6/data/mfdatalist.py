@@ -44,6 +44,10 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
     get_data : (layer_num : int) : ndarray
         Returns the data associated with layer "layer_num".  If "layer_num" is
         None, returns all data.
+    get_data_view : recarray
+        Returns a read-only recarray with the data.  The recarray is reused
+        until the data is changed, so repeated calls do not copy or reread
+        the data.
     set_data : (data : ndarray/list/dict, multiplier : float, layer_num : int)
         Sets the contents of the data at layer "layer_num" to "data" with
         multiplier "multiplier".  For unlayered data do not pass in
@@ -242,6 +246,20 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                                   traceback_, None,
                                   self._simulation_data.debug, ex)
 
+    def get_data_view(self):
+        try:
+            if self._get_storage_obj() is None:
+                return None
+            return self._get_storage_obj().get_data_view()
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(self.structure.get_model(),
+                                  self.structure.get_package(), self._path,
+                                  'getting data', self.structure.name,
+                                  inspect.stack()[0][3], type_, value_,
+                                  traceback_, None,
+                                  self._simulation_data.debug, ex)
+
     def set_data(self, data, autofill=False):
         self._resync()
         try:
@@ -796,6 +814,9 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         Adds one to the data stored at key "transient_key"
     get_data : (key : int) : ndarray
         Returns the data during time "key".
+    get_data_view : (key : int) : recarray
+        Returns a read-only recarray with the data during time "key".  The
+        recarray is reused until the data is changed.
     set_data : (data : ndarray/list, multiplier : float, key : int)
         Sets the contents of the data at time "key" to "data" with
         multiplier "multiplier".
@@ -957,6 +978,12 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         else:
             return None
 
+    def get_data_view(self, key=0):
+        if self._data_storage is None or key not in self._data_storage:
+            return None
+        self.get_data_prep(key)
+        return super(MFTransientList, self).get_data_view()
+
     def set_data(self, data, key=None, autofill=False):
         if (isinstance(data, dict) or isinstance(data, OrderedDict)) and \
                 'filename' not in data:
@@ -983,6 +1010,45 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         return super(MFTransientList, self).get_file_entry(ext_file_action=
                                                            ext_file_action)
 
+    def _store_binary_external(self, file_path, min_size):
+        # moves internal stress period data with at least min_size rows to
+        # binary external files named file_path_#.bin.  only lists with a
+        # cellid and numeric values can be stored in binary files
+        package_dim = self._data_dimensions.package_dim
+        if package_dim.boundnames():
+            return
+        names = set(['cellid'])
+        for data_item in self.structure.data_item_structures:
+            if not data_item.optional:
+                names.add(data_item.name)
+        aux_var_names = package_dim.get_aux_variables()
+        if aux_var_names is not None:
+            names.update(aux_var_names[0])
+        for key in list(self._data_storage.keys()):
+            if not isinstance(key, int):
+                continue
+            self._current_key = key
+            layer_item = self._get_storage_obj().layer_storage.first_item()
+            data = layer_item.internal_data
+            if layer_item.data_storage_type != \
+                    DataStorageType.internal_array or data is None or \
+                    len(data) < min_size or 'cellid' not in data.dtype.names:
+                continue
+            numeric = True
+            for name in data.dtype.names:
+                if name not in names:
+                    numeric = False
+                elif name != 'cellid' and data.dtype[name].kind == 'O':
+                    # time series names are stored as strings
+                    numeric = not any(isinstance(value, str) for value in
+                                      data[name])
+                if not numeric:
+                    break
+            if numeric:
+                self.set_data({'filename': '{}_{}.bin'.format(file_path,
+                                                              key + 1),
+                               'binary': True, 'data': data}, key=key)
+
     def load(self, first_line, file_handle, block_header,
              pre_data_comments=None):
         self._load_prep(block_header)
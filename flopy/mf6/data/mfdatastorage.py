@@ -188,12 +188,16 @@ class DataStorage(object):
         any comments mixed in with the data, dictionary keys are data lines
     post_data_comments : string
         any comments after the end of the data
+    modified : bool
+        whether the data has been set since the flag was last cleared
 
     Methods
     -------
     override_data_type : (index, data_type)
         overrides the data type used in a recarray at index "index" with data
         type "data_type"
+    get_data_view(layer, apply_mult)
+        gets read-only data that is cached until the data is changed
     get_external_file_path(layer)
         gets the path to an external file for layer "layer"
     get_const_val(layer)
@@ -292,6 +296,8 @@ class DataStorage(object):
             self._data_type = self.data_dimensions.structure.\
                 get_datum_type(return_enum_type=True)
         self.layered = layered
+        self.modified = False
+        self._data_views = {}
 
         # initialize comments
         self.pre_data_comments = None
@@ -306,7 +312,13 @@ class DataStorage(object):
     def _create_layer(self, indexes):
         return LayerStorage(self, indexes, self._data_storage_type)
 
+    def _set_modified(self):
+        # the data changed, discard any cached read-only data
+        self.modified = True
+        self._data_views = {}
+
     def flatten(self):
+        self._set_modified()
         self.layered = False
         storage_type = self.layer_storage.first_item().data_storage_type
         self.layer_storage = MultiList(mdlist=[LayerStorage(self, 0,
@@ -314,6 +326,7 @@ class DataStorage(object):
 
     def make_layered(self):
         if not self.layered:
+            self._set_modified()
             if self.data_structure_type != DataStructureType.ndarray:
                 message = 'Data structure type "{}" does not support ' \
                           'layered data.'.format(self.data_structure_type)
@@ -509,6 +522,17 @@ class DataStorage(object):
     def get_data(self, layer=None, apply_mult=True):
         return self._access_data(layer, True, apply_mult=apply_mult)
 
+    def get_data_view(self, layer=None, apply_mult=True):
+        # read-only data that is reused until the data changes
+        key = (layer, apply_mult)
+        if key not in self._data_views:
+            data = self.get_data(layer, apply_mult)
+            if isinstance(data, np.ndarray):
+                data = data.view()
+                data.flags.writeable = False
+            self._data_views[key] = data
+        return self._data_views[key]
+
     def _access_data(self, layer, return_data=False, apply_mult=True):
         layer_check = self._resolve_layer(layer)
         if (self.layer_storage[layer_check].internal_data is None and
@@ -677,6 +701,7 @@ class DataStorage(object):
 
     def set_data(self, data, layer=None, multiplier=None, key=None,
                  autofill=False):
+        self._set_modified()
         if multiplier is None:
             multiplier = [1.0]
         if self.data_structure_type == DataStructureType.recarray or \
@@ -880,6 +905,7 @@ class DataStorage(object):
     def store_internal(self, data, layer=None, const=False, multiplier=None,
                        key=None, autofill=False,
                        print_format=None):
+        self._set_modified()
         if multiplier is None:
             multiplier = [1.0]
         if self.data_structure_type == DataStructureType.recarray:
@@ -1028,6 +1054,7 @@ class DataStorage(object):
     def store_external(self, file_path, layer=None, multiplier=None,
                        print_format=None, data=None, do_not_verify=False,
                        binary=False):
+        self._set_modified()
         if multiplier is None:
             multiplier = [1.0]
         layer_new, multiplier = self._store_prep(layer, multiplier)
@@ -1211,8 +1238,8 @@ class DataStorage(object):
                 data_out = file_access.read_text_data_from_file(
                     self.get_data_size(layer), self._data_type,
                     self.get_data_dimensions(layer), layer, read_file)[0]
-            if self.layer_storage[layer].factor is not None:
-                data_out = data_out * self.layer_storage[layer].factor
+            data_out = self._apply_multiplier(
+                data_out, self.layer_storage[layer].factor)
 
             if store_internal:
                 self.store_internal(data_out, layer)
@@ -1575,6 +1602,17 @@ class DataStorage(object):
             new_item_name = '{}_1'.format(last_item[0])
         self._recarray_type_list.append((new_item_name, last_item[1]))
 
+    @staticmethod
+    def _apply_multiplier(data, mult):
+        # data has just been read from a file, so the multiplier is applied
+        # in place to keep memory mapped arrays out of memory
+        if mult is None or mult == 1:
+            return data
+        if np.can_cast(np.min_scalar_type(mult), data.dtype):
+            np.multiply(data, mult, out=data)
+            return data
+        return data * mult
+
     def _build_full_data(self, apply_multiplier=False):
         if self.data_structure_type == DataStructureType.scalar:
             return self.layer_storage.first_item().internal_data
@@ -1638,12 +1676,14 @@ class DataStorage(object):
                         read_file, self.get_data_dimensions(layer),
                         self.get_data_size(layer), self._data_type,
                         self._model_or_sim.modeldiscrit,
-                        not self.layered)[0] * mult
+                        not self.layered and
+                        self.data_dimensions.structure.layered)[0]
                 else:
                     data_out = file_access.read_text_data_from_file(
                         self.get_data_size(layer), np_data_type,
                         self.get_data_dimensions(layer), layer,
-                        read_file)[0] * mult
+                        read_file)[0]
+                data_out = self._apply_multiplier(data_out, mult)
                 if self.layer_storage.get_total_size() == 1 or \
                         not self.layered:
                     full_data = data_out
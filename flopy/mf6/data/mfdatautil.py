@@ -380,6 +380,20 @@ class TemplateGenerator(object):
     def __init__(self, path):
         self.path = path
 
+    def __get__(self, instance, owner):
+        # packages store their data in instance attributes with the same
+        # name as the template, which take precedence over the template.
+        # the data attributes of a package that is loaded lazily are only
+        # set when the package file is loaded.
+        if instance is not None and \
+                instance.__dict__.get('_lazy_load_info') is not None:
+            for cls in owner.__mro__:
+                for name, value in cls.__dict__.items():
+                    if value is self:
+                        instance._lazy_load()
+                        return instance.__dict__[name]
+        return self
+
     def _get_data_dimensions(self, model):
         from ..data import mfstructure
         from ..coordinates import modeldimensions
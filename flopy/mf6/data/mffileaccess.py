@@ -1,4 +1,4 @@
-import sys, inspect
+import sys, inspect, tempfile
 from copy import deepcopy
 import numpy as np
 from ..mfbase import MFDataException, VerbosityLevel
@@ -8,6 +8,9 @@ from ...utils.binaryfile import BinaryHeader
 from ...utils import datautil
 from ..data.mfstructure import DatumType, MFDataStructure, DataType
 
+# approximate number of characters read from an external text file at a time
+_text_chunk_size = 1048576
+
 
 class MFFileAccess(object):
     def __init__(self, structure, data_dimensions, simulation_data, path,
@@ -177,7 +180,6 @@ class MFFileAccessArray(MFFileAccess):
         else:
             self._write_layer(fd, data, modelgrid, modeltime, stress_period,
                               precision, text, fname)
-        data.tofile(fd)
         fd.close()
 
     def _write_layer(self, fd, data, modelgrid, modeltime, stress_period,
@@ -302,6 +304,14 @@ class MFFileAccessArray(MFFileAccess):
             if jagged_def_path in self._simulation_data.mfdata:
                 jagged_def = self._simulation_data.mfdata[jagged_def_path].array
 
+        if isinstance(data, np.ndarray):
+            # format numeric arrays with numpy
+            data_string = self._get_array_data_string(data, data_type,
+                                                      data_indent, is_cellid,
+                                                      jagged_def)
+            if data_string is not None:
+                return data_string
+
         for item, last_item, new_list, nesting_change in data_iter:
             # increment data/layer counts
             line_data_count += 1
@@ -344,6 +354,80 @@ class MFFileAccessArray(MFFileAccess):
         else:
             return '\n'.join(layer_data_string)
 
+    def _get_array_data_string(self, data, data_type, data_indent, is_cellid,
+                               jagged_def):
+        # returns the same string as get_data_string for a numeric array,
+        # or None if the array can not be formatted here
+        if data.ndim == 0:
+            return None
+        sim_data = self._simulation_data
+        values = data.ravel()
+        if data_type == DatumType.double_precision and \
+                (np.issubdtype(values.dtype, np.floating) or
+                 np.issubdtype(values.dtype, np.integer)):
+            # same choice of format as to_string
+            abs_values = np.abs(values)
+            with np.errstate(invalid='ignore'):
+                use_reg = ((abs_values > sim_data._sci_note_upper_thres) |
+                           (abs_values < sim_data._sci_note_lower_thres)) & \
+                          (abs_values != 0)
+            reg_format = sim_data.reg_format_str.format
+            sci_format = sim_data.sci_format_str.format
+            str_values = [reg_format(val) if reg else sci_format(val) for
+                          val, reg in zip(values.tolist(), use_reg.tolist())]
+        elif data_type == DatumType.integer and \
+                np.issubdtype(values.dtype, np.integer):
+            if is_cellid:
+                values = values + 1
+            str_values = [str(val) for val in values.tolist()]
+        else:
+            return None
+
+        # find the items that end a line
+        num_values = len(str_values)
+        if jagged_def is not None:
+            try:
+                line_sizes = np.asarray(jagged_def, dtype=int).ravel()
+            except (TypeError, ValueError):
+                return None
+            if np.any(line_sizes <= 0) or line_sizes.sum() < num_values:
+                return None
+            line_ends = np.cumsum(line_sizes)
+            line_ends = line_ends[line_ends <= num_values]
+        elif sim_data.wrap_multidim_arrays:
+            # lines end every max_columns_of_data items and at the end of
+            # each row of the array
+            row_size = data.shape[-1]
+            if row_size == 0:
+                line_ends = np.array([], dtype=int)
+            else:
+                column = np.arange(num_values) % row_size + 1
+                end = column == row_size
+                max_columns = sim_data.max_columns_of_data
+                if isinstance(max_columns, int) and max_columns > 0:
+                    end |= column % max_columns == 0
+                line_ends = np.nonzero(end)[0] + 1
+        else:
+            line_ends = np.array([], dtype=int)
+
+        indent_str = sim_data.indent_string
+        layer_data_string = []
+        start = 0
+        for end in line_ends.tolist() + [num_values]:
+            if end > start:
+                layer_data_string.append('{}{}{}'.format(
+                    data_indent, indent_str,
+                    indent_str.join(str_values[start:end])))
+            else:
+                layer_data_string.append(data_indent)
+            start = end
+        # clean up the text at the end of the array
+        layer_data_string[-1] = layer_data_string[-1].strip()
+        if len(layer_data_string) == 1:
+            return '{}{}\n'.format(data_indent, layer_data_string[0].rstrip())
+        else:
+            return '\n'.join(layer_data_string)
+
     def _read_binary_file_layer(self, fd, fname, header_dtype, numpy_type,
                                 data_size, data_shape):
         header_data = np.fromfile(fd, dtype=header_dtype, count=1)
@@ -374,14 +458,27 @@ class MFFileAccessArray(MFFileAccess):
         if fd is None:
             close_file = True
             fd = self._open_ext_file(fname)
-        data_raw = []
-        line = ' '
         PyListUtil.reset_delimiter_used()
-        while line != '' and len(data_raw) < data_size:
-            line = fd.readline()
-            data_raw += PyListUtil.split_data_line(line, True)
-
-        if len(data_raw) < data_size:
+        # convert the file a chunk at a time into a preallocated array, an
+        # external file is read in large chunks while data in a package
+        # file is read a line at a time so that the file is not read past
+        # the end of the data
+        data_out = self._allocate_text_data(data_size, data_type)
+        while current_size < data_size:
+            if close_file:
+                lines = fd.readlines(_text_chunk_size)
+            else:
+                lines = [fd.readline()]
+            if not lines or lines[0] == '':
+                break
+            data_raw = self._split_text_lines(lines)
+            count = min(len(data_raw), data_size - current_size)
+            if count > 0:
+                data_out[current_size:current_size + count] = \
+                    np.array(data_raw[:count], dtype=data_type)
+                current_size += count
+
+        if current_size < data_size:
             message = 'Not enough data in file {} for data "{}".  ' \
                       'Expected data size {} but only found ' \
                       '{}.'.format(fd.name,
@@ -400,7 +497,6 @@ class MFFileAccessArray(MFFileAccess):
                 traceback_, message,
                 self._simulation_data.debug)
 
-        data_out = np.fromiter(data_raw, dtype=data_type, count=data_size)
         data_out = self._resolve_cellid_numbers_from_file(data_out)
         if close_file:
             fd.close()
@@ -408,6 +504,32 @@ class MFFileAccessArray(MFFileAccess):
         data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    def _allocate_text_data(self, data_size, data_type):
+        # large numeric arrays can be backed by a temporary file so that
+        # they are not held in memory while they are read
+        min_size = self._simulation_data.memmap_min_size
+        if min_size is not None and data_size >= min_size and \
+                np.dtype(data_type).kind in 'iuf':
+            return np.memmap(tempfile.TemporaryFile(), dtype=data_type,
+                             mode='w+', shape=(data_size,))
+        return np.empty(data_size, dtype=data_type)
+
+    @staticmethod
+    def _split_text_lines(lines):
+        text = ''.join(lines)
+        if '"' in text or "'" in text:
+            # quoted text is split with the general purpose line parser
+            data_raw = []
+            for line in lines:
+                data_raw += PyListUtil.split_data_line(
+                    line.split('#', 1)[0], True)
+            return data_raw
+        if '#' in text:
+            text = '\n'.join([line.split('#', 1)[0] for line in lines])
+        if ',' in text:
+            text = text.replace(',', ' ')
+        return text.split()
+
     def load_from_package(self, first_line, file_handle, layer_shape,
                           storage, keyword, pre_data_comments=None):
         # read in any pre data comments
@@ -658,6 +780,10 @@ class MFFileAccessArray(MFFileAccess):
                                   self._simulation_data.debug, ex)
         if isinstance(data, list) or isinstance(data, np.ndarray):
             try:
+                if isinstance(data, np.ndarray):
+                    # keep arrays, including memory mapped arrays, as they
+                    # are
+                    return np.reshape(data, dimensions)
                 return np.reshape(data, dimensions).tolist()
             except Exception as ex:
                 type_, value_, traceback_ = sys.exc_info()
@@ -787,7 +913,7 @@ class MFFileAccessList(MFFileAccess):
             return [False, arr_line]
         if len(arr_line) >= 2 and arr_line[0].upper() == 'OPEN/CLOSE':
             try:
-                storage.process_open_close_line(arr_line, 0)
+                storage.process_open_close_line(arr_line, (0,))
             except Exception as ex:
                 message = 'An error occurred while processing the following' \
                           'open/close line: {}'.format(current_line)
@@ -905,13 +1031,24 @@ class MFFileAccessList(MFFileAccess):
             recarrays = parent_block.get_all_recarrays()
         recarray_len = len(recarrays)
 
+        # use the vectorized reader for lists with a fixed number of
+        # numeric columns
+        simple_columns = None
+        if self.simple_line and store_data and recarray_len == 1:
+            simple_columns = self._get_simple_list_columns()
+
         # loop until end of block
         line = ' '
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
         while line != '':
-            line = file_handle.readline()
+            if simple_columns is not None:
+                line, lines_loaded = self._load_simple_list_lines(
+                    file_handle, data_loaded, simple_columns)
+                line_num += lines_loaded
+            else:
+                line = file_handle.readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (arr_line and len(arr_line[0]) >= 2 and
                     arr_line[0][:3].upper() == 'END'):
@@ -1056,6 +1193,140 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    def _get_simple_list_columns(self):
+        """
+        Get the columns of a list whose lines only contain a fixed number
+        of integer, double and cellid values, based on the line information
+        of the first line of the list.  Returns a list of (data type, cellid
+        size, data item structure) tuples, one for each data item, or None
+        if the list can not be read with _load_simple_list_lines.
+
+        """
+        data_structs = self.structure.data_item_structures
+        package_dim = self._data_dimensions.package_dim
+        columns = []
+        column_index = 0
+        for index, entry in enumerate(self._last_line_info):
+            data_item = data_structs[index]
+            if len(entry) == 0 or data_item.optional:
+                return None
+            cellid_size = entry[0][2]
+            if cellid_size > 0:
+                if len(entry) != cellid_size:
+                    return None
+            elif len(entry) != 1 or data_item.numeric_index or \
+                    data_item.support_negative_index:
+                return None
+            for sub_entry in entry:
+                if sub_entry[0] != column_index or \
+                        (sub_entry[1] != DatumType.integer and
+                         sub_entry[1] != DatumType.double_precision):
+                    return None
+                column_index += 1
+            columns.append((entry[0][1], cellid_size, data_item))
+        # optional data at the end of the line is not supported
+        for data_item in data_structs[len(self._last_line_info):]:
+            if data_item.name == 'aux':
+                if package_dim.get_aux_variables() is not None:
+                    return None
+            elif data_item.name == 'boundname':
+                if package_dim.boundnames():
+                    return None
+            else:
+                return None
+        return columns
+
+    def _load_simple_list_lines(self, file_handle, data_loaded, columns,
+                                chunk_size=10000):
+        """
+        Load consecutive lines that contain exactly the values described by
+        columns into data_loaded.  The lines are converted with numpy in
+        chunks of chunk_size lines.  Reading stops at the first line that
+        has a different number of values, a comment or a delimiter other
+        than white space, so that it can be processed by the line by line
+        reader.
+
+        Returns
+        -------
+        line, lines_loaded : str, int
+            the line that was not loaded ('' at the end of the file) and
+            the number of lines that were loaded
+
+        """
+        num_values = sum([max(cellid_size, 1) for _, cellid_size, _ in
+                          columns])
+        lines_loaded = 0
+        rows = []
+        while True:
+            line = file_handle.readline()
+            arr_line = line.split()
+            if len(arr_line) != num_values or \
+                    arr_line[0][:3].upper() == 'END' or '#' in line or \
+                    ',' in line or "'" in line or '"' in line:
+                break
+            rows.append(arr_line)
+            if len(rows) == chunk_size:
+                self._convert_simple_list_rows(rows, data_loaded, columns)
+                lines_loaded += len(rows)
+                rows = []
+        if rows:
+            self._convert_simple_list_rows(rows, data_loaded, columns)
+            lines_loaded += len(rows)
+        return line, lines_loaded
+
+    def _convert_simple_list_rows(self, rows, data_loaded, columns):
+        """
+        Convert rows of text values to data tuples, one column at a time,
+        and append them to data_loaded.
+
+        """
+        text_array = np.array(rows, dtype=str)
+        column_data = []
+        column_index = 0
+        try:
+            for data_type, cellid_size, data_item in columns:
+                if cellid_size > 0:
+                    cellids = text_array[:, column_index:column_index +
+                                         cellid_size].astype(np.int64) - 1
+                    column_data.append([tuple(cellid) for cellid in
+                                        cellids.tolist()])
+                    column_index += cellid_size
+                elif data_type == DatumType.integer:
+                    column_data.append(
+                        text_array[:, column_index].astype(np.int64).tolist())
+                    column_index += 1
+                else:
+                    values = text_array[:, column_index]
+                    try:
+                        values = values.astype(np.float64)
+                    except ValueError:
+                        # fix any scientific formatting that numpy can't
+                        # handle
+                        values = np.char.replace(np.char.lower(values), 'd',
+                                                 'e').astype(np.float64)
+                    column_data.append(values.tolist())
+                    column_index += 1
+        except ValueError:
+            # convert each value separately
+            for arr_line in rows:
+                data_line = ()
+                column_index = 0
+                for data_type, cellid_size, data_item in columns:
+                    if cellid_size > 0:
+                        data_line += (tuple(
+                            [int(value) - 1 for value in
+                             arr_line[column_index:column_index +
+                                      cellid_size]]),)
+                        column_index += cellid_size
+                    else:
+                        data_line += (convert_data(arr_line[column_index],
+                                                   self._data_dimensions,
+                                                   data_type, data_item),)
+                        column_index += 1
+                data_loaded.append(data_line)
+            return
+        data_loaded.extend(zip(*column_data))
+
     def _load_list_line(self, storage, arr_line, line_num, data_loaded,
                         build_type_list, current_key, data_index_start=0,
                         data_set=None, ignore_optional_vars=False,
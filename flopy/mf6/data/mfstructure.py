@@ -4,14 +4,51 @@ mfstructure module.  Contains classes related to package structure
 
 """
 import os
+import sys
 import traceback
 import ast
 import keyword
+import hashlib
+import pickle
+import tempfile
 from enum import Enum
 from textwrap import TextWrapper
 from collections import OrderedDict
 import numpy as np
 from ..mfbase import PackageContainer, StructException
+from ...version import __version__
+
+# version of the cached structure, bump it when the cached objects change
+# in a way that is not visible in the source of this module
+_CACHE_FORMAT = '1'
+
+
+def get_structure_cache_dir():
+    """
+    Returns the folder in which the MODFLOW 6 structure built from the
+    package definitions is cached.  The folder is set with the
+    FLOPY_CACHE_DIR environment variable, and caching is disabled if
+    FLOPY_CACHE_DIR is an empty string.
+
+    Returns
+    -------
+    cache_dir : str or None
+        path of the cache folder, or None if caching is disabled
+
+    """
+    cache_dir = os.environ.get('FLOPY_CACHE_DIR')
+    if cache_dir is None:
+        if sys.platform == 'win32':
+            base_dir = os.environ.get('LOCALAPPDATA',
+                                      os.path.expanduser('~'))
+        else:
+            base_dir = os.environ.get(
+                'XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'),
+                                               '.cache'))
+        cache_dir = os.path.join(base_dir, 'flopy')
+    elif not cache_dir:
+        return None
+    return cache_dir
 
 
 class DfnType(Enum):
@@ -2123,6 +2160,12 @@ class MFStructure(object):
     dimension_dict : dict
         Dictionary mapping paths to dimension information to the dataitem whose
         dimension information is being described
+
+    Notes
+    -----
+    The structure built from the package classes is cached in the folder
+    returned by get_structure_cache_dir, so that it is only built once for
+    each version of flopy, python, the package definitions and this module.
     """
     _instance = None
 
@@ -2170,12 +2213,74 @@ class MFStructure(object):
             self.sim_struct.tag_read_as_arrays()
         else:
             package_list = PackageContainer.package_factory(None, None)
+            cache_file = self.__get_cache_file(package_list)
+            if cache_file is not None and self.__load_cache(cache_file):
+                return True
             for package in package_list:
                 self.sim_struct.process_dfn(DfnPackage(package))
             self.sim_struct.tag_read_as_arrays()
+            if cache_file is not None:
+                self.__write_cache(cache_file)
+
+        return True
 
+    @staticmethod
+    def __get_cache_file(package_list):
+        # the cache is keyed by the flopy and python versions, the package
+        # definitions and the source of this module, so that changes to the
+        # dfn data or to the structure classes are never hidden by an old
+        # cache
+        cache_dir = get_structure_cache_dir()
+        if cache_dir is None:
+            return None
+        dfn_data = [(package.dfn_file_name, package.dfn) for package in
+                    package_list]
+        md5 = hashlib.md5(repr(dfn_data).encode())
+        md5.update(_CACHE_FORMAT.encode())
+        try:
+            with open(os.path.splitext(__file__)[0] + '.py', 'rb') as fd:
+                md5.update(fd.read())
+        except IOError:
+            # only compiled files are installed, rely on _CACHE_FORMAT
+            pass
+        file_name = 'mf6structure_{}_py{}{}_{}.pkl'.format(
+            __version__, sys.version_info[0], sys.version_info[1],
+            md5.hexdigest())
+        return os.path.join(cache_dir, file_name)
+
+    def __load_cache(self, cache_file):
+        if not os.path.isfile(cache_file):
+            return False
+        try:
+            with open(cache_file, 'rb') as fd:
+                sim_struct, dimension_dict = pickle.load(fd)
+        except Exception:
+            # rebuild the structure if the cache can not be read
+            return False
+        self.sim_struct = sim_struct
+        self.dimension_dict = dimension_dict
         return True
 
+    def __write_cache(self, cache_file):
+        # write to a temporary file and rename it, so that processes
+        # started at the same time never read a partially written cache
+        cache_dir = os.path.dirname(cache_file)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fd_cache:
+                    pickle.dump((self.sim_struct, self.dimension_dict),
+                                fd_cache, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_file, cache_file)
+            except Exception:
+                os.remove(temp_file)
+                raise
+        except Exception:
+            # the cache is optional, the structure is rebuilt next time
+            pass
+
     def __load_flopy(self):
         current_variable = None
         var_info = {}
@@ -2,6 +2,8 @@ import glob
 import importlib
 import inspect, sys, traceback
 import os, collections, copy
+import threading
+from contextlib import contextmanager
 from shutil import copyfile
 from enum import Enum
 
@@ -203,6 +205,10 @@ class MFFileMgmt(object):
         sets the simulation working path
 
     """
+    # simulation paths that are used by the threads that are loading
+    # packages, keyed by id of the MFFileMgmt instance
+    _thread_sim_paths = threading.local()
+
     def __init__(self, path):
         self._sim_path = ''
         self.set_sim_path(path)
@@ -341,17 +347,48 @@ class MFFileMgmt(object):
             return os.path.join(self._last_loaded_sim_path,
                                 self._last_loaded_model_relative_path[key])
         else:
+            sim_path = self.get_sim_path()
             if key in self.model_relative_path:
-                return os.path.join(self._sim_path, self.model_relative_path[key])
+                return os.path.join(sim_path, self.model_relative_path[key])
             else:
-                return self._sim_path
+                return sim_path
 
     def get_sim_path(self, last_loaded_path=False):
         if last_loaded_path:
             return self._last_loaded_sim_path
         else:
+            paths = getattr(MFFileMgmt._thread_sim_paths, 'paths', None)
+            if paths and id(self) in paths:
+                return paths[id(self)]
             return self._sim_path
 
+    @contextmanager
+    def loading_sim_path(self, path):
+        """
+        Use path as the simulation path of the current thread, for
+        example to load a package from the simulation path that it was
+        registered from.  The simulation path of other threads is not
+        changed.
+
+        Parameters
+        ----------
+        path : string
+            full path to the simulation folder
+
+        """
+        paths = getattr(MFFileMgmt._thread_sim_paths, 'paths', None)
+        if paths is None:
+            paths = MFFileMgmt._thread_sim_paths.paths = {}
+        previous = paths.get(id(self))
+        paths[id(self)] = path
+        try:
+            yield
+        finally:
+            if previous is None:
+                del paths[id(self)]
+            else:
+                paths[id(self)] = previous
+
     def add_ext_file(self, file_path, model_name):
         if file_path in self.existing_file_dict:
             if model_name not in self.existing_file_dict[file_path].model_name:
@@ -3,6 +3,7 @@ mfmodel module.  Contains the MFModel class
 
 """
 import os, sys, inspect, warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from .mfbase import PackageContainer, ExtFileAction, PackageContainerType, \
                     MFDataException, ReadAsArraysException, FlopyException, \
@@ -468,7 +469,7 @@ class MFModel(PackageContainer, ModelInterface):
     def load_base(cls, simulation, structure, modelname='NewModel',
                   model_nam_file='modflowtest.nam', mtype='gwf', version='mf6',
                   exe_name='mf6.exe', strict=True, model_rel_path='.',
-                  load_only=None):
+                  load_only=None, lazy_load=False, max_workers=None):
         """
         Load an existing model.
 
@@ -501,6 +502,16 @@ class MFModel(PackageContainer, ModelInterface):
             setting. subpackages, like time series and observations, will also
             load regardless of this setting.
             example list: ['ic', 'maw', 'npf', 'oc', 'my_well_package_1']
+        lazy_load : bool
+            defer loading the data of each package, except the
+            discretization packages, until the package data is first
+            accessed.  packages that are never accessed are copied
+            unchanged when the model is written.
+        max_workers : int
+            maximum number of threads used to load the data of the model
+            packages concurrently.  the discretization packages are loaded
+            first.  default is None, which loads the packages one after
+            another.  ignored if lazy_load is True.
 
         Returns
         -------
@@ -509,18 +520,21 @@ class MFModel(PackageContainer, ModelInterface):
         Examples
         --------
         """
-        instance = cls(simulation, mtype, modelname,
-                       model_nam_file=model_nam_file,
-                       version=version, exe_name=exe_name,
-                       add_to_simulation=False, structure=structure,
-                       model_rel_path=model_rel_path)
+        # models can be loaded in concurrent threads, register the model
+        # with the simulation data one thread at a time
+        with simulation.simulation_data.lock:
+            instance = cls(simulation, mtype, modelname,
+                           model_nam_file=model_nam_file,
+                           version=version, exe_name=exe_name,
+                           add_to_simulation=False, structure=structure,
+                           model_rel_path=model_rel_path)
+
+            # load name file
+            instance.name_file.load(strict)
 
         # build case consistent load_only dictionary for quick lookups
         load_only = instance._load_only_dict(load_only)
 
-        # load name file
-        instance.name_file.load(strict)
-
         # order packages
         vnum = mfstructure.MFStructure().get_version_string()
         # FIX: Transport - Priority packages maybe should not be hard coded
@@ -539,6 +553,7 @@ class MFModel(PackageContainer, ModelInterface):
         # load packages
         sim_struct = mfstructure.MFStructure().sim_struct
         instance._ftype_num_dict = {}
+        threaded_packages = []
         for ftype, fname, pname in packages_ordered:
             ftype_orig = ftype
             ftype = ftype[0:-1].lower()
@@ -558,11 +573,26 @@ class MFModel(PackageContainer, ModelInterface):
                     filemgr = simulation.simulation_data.mfpath
                     fname = filemgr.strip_model_relative_path(modelname,
                                                               fname)
+                priority = instance._in_pkg_list(priority_packages,
+                                                 ftype_orig, pname)
+                lazy = lazy_load and not priority
+                # with max_workers the package data is loaded in a thread
+                # pool once all of the packages have been registered
+                threaded = max_workers is not None and not lazy_load and \
+                    not priority
                 if simulation.simulation_data.verbosity_level.value >= \
                         VerbosityLevel.normal.value:
-                    print('    loading package {}...'.format(ftype))
+                    if lazy:
+                        print('    deferring load of package '
+                              '{}...'.format(ftype))
+                    else:
+                        print('    loading package {}...'.format(ftype))
                 # load package
-                instance.load_package(ftype, fname, pname, strict, None)
+                package = instance.load_package(ftype, fname, pname, strict,
+                                                None, lazy=lazy or threaded)
+                if threaded:
+                    threaded_packages.append(package)
+        instance._load_packages_threaded(threaded_packages, max_workers)
 
         # load referenced packages
         if modelname in instance.simulation_data.referenced_files:
@@ -580,7 +610,8 @@ class MFModel(PackageContainer, ModelInterface):
 
         return instance
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(self, ext_file_action=ExtFileAction.copy_relative_paths,
+              incremental=False):
         """
         write model to model files
 
@@ -590,6 +621,9 @@ class MFModel(PackageContainer, ModelInterface):
             defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        incremental : bool
+            only write packages that were modified since they were loaded or
+            last written, or whose file path changed
 
         Returns
         -------
@@ -603,14 +637,15 @@ class MFModel(PackageContainer, ModelInterface):
                 VerbosityLevel.normal.value:
             print('    writing model name file...')
 
-        self.name_file.write(ext_file_action=ext_file_action)
+        self.name_file.write(ext_file_action=ext_file_action,
+                             incremental=incremental)
 
         # write packages
         for pp in self.packagelist:
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('    writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            pp.write(ext_file_action=ext_file_action, incremental=incremental)
 
     def get_grid_type(self):
         """
@@ -976,7 +1011,8 @@ class MFModel(PackageContainer, ModelInterface):
         return None, None
 
     def load_package(self, ftype, fname, pname, strict, ref_path,
-                     dict_package_name=None, parent_package=None):
+                     dict_package_name=None, parent_package=None,
+                     lazy=False):
         """
         loads a package from a file
 
@@ -996,10 +1032,22 @@ class MFModel(PackageContainer, ModelInterface):
             package name for dictionary lookup
         parent_package : MFPackage
             parent package
+        lazy : bool
+            defer loading the package data until it is first accessed
 
         Examples
         --------
         """
+        # packages can be loaded in concurrent threads, register the
+        # package with the model and simulation one thread at a time
+        with self.simulation_data.lock:
+            return self._load_package(ftype, fname, pname, strict, ref_path,
+                                      dict_package_name, parent_package,
+                                      lazy)
+
+    def _load_package(self, ftype, fname, pname, strict, ref_path,
+                      dict_package_name=None, parent_package=None,
+                      lazy=False):
         if ref_path is not None:
             fname = os.path.join(ref_path, fname)
         sim_struct = mfstructure.MFStructure().sim_struct
@@ -1047,14 +1095,25 @@ class MFModel(PackageContainer, ModelInterface):
                               loading_package=True,
                               parent_file=parent_package)
         try:
-            package.load(strict)
+            if lazy:
+                if not package.structure.read_as_arrays and \
+                        self._reads_as_arrays(package.get_file_path()):
+                    raise ReadAsArraysException(
+                        'ERROR: Attempting to read a ReadAsArrays package '
+                        'as a non-ReadAsArrays package {}'.format(fname))
+                package.set_lazy_load(strict)
+            else:
+                package.load(strict)
         except ReadAsArraysException:
             #  create ReadAsArrays package and load it instead
             package_obj = self.package_factory('{}a'.format(ftype), model_type)
             package = package_obj(self, filename=fname, pname=dict_package_name,
                                   loading_package=True,
                                   parent_file=parent_package)
-            package.load(strict)
+            if lazy:
+                package.set_lazy_load(strict)
+            else:
+                package.load(strict)
 
         # register child package with the model
         self._add_package(package, package.path)
@@ -1064,6 +1123,37 @@ class MFModel(PackageContainer, ModelInterface):
 
         return package
 
+    @staticmethod
+    def _load_packages_threaded(packages, max_workers):
+        # load the data of packages whose loading was deferred, reading
+        # each package file in its own thread
+        if not packages:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(package._lazy_load, False)
+                       for package in packages]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _reads_as_arrays(file_path):
+        # look for the READASARRAYS option without loading the package
+        with open(file_path, 'r') as fd:
+            for line in fd:
+                arr_line = line.split('#', 1)[0].split()
+                if not arr_line:
+                    continue
+                keyword = arr_line[0].upper()
+                if keyword == 'READASARRAYS':
+                    return True
+                elif keyword in ('BEGIN', 'END') and len(arr_line) > 1 and \
+                        arr_line[1].upper() == 'OPTIONS':
+                    if keyword == 'END':
+                        return False
+                elif keyword == 'BEGIN':
+                    return False
+        return False
+
     def plot(self, SelPackList=None, **kwargs):
         """
         Plot 2-D, 3-D, transient 2-D, and stress period list (MfList)
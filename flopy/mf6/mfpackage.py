@@ -1,6 +1,7 @@
 import os
 import sys
 import errno
+import shutil
 import inspect
 import numpy as np
 from collections import OrderedDict
@@ -603,7 +604,10 @@ class MFBlock(object):
 
         # if block not empty
         if not (len(arr_line[0]) > 2 and arr_line[0][:3].upper() == 'END'):
-            if arr_line[0].lower() == 'open/close':
+            # binary external files are read by the data set
+            binary = [item for item in arr_line[2:] if
+                      item.lower() in ('binary', '(binary)')]
+            if arr_line[0].lower() == 'open/close' and not binary:
                 # open block contents from external file
                 fd_block.readline()
                 fd_path = os.path.split(os.path.realpath(fd_block.name))[0]
@@ -1088,6 +1092,12 @@ class MFPackage(PackageContainer, PackageInterface):
         describes the blocks and data contain in this package
     dimensions : PackageDimension
         resolves data dimensions for data within this package
+    binary_external : bool
+        whether large internal arrays and stress period lists of this package
+        are moved to binary external files when the package is written.  If
+        None the simulation's binary_external setting is used
+    modified : bool
+        whether the package has changed since it was loaded or last written
 
     Methods
     -------
@@ -1100,8 +1110,9 @@ class MFPackage(PackageContainer, PackageInterface):
         Loads the package from file
     is_valid : bool
         Returns whether or not this package is valid
-    write
-        Writes the package to a file
+    write : (ext_file_action : ExtFileAction, incremental : bool)
+        Writes the package to a file.  In incremental mode the package is
+        only written if it was modified or its file path changed
     get_file_path : string
         Returns the package file's path
     remove
@@ -1199,9 +1210,23 @@ class MFPackage(PackageContainer, PackageInterface):
         self.post_block_comments = None
         self.last_error = None
         self.bc_color = "black"
+        self.binary_external = None
+        self._modified = True
+        self._write_path = None
         self.__inattr = False
         self._child_package_groups = {}
 
+    def __getattr__(self, name):
+        # the blocks and data attributes of a package that is loaded lazily
+        # are only available after the package file is loaded
+        lazy_load_info = self.__dict__.get('_lazy_load_info')
+        if lazy_load_info is not None and name in lazy_load_info[0]:
+            self._lazy_load()
+            return self.__dict__[name]
+        raise AttributeError(
+            '{!r} object has no attribute {!r}'.format(
+                type(self).__name__, name))
+
     def __setattr__(self, name, value):
         if hasattr(self, name) and getattr(self, name) is not None:
             attribute = object.__getattribute__(self, name)
@@ -1224,6 +1249,108 @@ class MFPackage(PackageContainer, PackageInterface):
     def __str__(self):
         return self._get_data_str(False)
 
+    @property
+    def modified(self):
+        """True if the package changed since it was loaded or written."""
+        if self._modified:
+            return True
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if dataset.modified:
+                    return True
+        return False
+
+    def _clear_modified(self, file_path):
+        # package data now matches the package file at file_path
+        self._modified = False
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                dataset._clear_modified()
+        self._write_path = os.path.abspath(file_path)
+
+    @property
+    def lazy_load_pending(self):
+        """True if the package data has not been loaded yet."""
+        return self.__dict__.get('_lazy_load_info') is not None
+
+    def set_lazy_load(self, strict=True):
+        """
+        Defer loading the package data until the blocks or a data attribute
+        of the package are first accessed.  Until then, writing the package
+        copies the package file and the external files it references.
+
+        Parameters
+        ----------
+        strict : bool
+            strict mode when loading the file
+
+        """
+        # the blocks and data attributes are removed from the package until
+        # the package is loaded, so that accessing them calls __getattr__
+        lazy_attributes = {}
+        for name, value in list(self.__dict__.items()):
+            if name == 'blocks' or isinstance(value, mfdata.MFData):
+                lazy_attributes[name] = self.__dict__.pop(name)
+        self.__dict__['_lazy_load_info'] = (
+            lazy_attributes, strict, self.get_file_path(),
+            self._simulation_data.mfpath.get_sim_path())
+
+    def _lazy_load(self, echo=True):
+        # load the package data if loading was deferred
+        lazy_load_info = self.__dict__.get('_lazy_load_info')
+        if lazy_load_info is None:
+            return
+        lazy_attributes, strict, file_path, sim_path = lazy_load_info
+        self.__dict__['_lazy_load_info'] = None
+        self.__dict__.update(lazy_attributes)
+        if echo and self._simulation_data.verbosity_level.value >= \
+                VerbosityLevel.normal.value:
+            print('    loading package {}...'.format(self._get_pname()))
+        # files referenced by the package are loaded relative to the
+        # simulation path the package was loaded from
+        self._load_file(file_path, strict, sim_path=sim_path)
+
+    def _write_lazy(self, ext_file_action):
+        # copy the package file and the files it references, which have not
+        # been loaded, to the current simulation path
+        lazy_attributes, strict, file_path, sim_path = \
+            self.__dict__['_lazy_load_info']
+        new_file_path = self.get_file_path()
+        new_sim_path = self._simulation_data.mfpath.get_sim_path()
+        if os.path.abspath(new_file_path) == os.path.abspath(file_path):
+            return
+        copy_files = [(file_path, new_file_path)]
+        copied = set()
+        while copy_files:
+            src, dst = copy_files.pop()
+            if src in copied or not os.path.isfile(src):
+                continue
+            copied.add(src)
+            dst_folder = os.path.split(dst)[0]
+            if dst_folder and not os.path.isdir(dst_folder):
+                os.makedirs(dst_folder)
+            shutil.copyfile(src, dst)
+            if ext_file_action == ExtFileAction.copy_none:
+                continue
+            # files referenced with a relative path move with the package
+            for fname in self._referenced_file_names(src):
+                if not os.path.isabs(fname):
+                    copy_files.append((os.path.join(sim_path, fname),
+                                       os.path.join(new_sim_path, fname)))
+
+    @staticmethod
+    def _referenced_file_names(file_path):
+        # find the external files (OPEN/CLOSE) and package files (FILEIN)
+        # referenced in a package file
+        fnames = []
+        with open(file_path, 'r') as fd:
+            for line in fd:
+                arr_line = line.split('#', 1)[0].split()
+                for index, item in enumerate(arr_line[:-1]):
+                    if item.upper() in ('OPEN/CLOSE', 'FILEIN'):
+                        fnames.append(arr_line[index + 1].strip('\'"'))
+        return fnames
+
     @property
     def filename(self):
         return self._filename
@@ -1272,9 +1399,12 @@ class MFPackage(PackageContainer, PackageInterface):
     @property
     def data_list(self):
         # return [data_object, data_object, ...]
+        self._lazy_load()
         return self._data_list
 
     def _get_data_str(self, formal, show_data=True):
+        if show_data:
+            self._lazy_load()
         data_str = 'package_name = {}\nfilename = {}\npackage_type = {}' \
                    '\nmodel_or_simulation_package = {}' \
                    '\n{}_name = {}' \
@@ -1498,13 +1628,22 @@ class MFPackage(PackageContainer, PackageInterface):
             package.set_model_relative_path(model_ws)
 
     def load(self, strict=True):
+        return self._load_file(self.get_file_path(), strict)
+
+    def _load_file(self, file_path, strict=True, sim_path=None):
+        if sim_path is not None:
+            # resolve the files referenced by the package relative to
+            # sim_path while the package is loaded by this thread
+            with self._simulation_data.mfpath.loading_sim_path(sim_path):
+                return self._load_file(file_path, strict)
+
         # open file
         try:
-            fd_input_file = open(self.get_file_path(), 'r')
+            fd_input_file = open(file_path, 'r')
         except OSError as e:
             if e.errno == errno.ENOENT:
                 message = 'File {} of type {} could not be opened' \
-                          '.'.format(self.get_file_path(), self.package_type)
+                          '.'.format(file_path, self.package_type)
                 type_, value_, traceback_ = sys.exc_info()
                 raise MFDataException(self.model_name,
                                       self.package_name,
@@ -1520,6 +1659,7 @@ class MFPackage(PackageContainer, PackageInterface):
             raise ReadAsArraysException(err)
         # close file
         fd_input_file.close()
+        self._clear_modified(file_path)
 
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
@@ -1652,12 +1792,26 @@ class MFPackage(PackageContainer, PackageInterface):
                     # treat unresolved text as a comment for now
                     self._store_comment(line, found_first_block)
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(self, ext_file_action=ExtFileAction.copy_relative_paths,
+              incremental=False):
+        if self.lazy_load_pending:
+            # package data was never loaded, so it has not changed
+            self._write_lazy(ext_file_action)
+            return
+
+        package_file_path = self.get_file_path()
+        if incremental and not self.modified and \
+                self._write_path == os.path.abspath(package_file_path) and \
+                os.path.isfile(package_file_path):
+            # package file is up to date
+            return
+
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
 
+        self._store_binary_external()
+
         # create any folders in path
-        package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
@@ -1669,6 +1823,24 @@ class MFPackage(PackageContainer, PackageInterface):
         self._write_blocks(fd, ext_file_action)
 
         fd.close()
+        self._clear_modified(package_file_path)
+
+    def _store_binary_external(self):
+        binary_external = self.binary_external
+        if binary_external is None:
+            binary_external = self._simulation_data.binary_external
+        if not binary_external:
+            return
+        # move large arrays and stress period lists to binary files
+        min_size = self._simulation_data.binary_external_min_size
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if isinstance(dataset, mfdataarray.MFArray) or \
+                        (isinstance(dataset, mfdatalist.MFTransientList) and
+                         dataset.structure.name == 'stress_period_data'):
+                    file_path = '{}_{}'.format(self._filename,
+                                               dataset.structure.name)
+                    dataset._store_binary_external(file_path, min_size)
 
     def create_package_dimensions(self):
         model_dims = None
@@ -97,8 +97,8 @@ class ModflowGwf(mfmodel.MFModel):
     def load(cls, simulation, structure, modelname='NewModel',
              model_nam_file='modflowtest.nam', version='mf6',
              exe_name='mf6.exe', strict=True, model_rel_path='.',
-             load_only=None):
+             load_only=None, lazy_load=False, max_workers=None):
         return mfmodel.MFModel.load_base(simulation, structure, modelname,
                                          model_nam_file, 'gwf', version,
                                          exe_name, strict, model_rel_path,
-                                         load_only)
+                                         load_only, lazy_load, max_workers)
@@ -5,6 +5,8 @@ import sys
 import inspect
 import collections
 import os.path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from ...mbase import run_model
 from ..mfbase import PackageContainer, MFFileMgmt, ExtFileAction, \
     PackageContainerType, MFDataException, FlopyException, \
@@ -215,12 +217,26 @@ class MFSimulationData(object):
         numbers greater than this threshold are written in scientific notation
     sci_note_lower_thres : float
         numbers less than this threshold are written in scientific notation
+    binary_external : bool
+        whether large internal arrays and stress period lists are moved to
+        binary external files when the simulation is written.  Can be
+        overridden for a package with the package's binary_external attribute
+    binary_external_min_size : int
+        minimum number of array values or list rows for data to be moved to a
+        binary external file
+    memmap_min_size : int
+        minimum number of values for an array read from a text file to be
+        read into a temporary memory mapped file instead of memory.  None
+        (default) reads all arrays into memory
     mfpath : MFFileMgmt
         file path location information for the simulation
     model_dimensions : OrderedDict
         dictionary containing discretization information for each model
     mfdata : SimulationDict
         custom dictionary containing all model data for the simulation
+    lock : threading.RLock
+        lock that serializes the registration of models, packages and data
+        when they are loaded in concurrent threads
 
     """
 
@@ -247,6 +263,9 @@ class MFSimulationData(object):
         self.debug = False
         self.verbose = True
         self.verbosity_level = VerbosityLevel.normal
+        self.binary_external = False
+        self.binary_external_min_size = 10000
+        self.memmap_min_size = None
 
         self._update_str_format()
 
@@ -264,6 +283,19 @@ class MFSimulationData(object):
         # other external files referenced
         self.referenced_files = collections.OrderedDict()
 
+        # --- thread safe loading ---
+        self.lock = threading.RLock()
+
+    def __getstate__(self):
+        # locks can not be copied or pickled
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
     def set_sci_note_upper_thres(self, value):
         """Set threshold number.
 
@@ -599,7 +631,7 @@ class MFSimulation(PackageContainer):
     @classmethod
     def load(cls, sim_name='modflowsim', version='mf6', exe_name='mf6.exe',
              sim_ws='.', strict=True, verbosity_level=1, load_only=None,
-             verify_data=True):
+             verify_data=True, lazy_load=False, max_workers=None):
         """Load an existing model.
 
         Parameters
@@ -631,6 +663,17 @@ class MFSimulation(PackageContainer):
             example list: ['ic', 'maw', 'npf', 'oc', 'ims', 'gwf6-gwf6']
         verify_data : bool
             verify data when it is loaded. this can slow down loading
+        lazy_load : bool
+            only load the name files and the discretization packages of
+            each model and defer loading the data of the other model
+            packages until the package data is first accessed.  packages
+            that are never accessed are copied unchanged when the
+            simulation is written.
+        max_workers : int
+            maximum number of threads used to load the models, and the
+            packages of each model, concurrently.  the threads are split
+            between the models and the packages of each model.  default is
+            None, which loads the models and packages one after another.
 
         Returns
         -------
@@ -682,17 +725,35 @@ class MFSimulation(PackageContainer):
                                   model=instance.name,
                                   package='nam',
                                   message=message)
+        if max_workers is None or len(models) < 2:
+            model_workers = 1
+            package_workers = max_workers
+        else:
+            # split the threads between the models and the packages of
+            # each model, so that at most max_workers threads are used
+            model_workers = min(max_workers, len(models))
+            package_workers = max(max_workers // model_workers, 1)
+        model_args = []
         for item in models:
             # resolve model working folder and name file
             path, name_file = os.path.split(item[1])
             model_obj = PackageContainer.model_factory(item[0][:-1].lower())
-            # load model
-            if verbosity_level.value >= VerbosityLevel.normal.value:
-                print('  loading model {}...'.format(item[0].lower()))
-            instance._models[item[2]] = model_obj.load(
-                instance,
-                instance.structure.model_struct_objs[item[0].lower()], item[2],
-                name_file, version, exe_name, strict, path, load_only)
+            model_args.append((item[2], (
+                model_obj.load, item[0].lower(), instance,
+                instance.structure.model_struct_objs[item[0].lower()],
+                item[2], name_file, version, exe_name, strict, path,
+                load_only, lazy_load, package_workers)))
+        if model_workers == 1:
+            for model_name, args in model_args:
+                instance._models[model_name] = cls._load_model(*args)
+        else:
+            # models are independent, load them concurrently
+            with ThreadPoolExecutor(max_workers=model_workers) as executor:
+                futures = [(model_name, executor.submit(cls._load_model,
+                                                        *args))
+                           for model_name, args in model_args]
+                for model_name, future in futures:
+                    instance._models[model_name] = future.result()
 
         # load exchange packages and dependent packages
         try:
@@ -800,9 +861,21 @@ class MFSimulation(PackageContainer):
                           '.'.format(ims_file._get_pname()))
                 ims_file.load(strict)
 
+        # registering the loaded packages sets the simulation name file data
+        # to the values that were read
+        instance.name_file._clear_modified(instance.name_file.get_file_path())
+
         instance.simulation_data.mfpath.set_last_accessed_path()
         return instance
 
+    @staticmethod
+    def _load_model(load, model_type, simulation, *args):
+        # load a model, called with the arguments of the model type's load
+        if simulation.simulation_data.verbosity_level.value >= \
+                VerbosityLevel.normal.value:
+            print('  loading model {}...'.format(model_type))
+        return load(simulation, *args)
+
     def load_package(self, ftype, fname, pname, strict, ref_path,
                      dict_package_name=None, parent_package=None):
         """Load a package from a file.
@@ -825,6 +898,14 @@ class MFSimulation(PackageContainer):
             parent package
 
         """
+        # packages can be loaded in concurrent threads, register the
+        # package with the simulation one thread at a time
+        with self.simulation_data.lock:
+            return self._load_package(ftype, fname, pname, strict, ref_path,
+                                      dict_package_name, parent_package)
+
+    def _load_package(self, ftype, fname, pname, strict, ref_path,
+                      dict_package_name=None, parent_package=None):
         if ftype == 'gnc':
             if fname not in self._ghost_node_files:
                 # get package type from parent package
@@ -1017,7 +1098,7 @@ class MFSimulation(PackageContainer):
 
     def write_simulation(self,
                          ext_file_action=ExtFileAction.copy_relative_paths,
-                         silent=False):
+                         silent=False, incremental=False):
         """Write the simulation to files.
 
         Parameters
@@ -1028,6 +1109,10 @@ class MFSimulation(PackageContainer):
                 paths fixed.
             silent : bool
                 writes out the simulation in silent mode (verbosity_level = 0)
+            incremental : bool
+                only write packages that were modified since they were loaded
+                or last written, or whose file path changed.  Changes made
+                directly to arrays returned by get_data are not detected.
 
         """
         saved_verb_lvl = self.simulation_data.verbosity_level
@@ -1039,13 +1124,15 @@ class MFSimulation(PackageContainer):
                 VerbosityLevel.normal.value:
             print('writing simulation...')
             print('  writing simulation name file...')
-        self.name_file.write(ext_file_action=ext_file_action)
+        self.name_file.write(ext_file_action=ext_file_action,
+                             incremental=incremental)
 
         # write TDIS file
         if self.simulation_data.verbosity_level.value >= \
                 VerbosityLevel.normal.value:
             print('  writing simulation tdis package...')
-        self._tdis_file.write(ext_file_action=ext_file_action)
+        self._tdis_file.write(ext_file_action=ext_file_action,
+                              incremental=incremental)
 
         # write ims files
         for ims_file in self._ims_files.values():
@@ -1053,11 +1140,12 @@ class MFSimulation(PackageContainer):
                     VerbosityLevel.normal.value:
                 print('  writing ims package {}...'.format(
                     ims_file._get_pname()))
-            ims_file.write(ext_file_action=ext_file_action)
+            ims_file.write(ext_file_action=ext_file_action,
+                           incremental=incremental)
 
         # write exchange files
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            exchange_file.write(incremental=incremental)
             if hasattr(exchange_file, 'gnc_filerecord') and \
                     exchange_file.gnc_filerecord.has_data():
                 try:
@@ -1075,7 +1163,8 @@ class MFSimulation(PackageContainer):
                         print('  writing gnc package {}...'.format(
                             self._ghost_node_files[gnc_file]._get_pname()))
                     self._ghost_node_files[gnc_file].write(
-                        ext_file_action=ext_file_action)
+                        ext_file_action=ext_file_action,
+                        incremental=incremental)
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
@@ -1100,7 +1189,8 @@ class MFSimulation(PackageContainer):
                         print('  writing mvr package {}...'.format(
                             self._mover_files[mvr_file]._get_pname()))
                     self._mover_files[mvr_file].write(
-                        ext_file_action=ext_file_action)
+                        ext_file_action=ext_file_action,
+                        incremental=incremental)
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
@@ -1127,7 +1217,8 @@ class MFSimulation(PackageContainer):
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('  writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            pp.write(ext_file_action=ext_file_action,
+                     incremental=incremental)
 
         # FIX: model working folder should be model name file folder
 
@@ -1136,7 +1227,8 @@ class MFSimulation(PackageContainer):
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('  writing model {}...'.format(model.name))
-            model.write(ext_file_action=ext_file_action)
+            model.write(ext_file_action=ext_file_action,
+                        incremental=incremental)
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
@@ -599,7 +599,8 @@ class Modflow(BaseModel):
 
     @staticmethod
     def load(f, version='mf2005', exe_name='mf2005.exe', verbose=False,
-             model_ws='.', load_only=None, forgive=False, check=True):
+             model_ws='.', load_only=None, forgive=False, check=True,
+             max_workers=None):
         """
         Load an existing MODFLOW model.
 
@@ -627,6 +628,13 @@ class Modflow(BaseModel):
             useful for debugging. Default False.
         check : boolean, optional
             Check model input for common errors. Default True.
+        max_workers : int, optional
+            Maximum number of threads used to load the packages
+            concurrently.  The discretization, BAS6, ZONE, MULT and PVAL
+            files are loaded first, and changes that the other packages
+            make to the model are made in name file order, so the loaded
+            model is the same as a model loaded serially.  Default is None,
+            which loads the packages serially.
 
         Returns
         -------
@@ -765,46 +773,41 @@ class Modflow(BaseModel):
             ml.mfpar.set_mult(ml, ext_unit_dict)
             assert ml.pop_key_list.pop() == ext_pkg_d.get('MULT')
 
-        # try loading packages in ext_unit_dict
-        for key, item in ext_unit_dict.items():
+        def load_item(key, item):
+            # load a package in ext_unit_dict; the model and the lists of
+            # files are updated in name file order when the packages are
+            # loaded concurrently
+            error = None
+            if item.package is not None and item.filetype in load_only:
+                package_load_args = getfullargspec(item.package.load)[0]
+                try:
+                    if "check" in package_load_args:
+                        item.package.load(item.filehandle, ml,
+                                          ext_unit_dict=ext_unit_dict,
+                                          check=False)
+                    else:
+                        item.package.load(item.filehandle, ml,
+                                          ext_unit_dict=ext_unit_dict)
+                except Exception as e:
+                    if not forgive:
+                        raise
+                    error = e
+            ml._wait_for_load_turn()
             if item.package is not None:
                 if item.filetype in load_only:
-                    package_load_args = getfullargspec(item.package.load)[0]
-                    if forgive:
-                        try:
-                            if "check" in package_load_args:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict,
-                                                  check=False)
-                            else:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict)
-                            files_successfully_loaded.append(item.filename)
-                            if ml.verbose:
-                                print('   {:4s} package load...success'
-                                      .format(item.filetype))
-                        except Exception as e:
-                            ml.load_fail = True
-                            if ml.verbose:
-                                msg = 3 * ' ' + \
-                                      '{:4s} '.format(item.filetype) + \
-                                      'package load...failed\n' + \
-                                      3 * ' ' + '{!s}'.format(e)
-                                print(msg)
-                            files_not_loaded.append(item.filename)
-                    else:
-                        if "check" in package_load_args:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict,
-                                              check=False)
-                        else:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict)
+                    if error is None:
                         files_successfully_loaded.append(item.filename)
                         if ml.verbose:
                             msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
                                   'package load...success'
                             print(msg)
+                    else:
+                        ml.load_fail = True
+                        if ml.verbose:
+                            msg = ('   {:4s} package load...failed\n'
+                                   '   {!s}'.format(item.filetype, error))
+                            print(msg)
+                        files_not_loaded.append(item.filename)
                 else:
                     if ml.verbose:
                         msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
@@ -834,6 +837,29 @@ class Modflow(BaseModel):
             else:
                 raise KeyError('unhandled case: {}, {}'.format(key, item))
 
+        # try loading packages in ext_unit_dict
+        items = list(ext_unit_dict.items())
+        if max_workers is None:
+            for key, item in items:
+                load_item(key, item)
+        else:
+            # the packages use bas6 to determine if the input is in free
+            # format, so the entries up to bas6 are loaded first
+            keys = [key for key, item in items]
+            nfirst = keys.index(bas_key) + 1 if bas_key in keys else 0
+            for key, item in items[:nfirst]:
+                load_item(key, item)
+            # names of the packages that the concurrent loads can add
+            names = []
+            for key, item in items[nfirst:]:
+                names.append(item.filetype)
+                try:
+                    names.append(item.package.ftype())
+                except (AttributeError, TypeError):
+                    pass
+            ml._load_ordered(load_item, items[nfirst:],
+                             max_workers=max_workers, names=names)
+
         # pop binary output keys and any external file units that are now
         # internal
         for key in ml.pop_key_list:
@@ -14,7 +14,6 @@ import webbrowser as wb
 import numpy as np
 from numpy.lib.recfunctions import stack_arrays
 
-from .modflow.mfparbc import ModflowParBc as mfparbc
 from .utils import Util2d, Util3d, Transient2d, MfList, check
 from .utils import OptionBlock
 from .utils.flopy_io import ulstrd
@@ -92,6 +91,9 @@ class Package(PackageInterface):
         """
         # To be able to access the parent model object's attributes
         self.parent = parent
+        # packages that are loaded concurrently inspect and change the
+        # model in name file order
+        parent._wait_for_load_turn()
         if not isinstance(extension, list):
             extension = [extension]
         self.extension = []
@@ -798,6 +800,8 @@ class Package(PackageInterface):
 
         # read parameter data
         if nppak > 0:
+            # imported here because flopy.modflow imports this module
+            from .modflow.mfparbc import ModflowParBc as mfparbc
             dt = pak_type.get_empty(1, aux_names=aux_names,
                                     structured=model.structured).dtype
             pak_parms = mfparbc.load(f, nppak, dt, model, ext_unit_dict,
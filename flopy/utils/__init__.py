@@ -20,29 +20,77 @@
     --------
 
     """
-from .mfreadnam import parsenamefile
-from .util_array import Util3d, Util2d, Transient2d, Transient3d, read1d
-from .util_list import MfList
-from .binaryfile import BinaryHeader, HeadFile, UcnFile, CellBudgetFile, \
-    HeadUFile
-from .formattedfile import FormattedHeadFile
-from .modpathfile import PathlineFile, EndpointFile, TimeseriesFile
-from .swroutputfile import SwrStage, SwrBudget, SwrFlow, SwrExchange, \
-    SwrStructure
-from .observationfile import HydmodObs, SwrObs, Mf6Obs
-from .reference import SpatialReference, SpatialReferenceUnstructured, \
-    crs, TemporalReference
-from .mflistfile import MfListBudget, MfusgListBudget, SwtListBudget, \
-    SwrListBudget, Mf6ListBudget
+import sys
+import importlib
+
+# check is imported when flopy.utils is imported, because the name of the
+# class is also the name of the module
 from .check import check, get_neighbors
-from .utils_def import FlopyBinaryData, totim_to_datetime
-from .flopy_io import read_fixed_var, write_fixed_var
-from .zonbud import ZoneBudget, read_zbarray, write_zbarray
-from .mfgrdfile import MfGrdFile
-from .postprocessing import get_transmissivities
-from .sfroutputfile import SfrFile
-from .recarray_utils import create_empty_recarray, ra_slice
-from .mtlistfile import MtListBudget
-from .optionblock import OptionBlock
-from .rasters import Raster
-from .gridintersect import GridIntersect,ModflowGridIndices
\ No newline at end of file
+
+# the other classes and functions are imported the first time they are
+# accessed, so that only the modules that are used are imported
+_attributes = {
+    'parsenamefile': 'mfreadnam',
+    'Util3d': 'util_array', 'Util2d': 'util_array',
+    'Transient2d': 'util_array', 'Transient3d': 'util_array',
+    'read1d': 'util_array',
+    'MfList': 'util_list',
+    'BinaryHeader': 'binaryfile', 'HeadFile': 'binaryfile',
+    'UcnFile': 'binaryfile', 'CellBudgetFile': 'binaryfile',
+    'HeadUFile': 'binaryfile',
+    'read_ensemble': 'ensemble',
+    'run_parameter_sweep': 'parametersweep',
+    'FormattedHeadFile': 'formattedfile',
+    'PathlineFile': 'modpathfile', 'EndpointFile': 'modpathfile',
+    'TimeseriesFile': 'modpathfile',
+    'SwrStage': 'swroutputfile', 'SwrBudget': 'swroutputfile',
+    'SwrFlow': 'swroutputfile', 'SwrExchange': 'swroutputfile',
+    'SwrStructure': 'swroutputfile',
+    'HydmodObs': 'observationfile', 'SwrObs': 'observationfile',
+    'Mf6Obs': 'observationfile',
+    'SpatialReference': 'reference',
+    'SpatialReferenceUnstructured': 'reference', 'crs': 'reference',
+    'TemporalReference': 'reference',
+    'MfListBudget': 'mflistfile', 'MfusgListBudget': 'mflistfile',
+    'SwtListBudget': 'mflistfile', 'SwrListBudget': 'mflistfile',
+    'Mf6ListBudget': 'mflistfile',
+    'FlopyBinaryData': 'utils_def', 'totim_to_datetime': 'utils_def',
+    'read_fixed_var': 'flopy_io', 'write_fixed_var': 'flopy_io',
+    'ZoneBudget': 'zonbud', 'read_zbarray': 'zonbud',
+    'write_zbarray': 'zonbud',
+    'MfGrdFile': 'mfgrdfile',
+    'get_transmissivities': 'postprocessing',
+    'SfrFile': 'sfroutputfile',
+    'create_empty_recarray': 'recarray_utils', 'ra_slice': 'recarray_utils',
+    'MtListBudget': 'mtlistfile',
+    'OptionBlock': 'optionblock',
+    'Raster': 'rasters',
+    'GridIntersect': 'gridintersect', 'ModflowGridIndices': 'gridintersect'}
+
+__all__ = ['check', 'get_neighbors'] + list(_attributes.keys())
+
+
+def __getattr__(name):
+    if name in _attributes:
+        module = importlib.import_module('.' + _attributes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    # modules of flopy.utils that have not been imported yet
+    try:
+        return importlib.import_module('.' + name, __name__)
+    except ImportError as e:
+        if e.name != '{}.{}'.format(__name__, name):
+            raise
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_attributes.keys()))
+
+
+# module level __getattr__ requires python 3.7
+if sys.version_info[0:2] < (3, 7):
+    for _name in _attributes:
+        __getattr__(_name)
@@ -9,6 +9,7 @@ important classes that can be accessed by the user.
 
 """
 from __future__ import print_function
+import os
 import numpy as np
 import warnings
 from collections import OrderedDict
@@ -249,6 +250,79 @@ def get_headfile_precision(filename):
     return result
 
 
+def _index_file_key(filename, **kwargs):
+    """
+    Create the key used to validate a cached record index.  The key
+    contains the size and modification time of the binary file and any
+    additional settings that affect how the index is built.
+
+    """
+    stat = os.stat(filename)
+    key = ['version=1', 'size={}'.format(stat.st_size),
+           'mtime={}'.format(stat.st_mtime_ns)]
+    for k in sorted(kwargs.keys()):
+        key.append('{}={}'.format(k, kwargs[k]))
+    return ';'.join(key)
+
+
+def _load_index_file(filename, key):
+    """
+    Load a record index saved with _save_index_file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the index file.
+    key : str
+        Key created by _index_file_key for the current binary file.
+
+    Returns
+    -------
+    index : dict or None
+        Dictionary of index arrays, or None if the index file does not
+        exist or was created for a different version of the binary file.
+
+    """
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with np.load(filename, allow_pickle=False) as f:
+            if str(f['key']) != key:
+                return None
+            index = {name: f[name] for name in f.files if name != 'key'}
+    except (IOError, OSError, ValueError, KeyError):
+        return None
+    return index
+
+
+def _save_index_file(filename, key, **arrays):
+    """
+    Save a record index so that it can be reused the next time the binary
+    file is opened.  The index is written to a temporary file first so
+    that other processes never read a partially written index.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the index file.
+    key : str
+        Key created by _index_file_key for the current binary file.
+    arrays : numpy arrays
+        Index arrays to save.
+
+    """
+    tmpname = '{}.{}.tmp'.format(filename, os.getpid())
+    try:
+        with open(tmpname, 'wb') as f:
+            np.savez(f, key=np.array(key), **arrays)
+        os.replace(tmpname, filename)
+    except (IOError, OSError) as e:
+        if os.path.isfile(tmpname):
+            os.remove(tmpname)
+        warnings.warn('could not write index file {}: {}'.format(filename, e))
+    return
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -256,7 +330,12 @@ class BinaryLayerFile(LayerFile):
 
     """
 
-    def __init__(self, filename, precision, verbose, kwargs):
+    def __init__(self, filename, precision, verbose, kwargs, mmap=False,
+                 cache_index=False):
+        self.mmap = mmap
+        self.cache_index = cache_index
+        self._mmap_buffer = None
+        self._mmap_records = None
         super(BinaryLayerFile, self).__init__(filename, precision, verbose,
                                               kwargs)
         return
@@ -285,6 +364,24 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
+        if self.mmap:
+            self._mmap_buffer = np.memmap(self.filename, dtype=np.uint8,
+                                          mode='r')
+            if self._build_mmap_index(header):
+                return
+        if self.cache_index:
+            index_key = _index_file_key(self.filename,
+                                        precision=self.precision,
+                                        text=self.text.decode())
+            index = _load_index_file(self.filename + '.idx', index_key)
+            if index is not None:
+                self.recordarray = index['recordarray']
+                self.iposarray = index['iposarray']
+                self.times = list(index['times'])
+                self.kstpkper = [tuple(kk) for kk in
+                                 index['kstpkper'].tolist()]
+                self.nlay = np.max(self.recordarray['ilay'])
+                return
         ipos = 0
         while ipos < self.totalbytes:
             header = self._get_header()
@@ -311,8 +408,120 @@ class BinaryLayerFile(LayerFile):
         self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
         self.iposarray = np.array(self.iposarray)
         self.nlay = np.max(self.recordarray['ilay'])
+        if self.cache_index:
+            _save_index_file(self.filename + '.idx', index_key,
+                             recordarray=self.recordarray,
+                             iposarray=self.iposarray,
+                             times=np.array(self.times, dtype=self.realtype),
+                             kstpkper=np.array(self.kstpkper,
+                                               dtype=np.int32).reshape(-1, 2))
         return
 
+    def _build_mmap_index(self, header):
+        """
+        Build the recordarray and iposarray directly from a memory map of
+        the file when every record has the same header and data size.  The
+        record offsets are computed from the fixed record stride instead of
+        reading each header in turn.
+
+        Parameters
+        ----------
+        header : numpy.void
+            first header in the file
+
+        Returns
+        -------
+        success : bool
+            False if the file layout is not regular, in which case the
+            index needs to be built by reading the file sequentially.
+
+        """
+        hdrbytes = self.header_dtype.itemsize
+        databytes = int(self.get_databytes(header))
+        recbytes = hdrbytes + databytes
+        if recbytes <= hdrbytes or self.totalbytes % recbytes != 0:
+            return False
+        nval = databytes // self.realtype(1).nbytes
+        dtype = np.dtype([('header', self.header_dtype),
+                          ('data', self.realtype, (nval,))])
+        records = np.ndarray(shape=(self.totalbytes // recbytes,),
+                             dtype=dtype, buffer=self._mmap_buffer)
+        headers = records['header']
+
+        # make sure the stride assumption holds for every record
+        if not np.all(headers['nrow'] == header['nrow']) or \
+                not np.all(headers['ncol'] == header['ncol']):
+            return False
+        if not np.all(np.char.find(headers['text'], self.text.upper()) >= 0):
+            return False
+
+        self.recordarray = np.array(headers, dtype=self.header_dtype)
+        self.iposarray = np.arange(records.shape[0], dtype=np.int64) * \
+                         recbytes + hdrbytes
+        totim = self.recordarray['totim']
+        inew = np.ones(totim.shape, dtype=bool)
+        inew[1:] = totim[1:] != totim[:-1]
+        self.times = totim[inew].tolist()
+        self.kstpkper = list(zip(self.recordarray['kstp'][inew].tolist(),
+                                 self.recordarray['kper'][inew].tolist()))
+        self.nlay = np.max(self.recordarray['ilay'])
+        self._mmap_records = records
+        return True
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        If the file was opened with mmap=True and the layers for totim are
+        stored consecutively, a read-only view of the memory map is returned
+        instead of a copy.
+
+        """
+        if self._mmap_buffer is None:
+            return super(BinaryLayerFile, self)._get_data_array(totim)
+
+        if totim >= 0.:
+            keyindices = np.where((self.recordarray['totim'] == totim))[0]
+            if len(keyindices) == 0:
+                msg = 'totim value ({}) not found in file...'.format(totim)
+                raise Exception(msg)
+        else:
+            raise Exception('Data not found...')
+
+        idx = keyindices[0]
+        nrow = self.recordarray['nrow'][idx]
+        ncol = self.recordarray['ncol'][idx]
+        if self._mmap_records is not None:
+            ilay = self.recordarray['ilay'][keyindices]
+            if keyindices.shape[0] == self.nlay and \
+                    np.all(np.diff(keyindices) == 1) and \
+                    np.array_equal(ilay, np.arange(1, self.nlay + 1)):
+                data = self._mmap_records['data'][idx:idx + self.nlay]
+                return data.reshape((self.nlay, nrow, ncol))
+
+        # layers are missing or out of order, so assemble a new array
+        data = np.empty((self.nlay, nrow, ncol), dtype=self.realtype)
+        data[:, :, :] = np.nan
+        for idx in keyindices:
+            ipos = self.iposarray[idx]
+            ilay = self.recordarray['ilay'][idx]
+            if self.verbose:
+                msg = 'Byte position in file: {} for '.format(ipos) + \
+                      'layer {}'.format(ilay)
+                print(msg)
+            nrow = self.recordarray['nrow'][idx]
+            ncol = self.recordarray['ncol'][idx]
+            data[ilay - 1] = self._get_mmap_view(ipos, (nrow, ncol))
+        return data
+
+    def _get_mmap_view(self, ipos, shp):
+        """
+        Return a read-only view of an array of shape shp that starts at
+        byte position ipos of the memory mapped file.
+
+        """
+        return np.ndarray(shape=shp, dtype=self.realtype,
+                          buffer=self._mmap_buffer, offset=int(ipos))
+
     def get_databytes(self, header):
         """
 
@@ -379,25 +588,72 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = header[
-                           'ilay'] - 1  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = np.long(self.iposarray[irec])
+        # pair each record with the row(s) in result having the same time
+        timeindex = {}
+        for itim, totim in enumerate(result[:, 0]):
+            timeindex.setdefault(totim, []).append(itim)
+        irecs, itims = [], []
+        for irec, totim in enumerate(self.recordarray['totim']):
+            for itim in timeindex.get(totim, []):
+                irecs.append(irec)
+                itims.append(itim)
+        irecs = np.array(irecs, dtype=np.int64)
+        itims = np.array(itims, dtype=np.int64)
+
+        # change ilay from header to zero-based
+        ilays = self.recordarray['ilay'][irecs] - 1
+
+        # process the cells one layer at a time so that each record is
+        # only read once
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        nodes = kij[:, 1] * self.ncol + kij[:, 2]
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            isel = np.where(ilays == k)[0]
+            values = self._read_values(irecs[isel], nodes[istat])
+            result[itims[isel, np.newaxis], istat + 1] = values
+        return result
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + np.long(ioffset), 0)
+    def _read_values(self, irecs, nodes):
+        """
+        Read the values at the zero-based positions nodes from the data
+        arrays of the records irecs.
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header['totim'])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
-        return result
+        Returns
+        -------
+        values : numpy array
+            Array has size (len(irecs), len(nodes)).
+
+        """
+        if self._mmap_records is not None:
+            data = self._mmap_records['data']
+            return data[irecs[:, np.newaxis], nodes]
+
+        # read the span of the record that contains all of the nodes
+        n0 = nodes.min()
+        nval = nodes.max() - n0 + 1
+        ioffset = n0 * self.realtype(1).nbytes
+        values = np.empty((irecs.shape[0], nodes.shape[0]),
+                          dtype=self.realtype)
+        for n, irec in enumerate(irecs):
+            ipos = self.iposarray[irec] + ioffset
+            if self._mmap_buffer is not None:
+                v = self._get_mmap_view(ipos, (nval,))
+            else:
+                self.file.seek(ipos, 0)
+                v = binaryread(self.file, self.realtype, shape=(nval,))
+            values[n] = v[nodes - n0]
+        return values
+
+    def close(self):
+        """
+        Close the file handle and release the memory map, if used.
+
+        """
+        self._mmap_records = None
+        self._mmap_buffer = None
+        super(BinaryLayerFile, self).close()
+        return
 
 
 class HeadFile(BinaryLayerFile):
@@ -414,6 +670,15 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Access the file through a read-only numpy memory map.  Record
+        positions are computed from the record size when all records have
+        the same size, and get_data returns read-only views of the file
+        instead of copies when possible.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx') and
+        reuse it the next time the file is opened, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -452,7 +717,8 @@ class HeadFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='head', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False,
+                 **kwargs):
         self.text = text.encode()
         if precision == 'auto':
             precision = get_headfile_precision(filename)
@@ -463,7 +729,9 @@ class HeadFile(BinaryLayerFile):
                 raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Head',
                                                    precision=precision)
-        super(HeadFile, self).__init__(filename, precision, verbose, kwargs)
+        super(HeadFile, self).__init__(filename, precision, verbose, kwargs,
+                                       mmap=mmap,
+                                       cache_index=cache_index)
         return
 
 
@@ -481,6 +749,15 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Access the file through a read-only numpy memory map.  Record
+        positions are computed from the record size when all records have
+        the same size, and get_data returns read-only views of the file
+        instead of copies when possible.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx') and
+        reuse it the next time the file is opened, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -514,7 +791,8 @@ class UcnFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='concentration', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False,
+                 **kwargs):
         self.text = text.encode()
         if precision == 'auto':
             precision = get_headfile_precision(filename)
@@ -525,7 +803,9 @@ class UcnFile(BinaryLayerFile):
             raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Ucn',
                                                    precision=precision)
-        super(UcnFile, self).__init__(filename, precision, verbose, kwargs)
+        super(UcnFile, self).__init__(filename, precision, verbose, kwargs,
+                                      mmap=mmap,
+                                      cache_index=cache_index)
         return
 
 
@@ -541,6 +821,10 @@ class CellBudgetFile(object):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx') and
+        reuse it the next time the file is opened, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -564,10 +848,12 @@ class CellBudgetFile(object):
 
     """
 
-    def __init__(self, filename, precision='single', verbose=False, **kwargs):
+    def __init__(self, filename, precision='single', verbose=False,
+                 cache_index=False, **kwargs):
         self.filename = filename
         self.precision = precision
         self.verbose = verbose
+        self.cache_index = cache_index
         self.file = open(self.filename, 'rb')
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
@@ -680,6 +966,20 @@ class CellBudgetFile(object):
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
         self.recorddict = OrderedDict()
+        if self.cache_index:
+            index_key = _index_file_key(self.filename,
+                                        precision=self.precision,
+                                        dis=self.dis is not None)
+            index = _load_index_file(self.filename + '.idx', index_key)
+            if index is not None:
+                self._set_index(index)
+                return
+
+        # sets for fast membership tests of the unique values
+        times = set()
+        kstpkpers = set()
+        texts = set()
+        paknams = set()
         ipos = 0
         while ipos < self.totalbytes:
             self.iposheader.append(ipos)
@@ -690,15 +990,19 @@ class CellBudgetFile(object):
                 totim = self._totim_from_kstpkper(
                     (header["kstp"] - 1, header["kper"] - 1))
                 header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
+            if totim >= 0 and totim not in times:
+                times.add(totim)
                 self.times.append(totim)
             kstpkper = (header['kstp'], header['kper'])
-            if kstpkper not in self.kstpkper:
+            if kstpkper not in kstpkpers:
+                kstpkpers.add(kstpkper)
                 self.kstpkper.append(kstpkper)
-            if header['text'] not in self.textlist:
+            if header['text'] not in texts:
+                texts.add(header['text'])
                 self.textlist.append(header['text'])
                 self.imethlist.append(header['imeth'])
-            if header['paknam'] not in self.paknamlist:
+            if header['paknam'] not in paknams:
+                paknams.add(header['paknam'])
                 self.paknamlist.append(header['paknam'])
             ipos = self.file.tell()
 
@@ -732,8 +1036,110 @@ class CellBudgetFile(object):
         self.iposheader = np.array(self.iposheader, dtype=np.int64)
         self.iposarray = np.array(self.iposarray, dtype=np.int64)
         self.nper = self.recordarray["kper"].max()
+        if self.cache_index:
+            _save_index_file(self.filename + '.idx', index_key,
+                             recordarray=self.recordarray,
+                             iposheader=self.iposheader,
+                             iposarray=self.iposarray,
+                             times=np.array(self.times, dtype=self.realtype),
+                             kstpkper=np.array(self.kstpkper,
+                                               dtype=np.int32).reshape(-1, 2),
+                             textlist=np.array(self.textlist, dtype='S16'),
+                             imethlist=np.array(self.imethlist,
+                                                dtype=np.int32),
+                             paknamlist=np.array(self.paknamlist,
+                                                 dtype='S16'))
+        self._build_record_index()
         return
 
+    def _set_index(self, index):
+        """
+        Set the record index from a dictionary of index arrays loaded from
+        a sidecar index file.
+
+        """
+        self.recordarray = index['recordarray']
+        self.iposheader = index['iposheader']
+        self.iposarray = index['iposarray']
+        self.times = list(index['times'])
+        self.kstpkper = [tuple(kk) for kk in index['kstpkper'].tolist()]
+        self.textlist = list(index['textlist'])
+        self.imethlist = list(index['imethlist'])
+        self.paknamlist = list(index['paknamlist'])
+        self.nrecords = self.recordarray.shape[0]
+        for header, ipos in zip(self.recordarray, self.iposarray):
+            self.recorddict[tuple(header)] = ipos
+        self.nper = self.recordarray["kper"].max()
+        self._build_record_index()
+        return
+
+    def _build_record_index(self):
+        """
+        Build dictionaries that map (kstp, kper), totim, text and package
+        name values, and combinations of them, to the zero-based record
+        numbers so that records can be selected without searching the
+        full recordarray.
+
+        """
+        self._kstpkper_index = OrderedDict()
+        self._kstpkper_text_index = OrderedDict()
+        self._totim_index = OrderedDict()
+        self._totim_text_index = OrderedDict()
+        self._text_index = OrderedDict()
+        self._paknam_index = OrderedDict()
+        for irec, (kstp, kper, totim, text, paknam) in enumerate(
+                zip(self.recordarray['kstp'].tolist(),
+                    self.recordarray['kper'].tolist(),
+                    self.recordarray['totim'].tolist(),
+                    self.recordarray['text'].tolist(),
+                    self.recordarray['paknam'].tolist())):
+            self._kstpkper_index.setdefault((kstp, kper), []).append(irec)
+            self._kstpkper_text_index.setdefault((kstp, kper, text),
+                                                 []).append(irec)
+            self._totim_index.setdefault(totim, []).append(irec)
+            self._totim_text_index.setdefault((totim, text), []).append(irec)
+            self._text_index.setdefault(text, []).append(irec)
+            self._paknam_index.setdefault(paknam, set()).add(irec)
+        return
+
+    def _totim_key(self, totim):
+        """
+        Convert totim to the key used in the record index dictionaries.
+        totim is rounded to the precision of the budget file so that it
+        matches the values stored in the recordarray.
+
+        """
+        return float(self.realtype(totim))
+
+    def _select_records(self, kstpkper=None, totim=None, text16=None,
+                        paknam16=None):
+        """
+        Get the zero-based record numbers for the specified one-based
+        (kstp, kper) or totim value, optionally restricted to the
+        records with the specified text and package name.
+
+        """
+        if text16 is not None:
+            text16 = bytes(text16)
+        if kstpkper is not None:
+            if text16 is None:
+                indices = self._kstpkper_index.get(tuple(kstpkper), [])
+            else:
+                key = tuple(kstpkper) + (text16,)
+                indices = self._kstpkper_text_index.get(key, [])
+        elif totim is not None:
+            totim = self._totim_key(totim)
+            if text16 is None:
+                indices = self._totim_index.get(totim, [])
+            else:
+                indices = self._totim_text_index.get((totim, text16), [])
+        else:
+            indices = self._text_index.get(text16, [])
+        if paknam16 is not None:
+            paknam_indices = self._paknam_index.get(bytes(paknam16), set())
+            indices = [idx for idx in indices if idx in paknam_indices]
+        return list(indices)
+
     def _skip_record(self, header):
         """
         Skip over this record, not counting header and header2.
@@ -985,9 +1391,8 @@ class CellBudgetFile(object):
         # check and make sure that text is in file
         if text is not None:
             text16 = self._find_text(text)
-            select_indices = np.where((self.recordarray['text'] == text16))
-            if isinstance(select_indices, tuple):
-                select_indices = select_indices[0]
+            select_indices = np.array(self._select_records(text16=text16),
+                                      dtype=np.int64)
         else:
             select_indices = None
         return select_indices
@@ -1082,46 +1487,14 @@ class CellBudgetFile(object):
         if kstpkper is not None:
             kstp1 = kstpkper[0] + 1
             kper1 = kstpkper[1] + 1
-            if text is None and paknam is None:
-                select_indices = np.where(
-                    (self.recordarray['kstp'] == kstp1) &
-                    (self.recordarray['kper'] == kper1))
-            else:
-                if paknam is None and text is not None:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['text'] == text16))
-                elif text is None and paknam is not None:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['paknam'] == paknam16))
-                else:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['text'] == text16) &
-                        (self.recordarray['paknam'] == paknam16))
+            select_indices = self._select_records(kstpkper=(kstp1, kper1),
+                                                  text16=text16,
+                                                  paknam16=paknam16)
 
         elif totim is not None:
-            if text is None and paknam is None:
-                select_indices = np.where(
-                    (self.recordarray['totim'] == totim))
-            else:
-                if paknam is None and text is not None:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['text'] == text16))
-                elif text is None and paknam is not None:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['paknam'] == paknam16))
-                else:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['text'] == text16) &
-                        (self.recordarray['paknam'] == paknam16))
+            select_indices = self._select_records(totim=totim,
+                                                  text16=text16,
+                                                  paknam16=paknam16)
 
         # allow for idx to be a list or a scalar
         elif idx is not None:
@@ -1132,7 +1505,7 @@ class CellBudgetFile(object):
 
         # case where only text is entered
         elif text is not None:
-            select_indices = np.where((self.recordarray['text'] == text16))
+            select_indices = self._select_records(text16=text16)
 
         else:
             raise TypeError(
@@ -1140,8 +1513,6 @@ class CellBudgetFile(object):
                 "'idx', or 'text'")
 
         # build and return the record list
-        if isinstance(select_indices, tuple):
-            select_indices = select_indices[0]
         recordlist = []
         for idx in select_indices:
             rec = self.get_record(idx, full3D=full3D)
@@ -1213,18 +1584,84 @@ class CellBudgetFile(object):
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
-        for itim, k in enumerate(kk):
-            v = self.get_data(kstpkper=k, text=text, full3D=True)
+        text16 = self._find_text(text)
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        for itim, (kstp, kper) in enumerate(kk):
+            select_indices = self._select_records(kstpkper=(kstp + 1,
+                                                            kper + 1),
+                                                  text16=text16)
             # skip missing data - required for storage
-            if len(v) > 0:
-                v = v[0]
-                istat = 1
-                for k, i, j in kijlist:
-                    result[itim, istat] = v[k, i, j].copy()
-                    istat += 1
+            if len(select_indices) > 0:
+                result[itim, 1:] = self._read_cell_values(select_indices[0],
+                                                          kij)
 
         return result
 
+    def _read_cell_values(self, idx, kij):
+        """
+        Read the values for the zero-based (layer, row, column) cells in
+        kij from record idx.  Only the values for the requested cells are
+        read from full array records, and list records are reduced to the
+        requested cells without building the full three dimensional array.
+        Cells that are not in a list record are returned as zero.
+
+        Returns
+        -------
+        values : numpy array
+            Array has size (len(kij),).
+
+        """
+        header = self.recordarray[idx]
+        ipos = np.int64(self.iposarray[idx])
+        imeth = header['imeth']
+        nrow = header['nrow']
+        ncol = header['ncol']
+        ncpl = np.int64(nrow) * np.int64(ncol)
+        nodes = kij[:, 0] * ncpl + kij[:, 1] * ncol + kij[:, 2]
+        realbytes = self.realtype(1).nbytes
+        values = np.zeros(kij.shape[0], dtype=self.realtype)
+
+        # full array records
+        if imeth in (0, 1):
+            for n, node in enumerate(nodes):
+                self.file.seek(ipos + node * realbytes, 0)
+                values[n] = binaryread(self.file, self.realtype(1))[0]
+
+        # layer indicator array followed by a 2d array
+        elif imeth == 3:
+            for n, (k, node) in enumerate(zip(kij[:, 0], nodes % ncpl)):
+                self.file.seek(ipos + node * 4, 0)
+                ilay = binaryread(self.file, np.int32)[0]
+                if ilay - 1 != k:
+                    continue
+                self.file.seek(ipos + ncpl * 4 + node * realbytes, 0)
+                values[n] = binaryread(self.file, self.realtype(1))[0]
+
+        # 2d array for layer 1
+        elif imeth == 4:
+            for n, (k, node) in enumerate(zip(kij[:, 0], nodes)):
+                if k != 0:
+                    continue
+                self.file.seek(ipos + node * realbytes, 0)
+                values[n] = binaryread(self.file, self.realtype(1))[0]
+
+        # list records, sum the flows for each requested node
+        elif imeth in (2, 5, 6):
+            data = self.get_record(idx)
+            unodes, inverse = np.unique(nodes + 1, return_inverse=True)
+            listnodes = np.asarray(data['node'], dtype=np.int64)
+            pos = np.searchsorted(unodes, listnodes)
+            pos[pos == unodes.shape[0]] = 0
+            found = unodes[pos] == listnodes
+            q = np.bincount(pos[found], weights=data['q'][found],
+                            minlength=unodes.shape[0])
+            values[:] = q[inverse]
+
+        else:
+            raise ValueError('invalid imeth value - {}'.format(imeth))
+
+        return values
+
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
             kijlist = idx
@@ -1522,7 +1959,7 @@ class CellBudgetFile(object):
         residual = np.zeros((nlay, nrow, ncol), dtype=np.float)
         if scaled:
             inflow = np.zeros((nlay, nrow, ncol), dtype=np.float)
-        select_indices = np.where((self.recordarray['totim'] == totim))[0]
+        select_indices = self._select_records(totim=totim)
 
         for i in select_indices:
             text = self.recordarray[i]['text'].decode()
@@ -1595,6 +2032,15 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Access the file through a read-only numpy memory map.  Record
+        positions are computed from the record size when all records have
+        the same size, and get_data returns read-only views of the file
+        instead of copies when possible.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx') and
+        reuse it the next time the file is opened, as long as the size and
+        modification time of the file have not changed.  Default is False.
 
     Attributes
     ----------
@@ -1637,7 +2083,8 @@ class HeadUFile(BinaryLayerFile):
     """
 
     def __init__(self, filename, text='headu', precision='auto',
-                 verbose=False, **kwargs):
+                 verbose=False, mmap=False, cache_index=False,
+                 **kwargs):
         """
         Class constructor
         """
@@ -1651,7 +2098,9 @@ class HeadUFile(BinaryLayerFile):
                 raise Exception()
         self.header_dtype = BinaryHeader.set_dtype(bintype='Head',
                                                    precision=precision)
-        super(HeadUFile, self).__init__(filename, precision, verbose, kwargs)
+        super(HeadUFile, self).__init__(filename, precision, verbose, kwargs,
+                                        mmap=mmap,
+                                        cache_index=cache_index)
         return
 
     def _get_data_array(self, totim=0.):
@@ -1681,9 +2130,12 @@ class HeadUFile(BinaryLayerFile):
                 msg = 'Byte position in file: {} for '.format(ipos) + \
                       'layer {}'.format(ilay)
                 print(msg)
-            self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype,
-                                        shape=(npl,))
+            if self._mmap_buffer is not None:
+                data[ilay - 1] = self._get_mmap_view(ipos, (npl,))
+            else:
+                self.file.seek(ipos, 0)
+                data[ilay - 1] = binaryread(self.file, self.realtype,
+                                            shape=(npl,))
         return data
 
     def get_databytes(self, header):
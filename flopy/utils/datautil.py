@@ -1,7 +1,20 @@
 import os
+import threading
 import numpy as np
 
 
+class _DelimiterState(threading.local):
+    # delimiter detected by PyListUtil.split_data_line, tracked separately
+    # for each thread so that files can be read in concurrent threads
+    def __init__(self):
+        self.delimiter_used = None
+        self.line_num = 0
+        self.consistent_delim = False
+
+
+_delimiter_state = _DelimiterState()
+
+
 def clean_name(name):
     # remove bad characters
     clean_string = name.replace(' ', '_')
@@ -112,9 +125,6 @@ class PyListUtil(object):
                      '6': 0, '7': 0, '8': 0, '9': 0, '.': 0, '-': 0}
     quote_list = {"'", '"'}
     delimiter_list = {',': 1}
-    delimiter_used = None
-    line_num = 0
-    consistent_delim = False
 
     def __init__(self, path=None, max_error=0.01):
         self.max_error = max_error
@@ -219,23 +229,23 @@ class PyListUtil(object):
 
     @staticmethod
     def reset_delimiter_used():
-        PyListUtil.delimiter_used = None
-        PyListUtil.line_num = 0
-        PyListUtil.consistent_delim = True
+        _delimiter_state.delimiter_used = None
+        _delimiter_state.line_num = 0
+        _delimiter_state.consistent_delim = True
 
     @staticmethod
     def split_data_line(line, external_file=False, delimiter_conf_length=15):
-        if PyListUtil.line_num > delimiter_conf_length and \
-                PyListUtil.consistent_delim:
+        if _delimiter_state.line_num > delimiter_conf_length and \
+                _delimiter_state.consistent_delim:
             # consistent delimiter has been found.  continue using that
             # delimiter without doing further checks
-            if PyListUtil.delimiter_used is None:
+            if _delimiter_state.delimiter_used is None:
                 comment_split = line.strip().split('#', 1)
                 clean_line = comment_split[0].strip().split()
             else:
                 comment_split = line.strip().split('#', 1)
                 clean_line = comment_split[0].strip().split(
-                    PyListUtil.delimiter_used)
+                    _delimiter_state.delimiter_used)
                 if len(comment_split) > 1:
                     clean_line.append('#')
                     clean_line.append(comment_split[1])
@@ -269,11 +279,11 @@ class PyListUtil(object):
 
             if max_split_type is not None:
                 clean_line = line.strip().split(max_split_type)
-                if PyListUtil.line_num == 0:
-                    PyListUtil.delimiter_used = max_split_type
-                elif PyListUtil.delimiter_used != max_split_type:
-                    PyListUtil.consistent_delim = False
-            PyListUtil.line_num += 1
+                if _delimiter_state.line_num == 0:
+                    _delimiter_state.delimiter_used = max_split_type
+                elif _delimiter_state.delimiter_used != max_split_type:
+                    _delimiter_state.consistent_delim = False
+            _delimiter_state.line_num += 1
 
         arr_fixed_line = []
         index = 0
@@ -0,0 +1,148 @@
+"""
+Module to read the same selection from the binary output files of an
+ensemble of model runs concurrently.
+
+"""
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+
+from .binaryfile import HeadFile, UcnFile, HeadUFile, CellBudgetFile
+
+_readers = {'head': HeadFile,
+            'ucn': UcnFile,
+            'headu': HeadUFile,
+            'cbc': CellBudgetFile}
+
+
+def _read_output_file(filename, filetype, precision, selection):
+    """
+    Read the selection from a single output file.  This function is defined
+    at the module level so that it can be used with a process pool.
+
+    """
+    reader = _readers[filetype]
+    text = selection.get('text')
+    idx = selection.get('idx')
+    kwargs = {}
+    if precision is not None:
+        kwargs['precision'] = precision
+    with reader(filename, **kwargs) as f:
+        if filetype == 'cbc':
+            if idx is not None:
+                return f.get_ts(idx, text=text)
+            data = f.get_data(kstpkper=selection.get('kstpkper'),
+                              totim=selection.get('totim'), text=text,
+                              full3D=selection.get('full3D', True))
+            if len(data) == 0:
+                msg = 'The selection was not found in {}'.format(filename)
+                raise ValueError(msg)
+            data = data[0]
+        else:
+            if idx is not None:
+                return f.get_ts(idx)
+            data = f.get_data(kstpkper=selection.get('kstpkper'),
+                              totim=selection.get('totim'),
+                              mflay=selection.get('mflay'))
+        # return a copy so that the data does not reference a closed file
+        if isinstance(data, list):
+            return [np.array(a) for a in data]
+        elif np.ma.isMaskedArray(data):
+            return np.ma.copy(data)
+        return np.array(data)
+
+
+def read_ensemble(filenames, filetype='head', kstpkper=None, totim=None,
+                  mflay=None, idx=None, text=None, full3D=True,
+                  precision=None, max_workers=None, use_processes=False):
+    """
+    Read the same selection from the output files of an ensemble of model
+    runs, for example the realizations of a Monte Carlo analysis, and stack
+    the results along a new first (realization) axis.  The files are read
+    concurrently using a thread or process pool.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Paths of the binary output files, one for each realization.
+    filetype : str
+        Type of the output files: 'head', 'ucn', 'headu' or 'cbc'.
+        (default is 'head')
+    kstpkper : tuple of ints
+        Zero-based (kstp, kper) to read.  (default is None)
+    totim : float
+        Simulation time to read.  (default is None)
+    mflay : int
+        Zero-based layer to read from head and concentration files.  All
+        layers are read if mflay is None.  (default is None)
+    idx : tuple of ints, or a list of a tuple of ints
+        Zero-based (layer, row, column) cells for which time series are
+        read.  If idx is specified, kstpkper, totim and mflay are ignored.
+        (default is None)
+    text : str
+        Budget record to read from cell budget files, for example
+        'FLOW RIGHT FACE'.  Required if filetype is 'cbc'.
+        (default is None)
+    full3D : bool
+        Return budget records as three-dimensional arrays.
+        (default is True)
+    precision : str
+        Precision of the floating point data in the files, for example
+        'single' or 'double'.  (default is None, which uses the default
+        precision of the reader for filetype)
+    max_workers : int
+        Maximum number of threads or processes used to read the files.
+        (default is None, which uses the concurrent.futures default)
+    use_processes : bool
+        Read the files in a process pool instead of a thread pool.
+        (default is False)
+
+    Returns
+    -------
+    data : numpy.ndarray or numpy.ma.MaskedArray
+        Array with the data for each realization stacked along the first
+        axis, so data[n] is the selection read from filenames[n].
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> fnames = ['real{}/model.hds'.format(i) for i in range(500)]
+    >>> heads = flopy.utils.read_ensemble(fnames, kstpkper=(0, 0),
+    ...                                   max_workers=8)
+    >>> heads.shape
+    (500, 3, 40, 20)
+
+    """
+    filetype = filetype.lower()
+    if filetype not in _readers:
+        msg = 'filetype must be one of {}, not {}'.format(
+            ', '.join(sorted(_readers.keys())), filetype)
+        raise ValueError(msg)
+    if filetype == 'cbc' and text is None:
+        msg = 'text must be provided to read cell budget files'
+        raise ValueError(msg)
+
+    selection = {'kstpkper': kstpkper, 'totim': totim, 'mflay': mflay,
+                 'idx': idx, 'text': text, 'full3D': full3D}
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        futures = [executor.submit(_read_output_file, filename, filetype,
+                                   precision, selection)
+                   for filename in filenames]
+        results = [future.result() for future in futures]
+
+    if len(results) == 0:
+        return np.array([])
+    if any(isinstance(r, list) for r in results):
+        # unstructured heads are read as a list of layer arrays, which
+        # can have a different size for each layer
+        data = np.empty(len(results), dtype=object)
+        for n, r in enumerate(results):
+            data[n] = r
+        return data
+    if any(np.ma.isMaskedArray(r) for r in results):
+        return np.ma.stack(results)
+    return np.stack(results)
@@ -388,6 +388,9 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
         errmsg = 'Could not find a file for unit {}'.format(inunit)
         if ext_unit_dict is not None:
             if inunit in ext_unit_dict:
+                # external units can be shared by packages that are loaded
+                # concurrently, so they are read in name file order
+                model._wait_for_load_turn()
                 namdata = ext_unit_dict[inunit]
                 file_handle = namdata.filehandle
             else:
@@ -1,6 +1,7 @@
 import numpy as np
 
 from .geometry import transform
+from ..discretization.grid import CachedData, _CellIndex
 
 try:
     import shapely
@@ -29,6 +30,10 @@ class GridIntersect:
        bounding box of the shape covers nearly the entire grid, the query
        won't be able to limit the search space much resulting in slower
        performance.
+     - The grid cell shapes and the STR-tree are built once and cached
+       on the grid, so they are shared by GridIntersect instances for the
+       same grid. Use intersect_shapes() to intersect many shapes with the
+       grid in one call.
 
     """
 
@@ -54,16 +59,20 @@ class GridIntersect:
             from shapely.strtree import STRtree
 
         self.mfgrid = mfgrid
+        self.method = method
 
         if method == "strtree":
-            if mfgrid.grid_type == "structured":
-                self.gridshapes = self._rect_grid_to_shape_list()
-            elif mfgrid.grid_type == "unstructured":
+            if mfgrid.grid_type == "unstructured":
                 raise NotImplementedError()
-            elif mfgrid.grid_type == "vertex":
-                self.gridshapes = self._vtx_grid_to_shape_list()
 
-            self.strtree = STRtree(self.gridshapes)
+            cache_index = 'gridintersect_strtree'
+            if cache_index not in mfgrid._cache_dict or \
+                    mfgrid._cache_dict[cache_index].out_of_date:
+                gridshapes = self._grid_to_shape_list()
+                mfgrid._cache_dict[cache_index] = CachedData(
+                    (gridshapes, STRtree(gridshapes)))
+            self.gridshapes, self.strtree = \
+                mfgrid._cache_dict[cache_index].data_nocopy
 
             self.intersect_point = self._intersect_point_shapely
             self.intersect_linestring = self._intersect_linestring_shapely
@@ -79,6 +88,108 @@ class GridIntersect:
             raise NotImplementedError(
                 "Method 'structured' only works for structured grids.")
 
+    def intersect_shapes(self, shapes, keepzerolengths=False):
+        """
+        Intersect many shapes with the grid in one call.
+
+        Single Points are located in the grid cells all at once with a
+        cached spatial index of the grid. The other shapes are intersected
+        with intersect_point, intersect_linestring or intersect_polygon,
+        using the cell shapes and the STR-tree that are built once for the
+        grid.
+
+        Parameters
+        ----------
+        shapes : list of shapely geometries
+            shapes (Point, LineString, Polygon or their Multi variants)
+            to intersect with the grid
+        keepzerolengths : bool, optional
+            if True keep linestring intersection results with length=0,
+            by default False
+
+        Returns
+        -------
+        numpy.recarray
+            a record array containing the intersection results of all
+            shapes, with the zero-based index of the shape in shapes in
+            the "shapeids" field. Lengths are NaN for points and polygons,
+            and areas are NaN for points and linestrings.
+
+        """
+        shapeids = []
+        cellids = []
+        vertices = []
+        lengths = []
+        areas = []
+        ixshapes = []
+
+        def append(ishp, rec):
+            n = len(rec)
+            names = rec.dtype.names
+            shapeids.extend([ishp] * n)
+            cellids.extend(rec.cellids)
+            if "vertices" in names:
+                vertices.extend(rec.vertices)
+            else:
+                vertices.extend([shp.__geo_interface__["coordinates"]
+                                 for shp in rec.ixshapes])
+            for field, values in (("lengths", lengths), ("areas", areas)):
+                if field in names:
+                    values.extend(rec[field])
+                else:
+                    values.extend([np.nan] * n)
+            ixshapes.extend(rec.ixshapes)
+
+        # locate all single points at once
+        ipoints = [ishp for ishp, shp in enumerate(shapes)
+                   if shp.geom_type == "Point"]
+        located = {}
+        if len(ipoints) > 0:
+            x = np.array([shapes[ishp].x for ishp in ipoints])
+            y = np.array([shapes[ishp].y for ishp in ipoints])
+            cells = self._get_cell_index().locate(x, y)
+            for ishp, icell in zip(ipoints, cells):
+                if icell >= 0:
+                    located[ishp] = icell
+
+        for ishp, shp in enumerate(shapes):
+            if shp.geom_type == "Point":
+                if ishp not in located:
+                    continue
+                icell = located[ishp]
+                if self.mfgrid.grid_type == "structured":
+                    icell = divmod(icell, self.mfgrid.ncol)
+                rec = np.recarray(1, names=["cellids", "ixshapes"],
+                                  formats=["O", "O"])
+                rec.cellids[0] = icell
+                rec.ixshapes[0] = shp
+            elif shp.geom_type == "MultiPoint":
+                rec = self.intersect_point(shp)
+            elif "LineString" in shp.geom_type:
+                rec = self.intersect_linestring(
+                    shp, keepzerolengths=keepzerolengths)
+            elif "Polygon" in shp.geom_type:
+                rec = self.intersect_polygon(shp)
+            else:
+                raise TypeError("Shape type {} is not supported by "
+                                "intersect_shapes()".format(shp.geom_type))
+            append(ishp, rec)
+
+        rec = np.recarray(len(ixshapes),
+                          names=["shapeids", "cellids", "vertices", "lengths",
+                                 "areas", "ixshapes"],
+                          formats=["i4", "O", "O", "f8", "f8", "O"])
+        rec.shapeids = shapeids
+        # assign object fields element by element, so that tuples of
+        # cellids and vertices are not unpacked by numpy
+        for i in range(len(ixshapes)):
+            rec.cellids[i] = cellids[i]
+            rec.vertices[i] = vertices[i]
+            rec.ixshapes[i] = ixshapes[i]
+        rec.lengths = lengths
+        rec.areas = areas
+        return rec
+
     def _rect_grid_to_shape_list(self):
         """
         internal method, convert structured grid to list of shapely polygons
@@ -96,13 +207,13 @@ class GridIntersect:
         else:
             from shapely.geometry import Polygon
 
+        xy = self._get_cell_coordinates()
         shplist = []
-        for i in range(self.mfgrid.nrow):
-            for j in range(self.mfgrid.ncol):
-                xy = self.mfgrid.get_cell_vertices(i, j)
-                p = Polygon(xy)
-                p.name = (i, j)
-                shplist.append(p)
+        for icell, (i, j) in enumerate(np.ndindex(self.mfgrid.nrow,
+                                                  self.mfgrid.ncol)):
+            p = Polygon(xy[icell])
+            p.name = (i, j)
+            shplist.append(p)
         return shplist
 
     def _usg_grid_to_shape_list(self):
@@ -138,35 +249,118 @@ class GridIntersect:
         else:
             from shapely.geometry import Polygon
 
+        xy = self._get_cell_coordinates()
         shplist = []
-        if isinstance(self.mfgrid._cell2d, np.recarray):
-            for icell in self.mfgrid._cell2d.icell2d:
-                points = []
-                for iv in self.mfgrid._cell2d[["icvert_0",
-                                               "icvert_1",
-                                               "icvert_2"]][icell]:
-                    points.append((self.mfgrid._vertices.xv[iv],
-                                   self.mfgrid._vertices.yv[iv]))
-                # close the polygon, if necessary
-                if points[0] != points[-1]:
-                    points.append(points[0])
-                p = Polygon(points)
-                p.name = icell
-                shplist.append(p)
-        elif isinstance(self.mfgrid._cell2d, list):
-            for icell in range(len(self.mfgrid._cell2d)):
-                points = []
-                for iv in self.mfgrid._cell2d[icell][-3:]:
-                    points.append((self.mfgrid._vertices[iv][1],
-                                   self.mfgrid._vertices[iv][2]))
-                # close the polygon, if necessary
-                if points[0] != points[-1]:
-                    points.append(points[0])
-                p = Polygon(points)
-                p.name = icell
-                shplist.append(p)
+        for icell in range(len(xy)):
+            p = Polygon(xy[icell])
+            p.name = icell
+            shplist.append(p)
         return shplist
 
+    def _grid_to_shape_list(self):
+        """
+        internal method, convert grid to list of shapely polygons
+
+        Returns
+        -------
+        list
+            list of shapely Polygons
+
+        """
+        if self.mfgrid.grid_type == "structured":
+            return self._rect_grid_to_shape_list()
+        elif self.mfgrid.grid_type == "vertex":
+            return self._vtx_grid_to_shape_list()
+        return self._usg_grid_to_shape_list()
+
+    def _get_cell_coordinates(self):
+        """
+        internal method, get the vertices of all grid cells at once
+
+        Returns
+        -------
+        numpy.ndarray
+            array with shape (ncells, nvertices, 2) containing the x and y
+            coordinates of the vertices of each cell
+
+        """
+        if self.mfgrid.grid_type == "structured":
+            self.mfgrid._copy_cache = False
+            xv = self.mfgrid.xvertices
+            yv = self.mfgrid.yvertices
+            self.mfgrid._copy_cache = True
+            # vertices in the same order as StructuredGrid.get_cell_vertices
+            x = np.stack((xv[:-1, :-1], xv[:-1, 1:], xv[1:, 1:], xv[1:, :-1]),
+                         axis=-1)
+            y = np.stack((yv[:-1, :-1], yv[:-1, 1:], yv[1:, 1:], yv[1:, :-1]),
+                         axis=-1)
+            return np.stack((x, y), axis=-1).reshape(-1, 4, 2)
+        elif self.mfgrid.grid_type == "vertex":
+            cell2d = self.mfgrid._cell2d
+            vertices = self.mfgrid._vertices
+            if isinstance(cell2d, np.recarray):
+                iv = np.column_stack([cell2d["icvert_{}".format(i)]
+                                      for i in range(3)])
+                return np.stack((vertices.xv[iv], vertices.yv[iv]), axis=-1)
+            iv = np.array([cell[-3:] for cell in cell2d], dtype=int)
+            xy = np.array([(v[1], v[2]) for v in vertices], dtype=float)
+            return xy[iv]
+        raise NotImplementedError()
+
+    def _get_cell_index(self):
+        """
+        internal method, get the cached spatial index of the grid cells
+        that is used to locate many points at once
+
+        Returns
+        -------
+        flopy.discretization.grid._CellIndex
+
+        """
+        cache_index = 'gridintersect_cells'
+        if cache_index not in self.mfgrid._cache_dict or \
+                self.mfgrid._cache_dict[cache_index].out_of_date:
+            xy = self._get_cell_coordinates()
+            self.mfgrid._cache_dict[cache_index] = CachedData(
+                _CellIndex(xy[:, :, 0], xy[:, :, 1]))
+        return self.mfgrid._cache_dict[cache_index].data_nocopy
+
+    def _query_strtree(self, shp):
+        """
+        internal method, get the grid cells that intersect with a shape.
+        The bounding box hits of the STR-tree are filtered with a prepared
+        geometry, so that only cells that intersect are returned.
+
+        Parameters
+        ----------
+        shp : shapely geometry
+            shape to intersect with the grid
+
+        Returns
+        -------
+        list
+            list of shapely Polygons
+
+        """
+        from shapely.prepared import prep
+
+        result = self.strtree.query(shp)
+        if len(result) > 1:
+            prepared = prep(shp)
+            result = [r for r in result if prepared.intersects(r)]
+        return result
+
+    @staticmethod
+    def _hashable(verts):
+        """
+        internal method, convert nested lists of coordinates to tuples,
+        so that they can be stored in a set
+
+        """
+        if isinstance(verts, (list, tuple)):
+            return tuple(GridIntersect._hashable(v) for v in verts)
+        return verts
+
     @staticmethod
     def _sort_strtree_result(shapelist):
         """
@@ -216,13 +410,14 @@ class GridIntersect:
             a record array containing information about the intersection
 
         """
-        ixshapes = self.strtree.query(shp)
+        ixshapes = self._query_strtree(shp)
         if sort_by_cellid:
             ixshapes = self._sort_strtree_result(ixshapes)
 
         isectshp = []
         cellids = []
         vertices = []
+        found = set()
 
         for r in ixshapes:
             intersect = shp.intersection(r)
@@ -235,8 +430,10 @@ class GridIntersect:
             elif (intersect.geom_type == "Point" or
                   intersect.geom_type == "MultiPoint"):
                 pt = intersect.__geo_interface__["coordinates"]
-                if pt in vertices:
+                key = self._hashable(pt)
+                if key in found:
                     continue
+                found.add(key)
                 isectshp.append(intersect)
                 vertices.append(pt)
                 cellids.append(r.name)
@@ -275,7 +472,7 @@ class GridIntersect:
             a record array containing information about the intersection
 
         """
-        result = self.strtree.query(shp)
+        result = self._query_strtree(shp)
         if sort_by_cellid:
             result = self._sort_strtree_result(result)
 
@@ -283,6 +480,7 @@ class GridIntersect:
         cellids = []
         vertices = []
         lengths = []
+        found = set()
 
         for r in result:
             intersect = shp.intersection(r)
@@ -298,8 +496,10 @@ class GridIntersect:
                 # keep_all_ix determines what is stored
                 verts = intersect.__geo_interface__["coordinates"]
                 # if not keep_all_ix:
-                if verts in vertices:
+                key = self._hashable(verts)
+                if key in found:
                     continue
+                found.add(key)
                 isectshp.append(intersect)
                 lengths.append(intersect.length)
                 vertices.append(verts)
@@ -321,14 +521,17 @@ class GridIntersect:
                 # loop over collection
                 for geom in intersect.geoms:
                     verts = geom.__geo_interface__["coordinates"]
-                    if verts in vertices:
+                    key = self._hashable(verts)
+                    if key in found:
                         continue
+                    found.add(key)
                     vertices.append(verts)
                     if "LineString" in geom.geom_type:
                         lengths.append(geom.length)
                     else:
                         lengths.append(np.nan)
                     isectshp.append(geom)
+                    cellids.append(r.name)
             # else:  # Point
             #     if keep_all_ix:
             #         verts = intersect.__geo_interface__["coordinates"]
@@ -370,7 +573,7 @@ class GridIntersect:
             a record array containing information about the intersection
 
         """
-        ixshapes = self.strtree.query(shp)
+        ixshapes = self._query_strtree(shp)
         if sort_by_cellid:
             ixshapes = self._sort_strtree_result(ixshapes)
 
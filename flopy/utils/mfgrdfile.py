@@ -180,6 +180,28 @@ class MfGrdFile(FlopyBinaryData):
         """
         return self.mg
 
+    def get_connectivity(self):
+        """
+        Get the zero-based compressed sparse row connectivity of the model
+        cells. The connections of cell n are ja[ia[n]:ia[n + 1]], the first
+        of which is cell n itself, in the same order as the values of the
+        FLOW-JA-FACE records in the cell-by-cell budget file.
+
+        Returns
+        -------
+        ia : ndarray
+            index of the first connection of each cell (ncells + 1)
+        ja : ndarray
+            connected cell of each connection (nja)
+
+        Examples
+        --------
+        >>> import flopy
+        >>> gobj = flopy.utils.MfGrdFile('test.disv.grb')
+        >>> ia, ja = gobj.get_connectivity()
+        """
+        return self._datadict['IA'] - 1, self._datadict['JA'] - 1
+
     def _set_modelgrid(self):
         """
         Define structured or unstructured modelgrid based on
@@ -0,0 +1,178 @@
+"""
+Module to run a model for many parameter sets.  The input files of the
+base model are written once and copied to a workspace for each member of
+the sweep, and only the packages changed by a parameter set are rewritten
+before the members are run concurrently.
+
+"""
+import copy
+import io
+import os
+import shutil
+from collections import namedtuple
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SweepResult(namedtuple('SweepResult', ['model_ws', 'success', 'buff',
+                                             'elapsed', 'output'])):
+    """
+    Result of a member of a parameter sweep.
+
+    Attributes
+    ----------
+    model_ws : str
+        workspace of the member
+    success : boolean
+        True if the run terminated normally
+    buff : list of str
+        lines of stdout
+    elapsed : float
+        run time in seconds
+    output : object
+        value returned by get_output for the member, or None
+
+    """
+    __slots__ = ()
+
+
+def _is_mf6(model):
+    return hasattr(model, 'simulation_data')
+
+
+def _set_model_ws(model, model_ws, silent=True):
+    if _is_mf6(model):
+        if not os.path.isdir(model_ws):
+            os.makedirs(model_ws)
+        model.set_sim_path(model_ws)
+    elif silent:
+        # change_model_ws always reports the new workspace
+        with redirect_stdout(io.StringIO()):
+            model.change_model_ws(model_ws)
+    else:
+        model.change_model_ws(model_ws)
+
+
+def _write_packages(model, packages=None):
+    """
+    Write all of the input files, or only the packages in the list
+    packages, to the current workspace of model.
+
+    """
+    if _is_mf6(model):
+        if packages is None:
+            model.write_simulation(silent=True)
+        else:
+            for package in packages:
+                package.write()
+    else:
+        if packages is None:
+            model.write_input()
+        else:
+            names = []
+            for package in packages:
+                if not isinstance(package, str):
+                    package = package.name[0]
+                names.append(package)
+            model.write_input(SelPackList=names)
+
+
+def run_parameter_sweep(model, parameter_sets, apply_parameters, sweep_ws,
+                        max_workers=None, get_output=None, silent=True,
+                        normal_msg='normal termination'):
+    """
+    Run a model for each parameter set in parameter_sets.
+
+    The input files of model are written once to sweep_ws/base.  For each
+    parameter set the base workspace is copied to sweep_ws/member####,
+    apply_parameters is called to update a copy of model, and only the
+    packages that it returns are written to the member workspace.  The
+    members are then run concurrently with flopy.mbase.run_models and
+    get_output is called for each member workspace.
+
+    Parameters
+    ----------
+    model : flopy model or MFSimulation
+        Base model, for example a Modflow instance or a MODFLOW 6
+        simulation.  The sweep is written from copies of model, so model
+        and its workspace are not changed.
+    parameter_sets : list
+        Parameter sets, for example a list of dictionaries, that are
+        passed to apply_parameters.
+    apply_parameters : callable
+        Function apply_parameters(model, parameter_set) that updates a
+        copy of the base model for a parameter set and returns a list of
+        the packages it changed.  Packages can be given as package
+        instances or, for models that are not MODFLOW 6 simulations,
+        package names (for example 'LPF').
+    sweep_ws : str
+        Workspace in which the base and member workspaces are created.
+    max_workers : int
+        Maximum number of members that are run at the same time.  (default
+        is None, which uses the number of processors)
+    get_output : callable
+        Function get_output(model_ws) that reads the results of a member,
+        for example with flopy.utils.HeadFile.  (default is None)
+    silent : boolean
+        Echo run information to screen (default is True).
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. (Default is 'normal termination')
+
+    Returns
+    -------
+    results : list of SweepResult
+        named tuples (model_ws, success, buff, elapsed, output) in the same
+        order as parameter_sets
+
+    Examples
+    --------
+    >>> import flopy
+    >>> def apply_parameters(m, hk):
+    ...     m.lpf.hk = hk
+    ...     return [m.lpf]
+    >>> def get_output(model_ws):
+    ...     fpth = os.path.join(model_ws, 'model.hds')
+    ...     with flopy.utils.HeadFile(fpth) as hds:
+    ...         return hds.get_data()
+    >>> results = flopy.utils.run_parameter_sweep(m, [1., 10., 100.],
+    ...                                           apply_parameters, 'sweep',
+    ...                                           get_output=get_output)
+
+    """
+    from ..mbase import run_models, _get_model_run_args
+
+    base_ws = os.path.join(sweep_ws, 'base')
+    member_ws = []
+    runs = []
+
+    # write the base model once
+    base = copy.deepcopy(model)
+    _set_model_ws(base, base_ws, silent)
+    _write_packages(base)
+
+    # copy the base model and only write the changed packages
+    for idx, parameter_set in enumerate(parameter_sets):
+        model_ws = os.path.join(sweep_ws, 'member{:04d}'.format(idx))
+        if os.path.isdir(model_ws):
+            shutil.rmtree(model_ws)
+        shutil.copytree(base_ws, model_ws)
+        member = copy.deepcopy(base)
+        packages = apply_parameters(member, parameter_set)
+        _set_model_ws(member, model_ws, silent)
+        if packages:
+            _write_packages(member, packages)
+        member_ws.append(model_ws)
+        runs.append(_get_model_run_args(member))
+
+    run_results = run_models(runs, max_workers=max_workers, silent=silent,
+                             normal_msg=normal_msg)
+
+    if get_output is None:
+        outputs = [None] * len(member_ws)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outputs = list(executor.map(get_output, member_ws))
+
+    return [SweepResult(model_ws, r.success, r.buff, r.elapsed, output)
+            for model_ws, r, output in zip(member_ws, run_results, outputs)]
@@ -9,14 +9,27 @@ from __future__ import division, print_function
 # from future.utils import with_metaclass
 
 import os
+import io
 import shutil
 import copy
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
 from warnings import warn
 from ..utils.binaryfile import BinaryHeader
 from ..utils.flopy_io import line_parse
 from ..datbase import DataType, DataInterface
 
+# arrays loaded from open/close text files, keyed by a hash of the file
+# contents so that identical files, for example an array that is shared by
+# several layers or models, are only parsed once
+_load_txt_cache = OrderedDict()
+_load_txt_cache_lock = threading.Lock()
+_load_txt_cache_nbytes = 0
+# maximum number of bytes of array data kept in the cache
+load_txt_cache_max_bytes = 256 * 1024 * 1024
+
 
 class ArrayFormat(object):
     """
@@ -2283,19 +2296,17 @@ class Util2d(DataInterface):
         """
         if self.vtype == str:
             if self.__value_built is None:
-                file_in = open(self.__value, 'r')
-
                 if self.format.binary:
+                    file_in = open(self.__value, 'r')
                     header, self.__value_built = Util2d.load_bin(self.shape,
                                                                  file_in,
                                                                  self._dtype,
                                                                  bintype="head")
+                    file_in.close()
                 else:
-                    self.__value_built = Util2d.load_txt(self.shape, file_in,
-                                                         self._dtype,
-                                                         self.format.fortran).astype(
-                        self._dtype)
-                file_in.close()
+                    self.__value_built = Util2d.load_txt_cached(
+                        self.shape, self.__value, self._dtype,
+                        self.format.fortran).astype(self._dtype)
             return self.__value_built
         elif self.vtype != np.ndarray:
             if self.__value_built is None:
@@ -2349,7 +2360,7 @@ class Util2d(DataInterface):
         return data.data
 
     @staticmethod
-    def load_txt(shape, file_in, dtype, fmtin):
+    def load_txt(shape, file_in, dtype, fmtin, read_ahead=False):
         """Load formatted file to a 1-D or 2-D array
 
         Parameters
@@ -2361,6 +2372,9 @@ class Util2d(DataInterface):
         dtype : np.int32 or np.float32
         fmtin : str
             Fortran array format descriptor, '(FREE)' or e.g. '(10G11.4)'
+        read_ahead : bool
+            file_in only contains the array and can be read past the end of
+            the array.  (default is False, or True if file_in is a filename)
 
         Notes
         -----
@@ -2384,43 +2398,123 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, 'r')
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError('Util2d.load_txt(): no data found')
-            if npl == 'free':
-                if ',' in line:
-                    line = line.replace(',', ' ')
-                if '*' in line:  # use slower method for these types of lines
-                    for item in line.split():
-                        if '*' in item:
-                            num, val = item.split('*')
-                            # repeat val num times
-                            items += int(num) * [val]
-                        else:
-                            items.append(item)
-                else:
-                    items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos:pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+        if npl == 'free':
+            data = Util2d._load_txt_free(file_in, num_items, dtype,
+                                         read_ahead=read_ahead or openfile)
+        else:
+            data = Util2d._load_txt_fixed(file_in, num_items, dtype, npl,
+                                          width)
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError('Util2d.load_txt(): expected array size {0},'
                              ' but found size {1}'.format(num_items,
                                                           data.size))
         return data.reshape(shape)
 
+    @staticmethod
+    def _load_txt_free(file_in, num_items, dtype, read_ahead=False):
+        # a file that only contains the array is read in large chunks,
+        # otherwise the file is read a line at a time so that it is not
+        # read past the end of the array
+        items = []
+        while len(items) < num_items:
+            if read_ahead:
+                chunk = ''.join(file_in.readlines(1048576))
+            else:
+                chunk = file_in.readline()
+            if len(chunk) == 0:
+                raise ValueError('Util2d.load_txt(): no data found')
+            if ',' in chunk:
+                chunk = chunk.replace(',', ' ')
+            if '*' in chunk:  # use slower method for these types of lines
+                for item in chunk.split():
+                    if '*' in item:
+                        num, val = item.split('*')
+                        # repeat val num times
+                        items += int(num) * [val]
+                    else:
+                        items.append(item)
+            else:
+                items += chunk.split()
+        # convert all of the items at once
+        return np.array(items[:num_items], dtype=dtype)
+
+    @staticmethod
+    def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+        # split the lines into fields of a fixed width, each line has at
+        # most npl items so the file is not read past the end of the array
+        fields = []
+        count = 0
+        while count < num_items:
+            nlines = -(-(num_items - count) // npl)
+            lines = []
+            for i in range(nlines):
+                line = file_in.readline()
+                if len(line) == 0:
+                    raise ValueError('Util2d.load_txt(): no data found')
+                lines.append(line.rstrip('\r\n').encode())
+            items = np.array(lines, dtype='S{}'.format(npl * width))
+            items = items.view('S{}'.format(width))
+            # skip blank fields
+            chars = items.view(np.uint8).reshape(-1, width)
+            blank = ((chars == 32) | (chars == 0)).all(axis=1)
+            if blank.any():
+                items = items[~blank]
+            fields.append(items)
+            count += items.size
+        return np.concatenate(fields)[:num_items].astype(dtype)
+
+    @staticmethod
+    def load_txt_cached(shape, fname, dtype, fmtin):
+        """Load a formatted file to a 1-D or 2-D array, using a cache of
+        the arrays that have been loaded from files with the same contents
+
+        Parameters
+        ----------
+        shape : tuple of int
+            One or two array dimensions
+        fname : str
+            Filename
+        dtype : np.int32 or np.float32
+        fmtin : str
+            Fortran array format descriptor, '(FREE)' or e.g. '(10G11.4)'
+
+        Returns
+        -------
+        1-D or 2-D array
+
+        """
+        global _load_txt_cache_nbytes
+        with open(fname, 'rb') as f:
+            content = f.read()
+        key = (hashlib.sha1(content).hexdigest(), tuple(shape),
+               np.dtype(dtype).str, fmtin.upper())
+        with _load_txt_cache_lock:
+            data = _load_txt_cache.pop(key, None)
+            if data is not None:
+                _load_txt_cache[key] = data
+                return data.copy()
+        data = Util2d.load_txt(shape, io.TextIOWrapper(io.BytesIO(content)),
+                               dtype, fmtin, read_ahead=True)
+        if data.nbytes <= load_txt_cache_max_bytes:
+            with _load_txt_cache_lock:
+                if key not in _load_txt_cache:
+                    _load_txt_cache[key] = data.copy()
+                    _load_txt_cache_nbytes += data.nbytes
+                while _load_txt_cache_nbytes > load_txt_cache_max_bytes:
+                    old_key, old_data = _load_txt_cache.popitem(last=False)
+                    _load_txt_cache_nbytes -= old_data.nbytes
+        return data
+
+    @staticmethod
+    def clear_load_txt_cache():
+        """Remove all of the arrays from the load_txt_cached cache"""
+        global _load_txt_cache_nbytes
+        with _load_txt_cache_lock:
+            _load_txt_cache.clear()
+            _load_txt_cache_nbytes = 0
+
     @staticmethod
     def write_txt(shape, file_out, data, fortran_format="(FREE)",
                   python_format=None):
@@ -2682,15 +2776,14 @@ class Util2d(DataInterface):
             assert os.path.exists(fname), "Util2d.load() error: open/close " + \
                                           "file " + str(fname) + " not found"
             if str('binary') not in str(cr_dict['fmtin'].lower()):
-                f = open(fname, 'r')
-                data = Util2d.load_txt(shape=shape,
-                                       file_in=f,
-                                       dtype=dtype, fmtin=cr_dict['fmtin'])
+                data = Util2d.load_txt_cached(shape=shape, fname=fname,
+                                              dtype=dtype,
+                                              fmtin=cr_dict['fmtin'])
             else:
                 f = open(fname, 'rb')
                 header_data, data = Util2d.load_bin(shape, f, dtype,
                                                     bintype='Head')
-            f.close()
+                f.close()
             u2d = Util2d(model, shape, dtype, data, name=name,
                          iprn=cr_dict['iprn'], fmtin="(FREE)",
                          cnstnt=cr_dict['cnstnt'],
@@ -2705,6 +2798,9 @@ class Util2d(DataInterface):
                          array_free_format=array_free_format)
 
         elif cr_dict['type'] == 'external':
+            # external units can be shared by packages that are loaded
+            # concurrently, so they are read in name file order
+            model._wait_for_load_turn()
             ext_unit = ext_unit_dict[cr_dict['nunit']]
             if ext_unit.filehandle is None:
                 raise IOError('cannot read unit {0}, filename: {1}'
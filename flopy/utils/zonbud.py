@@ -1,8 +1,9 @@
 import os
 import copy
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from .binaryfile import CellBudgetFile
-from itertools import groupby
+from .mfgrdfile import MfGrdFile
 from collections import OrderedDict
 from ..utils.utils_def import totim_to_datetime
 
@@ -29,6 +30,21 @@ class ZoneBudget(object):
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    batch : bool
+        Compute the budgets for all of the times with a single sequential
+        pass over the cell-by-cell budget file instead of selecting the
+        records of each budget term separately. (default is False)
+    max_workers : int
+        Compute the budgets in batch mode in a pool of max_workers
+        processes, each of which reads the records for a part of the
+        times. (default is None, which computes the budgets in this
+        process)
+    grb_file : str or MfGrdFile object
+        The MODFLOW 6 binary grid file of the model. Required to compute
+        the flow between zones from the FLOW-JA-FACE records of MODFLOW 6
+        budget files, for example for DISV and DISU models. The zone
+        array must then have one value for each cell of the model.
+        (default is None)
 
     Returns
     -------
@@ -42,19 +58,34 @@ class ZoneBudget(object):
     >>> zb = ZoneBudget('zonebudtest.cbc', zon, kstpkper=(0, 0))
     >>> zb.to_csv('zonebudtest.csv')
     >>> zb_mgd = zb * 7.48052 / 1000000
+    >>> zb = ZoneBudget('zonebudtest.cbc', zon, batch=True, max_workers=4)
+    >>> zb = ZoneBudget('model.cbc', zon, grb_file='model.disv.grb')
     """
 
     def __init__(self, cbc_file, z, kstpkper=None, totim=None, aliases=None,
-                 verbose=False, **kwargs):
+                 verbose=False, batch=False, max_workers=None, grb_file=None,
+                 **kwargs):
 
         if isinstance(cbc_file, CellBudgetFile):
             self.cbc = cbc_file
         elif isinstance(cbc_file, str) and os.path.isfile(cbc_file):
-            self.cbc = CellBudgetFile(cbc_file)
+            if grb_file is None:
+                self.cbc = CellBudgetFile(cbc_file)
+            else:
+                # MODFLOW 6 budget files are always double precision
+                self.cbc = CellBudgetFile(cbc_file, precision='double')
         else:
             raise Exception(
                 'Cannot load cell budget file: {}.'.format(cbc_file))
 
+        if grb_file is None or isinstance(grb_file, MfGrdFile):
+            grb = grb_file
+        elif isinstance(grb_file, str) and os.path.isfile(grb_file):
+            grb = MfGrdFile(grb_file)
+        else:
+            raise Exception(
+                'Cannot load binary grid file: {}.'.format(grb_file))
+
         if isinstance(z, np.ndarray):
             assert np.issubdtype(z.dtype,
                                  np.integer), 'Zones dtype must be integer'
@@ -84,8 +115,14 @@ class ZoneBudget(object):
             raise Exception('LayerFile error: unrecognized kwargs: ' + args)
 
         # Check the shape of the cbc budget file arrays
-        self.cbc_shape = self.cbc.get_data(idx=0, full3D=True)[0].shape
-        self.nlay, self.nrow, self.ncol = self.cbc_shape
+        if grb is not None:
+            # cells are numbered with the binary grid file connectivity
+            ia, ja = grb.get_connectivity()
+            self.cbc_shape = (len(ia) - 1,)
+            self.nlay, self.nrow, self.ncol = 1, 1, self.cbc_shape[0]
+        else:
+            self.cbc_shape = self.cbc.get_data(idx=0, full3D=True)[0].shape
+            self.nlay, self.nrow, self.ncol = self.cbc_shape
         self.cbc_times = self.cbc.get_times()
         self.cbc_kstpkper = self.cbc.get_kstpkper()
         self.kstpkper = None
@@ -118,13 +155,20 @@ class ZoneBudget(object):
         self.int_type = np.int32
 
         # Check dimensions of input zone array
-        s = 'Row/col dimensions of zone array {}' \
-            ' do not match model row/col dimensions {}'.format(z.shape,
-                                                               self.cbc_shape)
-        assert z.shape[-2] == self.nrow and \
-               z.shape[-1] == self.ncol, s
-
-        if z.shape == self.cbc_shape:
+        if grb is not None:
+            s = 'Size of zone array {} does not match the number of ' \
+                'cells {}'.format(z.size, self.cbc_shape[0])
+            assert z.size == self.cbc_shape[0], s
+        else:
+            s = 'Row/col dimensions of zone array {}' \
+                ' do not match model row/col dimensions {}'.format(
+                    z.shape, self.cbc_shape)
+            assert z.shape[-2] == self.nrow and \
+                   z.shape[-1] == self.ncol, s
+
+        if grb is not None:
+            izone = z.reshape(self.cbc_shape).copy()
+        elif z.shape == self.cbc_shape:
             izone = z.copy()
         elif len(z.shape) == 2:
             izone = np.zeros(self.cbc_shape, self.int_type)
@@ -158,31 +202,44 @@ class ZoneBudget(object):
                     seen.append(z)
 
         self._iflow_recnames = self._get_internal_flow_record_names()
+        if grb is not None:
+            self._set_ja_connections(ia, ja)
 
         # All record names in the cell-by-cell budget binary file
         self.record_names = [n.strip() for n in
                              self.cbc.get_unique_record_names(decode=True)]
 
-        # Get imeth for each record in the CellBudgetFile record list
+        # Get imeth for each record in the CellBudgetFile record list, the
+        # last record with a text determines the imeth
         self.imeth = {}
-        for record in self.cbc.recordarray:
-            self.imeth[record['text'].strip().decode("utf-8")] = record[
-                'imeth']
+        texts = self.cbc.recordarray['text'][::-1]
+        imeths = self.cbc.recordarray['imeth'][::-1]
+        texts, idx = np.unique(texts, return_index=True)
+        for text, imeth in zip(texts, imeths[idx]):
+            self.imeth[text.strip().decode("utf-8")] = imeth
 
         # INTERNAL FLOW TERMS ARE USED TO CALCULATE FLOW BETWEEN ZONES.
         # CONSTANT-HEAD TERMS ARE USED TO IDENTIFY WHERE CONSTANT-HEAD CELLS
         # ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF FLOW.
         # SWIADDTO--- terms are used by the SWI2 groundwater flow process.
+        # FLOW-JA-FACE terms are used to calculate flow between zones of
+        # MODFLOW 6 models.
         internal_flow_terms = ['CONSTANT HEAD', 'FLOW RIGHT FACE',
                                'FLOW FRONT FACE', 'FLOW LOWER FACE',
                                'SWIADDTOCH', 'SWIADDTOFRF', 'SWIADDTOFFF',
-                               'SWIADDTOFLF']
+                               'SWIADDTOFLF', 'FLOW-JA-FACE']
+        if 'FLOW-JA-FACE' in self.record_names and grb is None:
+            raise Exception('A binary grid file (grb_file) is required to '
+                            'compute the flow between zones from the '
+                            'FLOW-JA-FACE records.')
 
         # Source/sink/storage term record names
         # These are all of the terms that are not related to constant
-        # head cells or face flow terms
+        # head cells or face flow terms, or MODFLOW 6 auxiliary data
+        # (DATA-SPDIS, DATA-SAT) that are not flows
         self.ssst_record_names = [n for n in self.record_names
-                                  if n not in internal_flow_terms]
+                                  if n not in internal_flow_terms and
+                                  not n.startswith('DATA-')]
 
         # Initialize budget recordarray
         array_list = []
@@ -199,19 +256,19 @@ class ZoneBudget(object):
         self._budget = np.concatenate(array_list, axis=0)
 
         # Update budget record array
-        if self.kstpkper is not None:
+        self._records = None
+        if batch or max_workers is not None:
+            self._compute_budget_batch(max_workers=max_workers,
+                                       verbose=verbose)
+        elif self.kstpkper is not None:
             for kk in self.kstpkper:
                 if verbose:
-                    s = 'Computing the budget for' \
-                        ' time step {} in stress period {}'.format(kk[0] + 1,
-                                                                   kk[1] + 1)
-                    print(s)
+                    self._print_time(kk, None)
                 self._compute_budget(kstpkper=kk)
         elif self.totim is not None:
             for t in self.totim:
                 if verbose:
-                    s = 'Computing the budget for time {}'.format(t)
-                    print(s)
+                    self._print_time(None, t)
                 self._compute_budget(totim=t)
 
         return
@@ -492,8 +549,8 @@ class ZoneBudget(object):
             C-----HEAD CELLS ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF
             C-----FLOW.  STORE CONSTANT-HEAD LOCATIONS IN ICH ARRAY.
             """
-            chd = self.cbc.get_data(text='CONSTANT HEAD', full3D=True,
-                                    kstpkper=kstpkper, totim=totim)[0]
+            chd = self._get_data('CONSTANT HEAD', kstpkper, totim,
+                                 full3D=True)[0]
             ich[np.ma.where(chd != 0.)] = 1
         if 'FLOW RIGHT FACE' in self.record_names:
             self._accumulate_flow_frf('FLOW RIGHT FACE', ich, kstpkper, totim)
@@ -502,8 +559,8 @@ class ZoneBudget(object):
         if 'FLOW LOWER FACE' in self.record_names:
             self._accumulate_flow_flf('FLOW LOWER FACE', ich, kstpkper, totim)
         if 'SWIADDTOCH' in self.record_names:
-            swichd = self.cbc.get_data(text='SWIADDTOCH', full3D=True,
-                                       kstpkper=kstpkper, totim=totim)[0]
+            swichd = self._get_data('SWIADDTOCH', kstpkper, totim,
+                                    full3D=True)[0]
             swiich[swichd != 0] = 1
         if 'SWIADDTOFRF' in self.record_names:
             self._accumulate_flow_frf('SWIADDTOFRF', swiich, kstpkper, totim)
@@ -511,6 +568,8 @@ class ZoneBudget(object):
             self._accumulate_flow_fff('SWIADDTOFFF', swiich, kstpkper, totim)
         if 'SWIADDTOFLF' in self.record_names:
             self._accumulate_flow_flf('SWIADDTOFLF', swiich, kstpkper, totim)
+        if 'FLOW-JA-FACE' in self.record_names:
+            self._accumulate_flow_ja('FLOW-JA-FACE', kstpkper, totim)
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
@@ -523,6 +582,158 @@ class ZoneBudget(object):
 
         return
 
+    def _compute_budget_batch(self, max_workers=None, verbose=False):
+        """
+        Compute the budgets for all of the times by reading the records of
+        the cell-by-cell budget file in file order, optionally in a pool
+        of processes.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of processes (default is None, which computes
+            the budgets in this process).
+        verbose : bool
+            Print the time steps as the budgets are computed.
+
+        Returns
+        -------
+        None
+
+        """
+        recordarray = self.cbc.recordarray
+        if self.kstpkper is not None:
+            times = [(kk, None) for kk in self.kstpkper]
+            keys = [(kk[0] + 1, kk[1] + 1) for kk in self.kstpkper]
+            record_keys = zip(recordarray['kstp'].tolist(),
+                              recordarray['kper'].tolist())
+        else:
+            times = [(None, t) for t in self.totim]
+            # totim is rounded to the precision of the budget file
+            keys = [float(self.cbc.realtype(t)) for t in self.totim]
+            record_keys = recordarray['totim'].tolist()
+
+        # zero-based record numbers for each time, in file order
+        record_indices = {}
+        for i, key in enumerate(record_keys):
+            record_indices.setdefault(key, []).append(i)
+        indices = [record_indices.get(key, []) for key in keys]
+        order = sorted(range(len(times)),
+                       key=lambda i: indices[i][0] if indices[i] else -1)
+
+        if max_workers is None or max_workers < 2 or len(times) < 2:
+            self._compute_budget_records([times[i] for i in order],
+                                         [indices[i] for i in order],
+                                         verbose=verbose)
+            return
+
+        # each process computes the budgets for a contiguous part of the
+        # times with its own copy of the budget rows for those times
+        nrec = len(self._budget) // len(times)
+        state = {k: v for k, v in self.__dict__.items()
+                 if k not in ('cbc', 'model', 'dis', 'sr', '_budget')}
+        # the processes open the file with the same settings
+        cbc_kwargs = {'precision': self.cbc.precision,
+                      'verbose': self.cbc.verbose,
+                      'cache_index': self.cbc.cache_index}
+        bounds = np.linspace(0, len(times),
+                             min(max_workers, len(times)) + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for i0, i1 in zip(bounds[:-1], bounds[1:]):
+                chunk = order[i0:i1]
+                budget = np.concatenate([self._budget[i * nrec:(i + 1) * nrec]
+                                         for i in chunk])
+                futures.append(executor.submit(
+                    _compute_budget_records, state, budget,
+                    self.cbc.filename, cbc_kwargs,
+                    [times[i] for i in chunk], [indices[i] for i in chunk]))
+            for (i0, i1), future in zip(zip(bounds[:-1], bounds[1:]),
+                                        futures):
+                budget = future.result()
+                for n, i in enumerate(order[i0:i1]):
+                    self._budget[i * nrec:(i + 1) * nrec] = \
+                        budget[n * nrec:(n + 1) * nrec]
+                if verbose:
+                    for kstpkper, totim in [times[i] for i in order[i0:i1]]:
+                        self._print_time(kstpkper, totim)
+        return
+
+    def _compute_budget_records(self, times, indices, verbose=False):
+        """
+        Compute the budgets for the times from the records with the
+        zero-based record numbers in indices.  Each record is read once
+        and the records of all of the budget terms for a time are read
+        before the budget for the time is computed.
+
+        """
+        recordarray = self.cbc.recordarray
+        for (kstpkper, totim), idx in zip(times, indices):
+            if verbose:
+                self._print_time(kstpkper, totim)
+            records = {}
+            for i in idx:
+                text = recordarray['text'][i].strip().decode('utf-8')
+                records.setdefault(text, []).append(
+                    (i, self.cbc.get_record(i)))
+            self._records = records
+            try:
+                self._compute_budget(kstpkper=kstpkper, totim=totim)
+            finally:
+                self._records = None
+        return
+
+    @staticmethod
+    def _print_time(kstpkper, totim):
+        if kstpkper is not None:
+            s = 'Computing the budget for' \
+                ' time step {} in stress period {}'.format(kstpkper[0] + 1,
+                                                           kstpkper[1] + 1)
+        else:
+            s = 'Computing the budget for time {}'.format(totim)
+        print(s)
+
+    def _get_data(self, recname, kstpkper=None, totim=None, full3D=False):
+        """
+        Get the records for a budget term from the records read for the
+        current time in batch mode, or from the cell-by-cell budget file.
+
+        """
+        if self._records is not None:
+            # all of the records for the time have been read, so a budget
+            # term without records has no data at this time
+            records = self._records.get(recname, [])
+            if full3D:
+                return [self._get_full3D_record(i, record)
+                        for i, record in records]
+            return [record for i, record in records]
+        return self.cbc.get_data(text=recname, kstpkper=kstpkper,
+                                 totim=totim, full3D=full3D)
+
+    def _get_full3D_record(self, idx, record):
+        """
+        Convert a record read from the cell-by-cell budget file with
+        full3D=False to the record that is returned with full3D=True.
+
+        """
+        header = self.cbc.recordarray[idx]
+        imeth = header['imeth']
+        nlay = abs(header['nlay'])
+        nrow = header['nrow']
+        ncol = header['ncol']
+        if imeth in (2, 5):
+            return self.cbc.create3D(record, nlay, nrow, ncol)
+        elif imeth == 3:
+            ilayer, data = record
+            out = np.ma.zeros((nlay, nrow, ncol), dtype=np.float32)
+            out.mask = True
+            out[ilayer[0] - 1, :, :] = data
+            return out
+        elif imeth == 6:
+            # full 3D arrays are not supported for imeth 6
+            return self.cbc.get_record(idx, full3D=True)
+        return record
+
     def _get_internal_flow_record_names(self):
         """
         Get internal flow record names
@@ -779,17 +990,24 @@ class ZoneBudget(object):
         try:
 
             if kstpkper is not None:
-                for rn, cn, flux in list(zip(rownames, colnames, fluxes)):
-                    rowidx = np.where(
-                        (self._budget['time_step'] == kstpkper[0]) &
-                        (self._budget['stress_period'] == kstpkper[1]) &
-                        (self._budget['name'] == rn))
-                    self._budget[cn][rowidx] += flux
+                timeidx = np.where(
+                    (self._budget['time_step'] == kstpkper[0]) &
+                    (self._budget['stress_period'] == kstpkper[1]))[0]
             elif totim is not None:
-                for rn, cn, flux in list(zip(rownames, colnames, fluxes)):
-                    rowidx = np.where((self._budget['totim'] == totim) &
-                                      (self._budget['name'] == rn))
-                    self._budget[cn][rowidx] += flux
+                timeidx = np.where(self._budget['totim'] == totim)[0]
+            else:
+                return
+
+            # look up the row of each flux once and add the fluxes to
+            # each column with a single unbuffered operation
+            rows = dict(zip(self._budget['name'][timeidx], timeidx))
+            rowidx = np.array([rows.get(rn, -1) for rn in rownames],
+                              dtype=int)
+            colnames = np.asarray(colnames)
+            fluxes = np.asarray(fluxes)
+            for cn in np.unique(colnames):
+                idx = (colnames == cn) & (rowidx >= 0)
+                np.add.at(self._budget[cn], rowidx[idx], fluxes[idx])
 
         except Exception as e:
             print(e)
@@ -812,9 +1030,7 @@ class ZoneBudget(object):
         """
         try:
             if self.ncol >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
+                data = self._get_data(recname, kstpkper, totim)[0]
 
                 # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
                 # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
@@ -982,9 +1198,7 @@ class ZoneBudget(object):
         """
         try:
             if self.nrow >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
+                data = self._get_data(recname, kstpkper, totim)[0]
 
                 # "FLOW FRONT FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
@@ -1117,9 +1331,7 @@ class ZoneBudget(object):
         """
         try:
             if self.nlay >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
+                data = self._get_data(recname, kstpkper, totim)[0]
 
                 # "FLOW LOWER FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
@@ -1236,6 +1448,84 @@ class ZoneBudget(object):
             raise
         return
 
+    def _set_ja_connections(self, ia, ja):
+        """
+        Find the connections between cells in different zones and code
+        the (from zone, to zone) pair of each of them, so that the flow
+        between zones can be computed from a FLOW-JA-FACE record with a
+        single gather and bincount.
+
+        Parameters
+        ----------
+        ia : ndarray
+            zero-based index of the first connection of each cell
+        ja : ndarray
+            zero-based connected cell of each connection
+
+        Returns
+        -------
+        None
+
+        """
+        n = np.repeat(np.arange(len(ia) - 1), np.diff(ia))
+        zn = self.izone[n]
+        zm = self.izone[ja]
+        idx = np.flatnonzero(zn != zm)
+        zones = np.array(self.allzones)
+        nz = len(zones)
+
+        # FLOW-JA-FACE is positive for flow into cell n from cell m
+        self._ja_index = idx
+        self._ja_codes = np.searchsorted(zones, zm[idx]) * nz + \
+                         np.searchsorted(zones, zn[idx])
+        return
+
+    def _accumulate_flow_ja(self, recname, kstpkper, totim):
+        """
+        Accumulate the flow between zones from a FLOW-JA-FACE record.
+
+        Parameters
+        ----------
+        recname
+        kstpkper
+        totim
+
+        Returns
+        -------
+
+        """
+        data = self._get_data(recname, kstpkper, totim)
+        if len(data) == 0:
+            return
+        q = np.ravel(data[0])[self._ja_index]
+
+        # each flow is counted once, in the connection of the cell that
+        # it flows into
+        zones = np.array(self.allzones)
+        nz = len(zones)
+        f = np.bincount(self._ja_codes, weights=np.where(q > 0, q, 0.),
+                        minlength=nz * nz)
+        fz, tz = np.divmod(np.arange(nz * nz), nz)
+        names = dict(zip(self._iflow_recnames['zone'],
+                         self._iflow_recnames['name']))
+
+        # Inflows
+        idx = (fz != tz) & (zones[tz] != 0)
+        rownames = np.array(['FROM_' + names[zones[i]] for i in fz[idx]])
+        colnames = np.array([names[zones[i]] for i in tz[idx]])
+        self._update_budget_fromssst(rownames, colnames,
+                                     f[idx].astype(self.float_type),
+                                     kstpkper, totim)
+
+        # Outflows
+        idx = (fz != tz) & (zones[fz] != 0)
+        rownames = np.array(['TO_' + names[zones[i]] for i in tz[idx]])
+        colnames = np.array([names[zones[i]] for i in fz[idx]])
+        self._update_budget_fromssst(rownames, colnames,
+                                     f[idx].astype(self.float_type),
+                                     kstpkper, totim)
+        return
+
     def _accumulate_flow_ssst(self, recname, kstpkper, totim):
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
@@ -1243,31 +1533,35 @@ class ZoneBudget(object):
 
         imeth = self.imeth[recname]
 
-        data = self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                 totim=totim)
+        data = self._get_data(recname, kstpkper, totim)
         if len(data) == 0:
             # Empty data, can occur during the first time step of a transient model when
             # storage terms are zero and not in the cell-budget file.
             return
+        elif imeth == 6:
+            # MODFLOW 6 writes a record for each package with this budget
+            # term, for example for more than one CHD package.  The records
+            # can have different auxiliary variables, so only the node and
+            # q columns are combined
+            data = {'node': np.concatenate([d['node'] for d in data]),
+                    'q': np.concatenate([d['q'] for d in data])}
         else:
             data = data[0]
 
-        if imeth == 2 or imeth == 5:
+        if imeth == 2 or imeth == 5 or imeth == 6:
             # LIST
-            qin = np.ma.zeros((self.nlay * self.nrow * self.ncol),
-                              self.float_type)
-            qout = np.ma.zeros((self.nlay * self.nrow * self.ncol),
-                               self.float_type)
-            for [node, q] in zip(data['node'], data['q']):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
-            qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
-            qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
+            ncells = self.nlay * self.nrow * self.ncol
+            idx = data['node'] - 1
+            q = data['q']
+            qin = np.bincount(idx, weights=np.where(q > 0, q, 0.),
+                              minlength=ncells).astype(self.float_type)
+            qout = np.bincount(idx, weights=np.where(q < 0, q, 0.),
+                               minlength=ncells).astype(self.float_type)
+            qin = qin.reshape(self.cbc_shape)
+            qout = qout.reshape(self.cbc_shape)
         elif imeth == 0 or imeth == 1:
             # FULL 3-D ARRAY
+            data = data.reshape(self.cbc_shape)
             qin = np.ma.zeros(self.cbc_shape, self.float_type)
             qout = np.ma.zeros(self.cbc_shape, self.float_type)
             qin[data > 0] = data[data > 0]
@@ -1276,8 +1570,8 @@ class ZoneBudget(object):
             # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
             rlay, rdata = data[0], data[1]
             data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
+            r, c = np.indices(rlay.shape)
+            data[np.asarray(rlay, dtype=int) - 1, r, c] = rdata
             qin = np.ma.zeros(self.cbc_shape, self.float_type)
             qout = np.ma.zeros(self.cbc_shape, self.float_type)
             qin[data > 0] = data[data > 0]
@@ -1296,39 +1590,17 @@ class ZoneBudget(object):
                 'Unrecognized "imeth" for {} record: {}'.format(recname,
                                                                 imeth))
 
-        # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.
-                fz.append('FROM_' + '_'.join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.
-                fz.append('TO_' + '_'.join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        # Sum the inflows and outflows by zone, masked values are not
+        # included in the sums
+        zones = np.array([z for z in self.allzones if z != 0])
+        tz = np.array([self._zonenamedict[z] for z in zones])
+        izone = self.izone.ravel()
+        for prefix, q in (('FROM_', qin), ('TO_', qout)):
+            q = np.ma.filled(q, 0.).ravel()
+            f = np.bincount(izone, weights=q)[zones]
+            fz = np.array([prefix + '_'.join(recname.split())] * len(tz))
+            self._update_budget_fromssst(fz, tz, np.abs(f).astype(
+                self.float_type), kstpkper, totim)
 
         return
 
@@ -1479,6 +1751,24 @@ class ZoneBudget(object):
         return newobj
 
 
+def _compute_budget_records(state, budget, filename, cbc_kwargs, times,
+                            indices):
+    """
+    Compute the zone budgets for part of the times in a separate process
+    and return the budget rows for those times.
+
+    """
+    zb = ZoneBudget.__new__(ZoneBudget)
+    zb.__dict__.update(state)
+    zb._budget = budget
+    zb.cbc = CellBudgetFile(filename, **cbc_kwargs)
+    try:
+        zb._compute_budget_records(times, indices)
+    finally:
+        zb.cbc.close()
+    return zb._budget
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric
@@ -1690,21 +1980,45 @@ def read_zbarray(fname):
 
 
 def sum_flux_tuples(fromzones, tozones, fluxes):
-    tup = zip(fromzones, tozones, fluxes)
-    sorted_tups = sort_tuple(tup)
-
-    # Group the sorted tuples by (from zone, to zone)
-    # itertools.groupby() returns the index (from zone, to zone) and
-    # a list of the tuples with that index
-    from_zones = []
-    to_zones = []
-    fluxes = []
-    for (fz, tz), ftup in groupby(sorted_tups, lambda tup: tup[:2]):
-        f = np.sum([tup[-1] for tup in list(ftup)])
-        from_zones.append(fz)
-        to_zones.append(tz)
-        fluxes.append(f)
-    return np.array(from_zones), np.array(to_zones), np.array(fluxes)
+    """
+    Sum the fluxes for each (from zone, to zone) pair.
+
+    Parameters
+    ----------
+    fromzones : ndarray
+        zone from which each flux is coming
+    tozones : ndarray
+        zone to which each flux is going
+    fluxes : ndarray
+        fluxes
+
+    Returns
+    -------
+    from_zones, to_zones, fluxes : ndarrays
+        the unique (from zone, to zone) pairs, sorted by from zone and
+        to zone, and the sum of the fluxes for each pair
+
+    """
+    fromzones = np.asarray(fromzones)
+    tozones = np.asarray(tozones)
+    fluxes = np.asarray(fluxes)
+    if fluxes.size == 0:
+        return np.array([]), np.array([]), np.array([])
+
+    # code each (from zone, to zone) pair as a single integer so that
+    # the fluxes can be summed with bincount
+    nzones = int(max(fromzones.max(), tozones.max())) + 1
+    codes = fromzones.astype(np.int64) * nzones + tozones
+    if nzones * nzones <= max(codes.size, 1048576):
+        # few zones, sum over all of the possible pairs
+        f = np.bincount(codes, weights=fluxes, minlength=nzones * nzones)
+        codes = np.flatnonzero(np.bincount(codes))
+        f = f[codes].astype(fluxes.dtype)
+    else:
+        codes, inverse = np.unique(codes, return_inverse=True)
+        f = np.bincount(inverse, weights=fluxes).astype(fluxes.dtype)
+    return (codes // nzones).astype(fromzones.dtype), \
+           (codes % nzones).astype(tozones.dtype), f
 
 
 def sort_tuple(tup, n=2):